@@ -1,11 +1,60 @@
 import os
 import json
+import asyncio
+import logging
 import streamlit as st
-from openai import OpenAI
-import re
+import rule_engine
+from analysis_cache import get_analysis_cache, make_analysis_key
+from cascade import record_escalation, should_escalate
+from llm_cache import LLM_CACHE_BYPASS, get_llm_cache, make_llm_cache_key
+from llm_client import get_llm_client, get_async_llm_client
+from prompt_budget import (PROMPT_INPUT_BUDGET, MIN_RESUME_TOKENS, compact_job_description,
+                           compaction_fingerprint, count_tokens, fit_resume)
+from stream_json import IncrementalJSONParser
+
+logger = logging.getLogger(__name__)
 
 # The newest OpenAI model is "gpt-4o" which was released May 13, 2024.
 # Do not change this unless explicitly requested by the user.
+LLM_MODEL = "gpt-4o"
+# Version of the analysis prompt; bump whenever build_analysis_messages() changes
+# so cached LLM responses to the old prompt are not reused
+PROMPT_TEMPLATE_VERSION = "2"
+# Upper bound on the generated analysis
+LLM_MAX_OUTPUT_TOKENS = int(os.environ.get("LLM_MAX_OUTPUT_TOKENS", 1500))
+# Stream background analyses so partial results can be shown while they generate
+LLM_STREAM = os.environ.get("LLM_STREAM", "1") == "1"
+
+ANALYSIS_SYSTEM_PROMPT = "당신은 전문적인 커리어 어드바이저이자 이력서 분석가입니다. 한국어로 응답하세요."
+ANALYSIS_PROMPT = """AI 커리어 어드바이저로서 {job_title} 직책에 대한 다음 이력서를 분석하세요.
+
+직무 설명:
+{job_description}
+
+직무 요구사항:
+{requirements_text}
+
+{qualification_text}
+핵심 역량 지표:
+{competency_metrics_text}
+
+지원자 이력서:
+{resume_text}
+
+다음 정보를 포함한 상세 분석을 JSON 형식으로 제공하세요:
+1. success_rate: 지원자가 직무 요구사항을 충족하는 정도를 나타내는 백분율(0-100)
+2. strengths: 직무와 잘 맞는 이력서의 강점 3-5개 목록
+3. improvement_areas: 지원자가 직무 요구사항을 더 잘 충족하기 위해 개선할 수 있는 영역 3-5개 목록
+4. recommendations: 지원자의 합격 가능성을 높이기 위한 구체적이고 실행 가능한 추천사항 3-5개 목록
+5. competency_ratings: 각 핵심 역량 지표에 대한 0-100 점수 평가. 각 역량별로 점수와 간략한 설명 포함
+6. qualification_ratings: 각 자격 요건에 대한 평가. 학력, 어학, 자격증, 경험, 스킬 각각에 대해 충족 여부 및 점수(0-100) 평가
+
+응답은 이 여섯 가지 키만 포함하는 유효한 JSON 객체여야 합니다.
+모든 분석 결과는 한국어로 작성해 주세요."""
+
+# 분석 방식: "rule" 규칙 기반 평가만, "llm" 항상 OpenAI API,
+# "cascade" 규칙 기반 평가 후 불확실한 경우만 OpenAI API (기준은 cascade.py)
+ANALYSIS_MODE = os.environ.get("ANALYSIS_MODE", "rule")
 
 
 def get_qualification_metrics(job_title):
@@ -107,9 +156,9 @@ def get_competency_metrics(job_title):
     return get_qualification_metrics(job_title)["competencies"]
 
 
-def analyze_resume(resume_text, job_title, job_description, job_requirements):
+def build_analysis_messages(resume_text, job_title, job_description, job_requirements):
     """
-    Analyze the resume against job requirements using OpenAI API
+    LLM 이력서 분석 요청에 사용할 메시지 목록을 구성합니다.
 
     Args:
         resume_text (str): Text content of the resume
@@ -118,119 +167,261 @@ def analyze_resume(resume_text, job_title, job_description, job_requirements):
         job_requirements (list): List of job requirements
 
     Returns:
-        dict: Analysis results including success rate, strengths, improvement areas, recommendations, and competency ratings
+        list: chat.completions의 messages 인자
     """
+    # Format job requirements as a string
+    requirements_text = "\n".join(
+        [req if req.lstrip().startswith("-") else f"- {req}" for req in job_requirements])
+
+    # 직무별 자격 요건 및 핵심 역량 지표 가져오기
+    qual_metrics = get_qualification_metrics(job_title)
+    competency_metrics = qual_metrics["competencies"]
+    qualification_metrics = qual_metrics.get("qualifications", {})
+
+    # 핵심 역량 지표 텍스트 구성
+    competency_metrics_text = "\n".join(
+        [f"- {key}: {value}" for key, value in competency_metrics.items()])
+
+    # 자격 요건 텍스트 구성
+    qualification_text = ""
+    if qualification_metrics:
+        qualification_text = "채용 자격 요건:\n"
+        for category, requirement in qualification_metrics.items():
+            if category == "academic":
+                qualification_text += f"- 학력: {requirement}\n"
+            elif category == "language":
+                qualification_text += f"- 어학: {requirement}\n"
+            elif category == "certificate":
+                qualification_text += f"- 자격증: {requirement}\n"
+            elif category == "experience":
+                qualification_text += f"- 경험: {requirement}\n"
+            elif category == "skills":
+                qualification_text += f"- 스킬: {requirement}\n"
+
+    # 직무 설명은 복리후생 등 분석과 무관한 블록을 빼고, 이력서는 남은 입력 토큰 예산에 맞춰 압축
+    compact_description = compact_job_description(job_description)
+    fixed_tokens = count_tokens(ANALYSIS_SYSTEM_PROMPT + ANALYSIS_PROMPT.format(
+        job_title=job_title, job_description=compact_description,
+        requirements_text=requirements_text, qualification_text=qualification_text,
+        competency_metrics_text=competency_metrics_text, resume_text=""))
+    compact_resume, report = fit_resume(
+        resume_text, max(MIN_RESUME_TOKENS, PROMPT_INPUT_BUDGET - fixed_tokens))
+
+    prompt = ANALYSIS_PROMPT.format(
+        job_title=job_title, job_description=compact_description,
+        requirements_text=requirements_text, qualification_text=qualification_text,
+        competency_metrics_text=competency_metrics_text, resume_text=compact_resume)
+
+    # Counting the uncompressed prompt is a full extra encode, so only for debug logging
+    if logger.isEnabledFor(logging.DEBUG):
+        raw_tokens = count_tokens(ANALYSIS_SYSTEM_PROMPT + ANALYSIS_PROMPT.format(
+            job_title=job_title, job_description=job_description,
+            requirements_text=requirements_text, qualification_text=qualification_text,
+            competency_metrics_text=competency_metrics_text, resume_text=resume_text))
+        prompt_tokens = count_tokens(ANALYSIS_SYSTEM_PROMPT + prompt)
+        logger.debug("프롬프트 압축: %d → %d 토큰 (%d 절약, 예산 %d, 제외 섹션 %s, 잘림 %s)",
+                     raw_tokens, prompt_tokens, raw_tokens - prompt_tokens, PROMPT_INPUT_BUDGET,
+                     report["dropped_sections"] or "없음", "예" if report["truncated"] else "아니오")
+
+    return [{
+        "role": "system",
+        "content": ANALYSIS_SYSTEM_PROMPT
+    }, {
+        "role": "user",
+        "content": prompt
+    }]
+
+
+def build_analysis_request(resume_text, job_title, job_description, job_requirements):
+    """
+    chat.completions 요청 인자 전체를 구성합니다 (대화형, 백그라운드, 배치 공통).
 
-    try:
-        # Get API key from environment variable
-        os.environ["OPENAI_API_KEY"] = st.secrets["API_KEY"]
-        api_key = os.environ.get("OPENAI_API_KEY")
+    Returns:
+        dict: chat.completions.create()에 전달할 인자
+    """
+    return {
+        "model": LLM_MODEL,
+        "messages": build_analysis_messages(resume_text, job_title, job_description,
+                                            job_requirements),
+        "response_format": {"type": "json_object"},
+        "max_tokens": LLM_MAX_OUTPUT_TOKENS,
+    }
+
+
+def parse_analysis_response(content):
+    """
+    LLM 응답 본문(JSON)을 분석 결과로 변환하고 필수 키를 채웁니다.
+
+    Args:
+        content (str): 응답 메시지 내용
+
+    Returns:
+        dict: 분석 결과
+    """
+    result = json.loads(content)
+
+    # Ensure all expected keys are present
+    required_keys = [
+        "success_rate", "strengths", "improvement_areas", "recommendations"
+    ]
+    for key in required_keys:
+        if key not in result:
+            result[key] = [] if key != "success_rate" else 0
+
+    return result
+
+
+def llm_cache_key(resume_text, job_title, job_description, job_requirements):
+    """LLM 응답 캐시 키 (모델, 프롬프트 버전, 입력 해시)"""
+    # the compacted prompt also depends on the token budget and section lexicon
+    template_version = f"{PROMPT_TEMPLATE_VERSION}.{compaction_fingerprint()}"
+    return make_llm_cache_key(LLM_MODEL, template_version, resume_text, job_title,
+                              job_description, job_requirements)
+
+
+def get_cached_llm_analysis(resume_text, job_title, job_description, job_requirements):
+    """
+    같은 모델과 프롬프트 버전으로 이전에 받은 LLM 분석 결과를 반환합니다.
+
+    Returns:
+        dict: 캐시된 분석 결과, 없거나 LLM_CACHE_BYPASS가 설정된 경우 None
+    """
+    if LLM_CACHE_BYPASS:
+        return None
+    return get_llm_cache().get(
+        llm_cache_key(resume_text, job_title, job_description, job_requirements))
+
+
+def get_rule_first_analysis(resume_text, job_title):
+    """
+    ANALYSIS_MODE에 따라 규칙 기반 평가를 먼저 수행하고 LLM 분석이 필요한지 판단합니다.
 
-        # 규칙 기반 평가를 사용할지 여부 결정 (규칙 기반 평가로 변경)
-        use_rule_based = True  # True이면 규칙 기반 평가, False이면 OpenAI API 사용
+    Args:
+        resume_text (str): 이력서 텍스트
+        job_title (str): 직무 제목
 
-        if use_rule_based:
-            return get_rule_based_analysis(resume_text, job_title)
+    Returns:
+        tuple: (규칙 기반 분석 결과, "llm" 모드에서는 None;
+                LLM 분석이 필요한지 여부)
+    """
+    if ANALYSIS_MODE == "llm":
+        return None, True
+    result = get_rule_based_analysis(resume_text, job_title)
+    if ANALYSIS_MODE != "cascade":
+        return result, False
+    return result, should_escalate(result, job_title)
 
-        if not api_key:
+
+def analyze_resume(resume_text, job_title, job_description, job_requirements,
+                   bypass_cache=False):
+    """
+    Analyze the resume against job requirements using OpenAI API
+
+    Args:
+        resume_text (str): Text content of the resume
+        job_title (str): The title of the job
+        job_description (str): The job description text
+        job_requirements (list): List of job requirements
+        bypass_cache (bool): True이면 캐시된 LLM 응답을 무시하고 새로 요청합니다
+            (새 결과는 캐시에 저장)
+
+    Returns:
+        dict: Analysis results including success rate, strengths, improvement areas, recommendations, and competency ratings
+    """
+
+    rule_result = None
+    try:
+        rule_result, needs_llm = get_rule_first_analysis(resume_text, job_title)
+        if not needs_llm:
+            return rule_result
+
+        # 프로세스 전체에서 공유하는 클라이언트 (연결 풀 재사용, 타임아웃/재시도 적용)
+        client = get_llm_client()
+        if client is None and rule_result is not None:
+            return rule_result
+        if client is None:
             st.warning(
                 "OpenAI API 키를 찾을 수 없습니다. 데모용 테스트 응답을 사용합니다. 전체 기능을 사용하려면 OPENAI_API_KEY 환경 변수를 설정하세요."
             )
             return get_test_analysis(job_title)
 
-        client = OpenAI(api_key=api_key)
-
-        # Format job requirements as a string
-        requirements_text = "\n".join([f"- {req}" for req in job_requirements])
-
-        # 직무별 자격 요건 및 핵심 역량 지표 가져오기
-        qual_metrics = get_qualification_metrics(job_title)
-        competency_metrics = qual_metrics["competencies"]
-        qualification_metrics = qual_metrics.get("qualifications", {})
-
-        # 핵심 역량 지표 텍스트 구성
-        competency_metrics_text = "\n".join(
-            [f"- {key}: {value}" for key, value in competency_metrics.items()])
-
-        # 자격 요건 텍스트 구성
-        qualification_text = ""
-        if qualification_metrics:
-            qualification_text = "채용 자격 요건:\n"
-            for category, requirement in qualification_metrics.items():
-                if category == "academic":
-                    qualification_text += f"- 학력: {requirement}\n"
-                elif category == "language":
-                    qualification_text += f"- 어학: {requirement}\n"
-                elif category == "certificate":
-                    qualification_text += f"- 자격증: {requirement}\n"
-                elif category == "experience":
-                    qualification_text += f"- 경험: {requirement}\n"
-                elif category == "skills":
-                    qualification_text += f"- 스킬: {requirement}\n"
-
-        prompt = f"""
-        AI 커리어 어드바이저로서 {job_title} 직책에 대한 다음 이력서를 분석하세요.
-
-        직무 설명:
-        {job_description}
-
-        직무 요구사항:
-        {requirements_text}
-
-        {qualification_text}
-
-        핵심 역량 지표:
-        {competency_metrics_text}
-
-        지원자 이력서:
-        {resume_text}
-
-        다음 정보를 포함한 상세 분석을 JSON 형식으로 제공하세요:
-        1. success_rate: 지원자가 직무 요구사항을 충족하는 정도를 나타내는 백분율(0-100)
-        2. strengths: 직무와 잘 맞는 이력서의 강점 3-5개 목록
-        3. improvement_areas: 지원자가 직무 요구사항을 더 잘 충족하기 위해 개선할 수 있는 영역 3-5개 목록
-        4. recommendations: 지원자의 합격 가능성을 높이기 위한 구체적이고 실행 가능한 추천사항 3-5개 목록
-        5. competency_ratings: 각 핵심 역량 지표에 대한 0-100 점수 평가. 각 역량별로 점수와 간략한 설명 포함
-        6. qualification_ratings: 각 자격 요건에 대한 평가. 학력, 어학, 자격증, 경험, 스킬 각각에 대해 충족 여부 및 점수(0-100) 평가
-
-        응답은 이 여섯 가지 키만 포함하는 유효한 JSON 객체여야 합니다.
-        모든 분석 결과는 한국어로 작성해 주세요.
-        """
-
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{
-                "role": "system",
-                "content": "당신은 전문적인 커리어 어드바이저이자 이력서 분석가입니다. 한국어로 응답하세요."
-            }, {
-                "role": "user",
-                "content": prompt
-            }],
-            response_format={"type": "json_object"},
-            max_tokens=1500)
-
-        result = json.loads(response.choices[0].message.content)
-
-        # Ensure all expected keys are present
-        required_keys = [
-            "success_rate", "strengths", "improvement_areas", "recommendations"
-        ]
-        for key in required_keys:
-            if key not in result:
-                result[key] = [] if key != "success_rate" else 0
-
+        # 같은 이력서/공고/프롬프트에 대한 응답은 캐시에서 바로 반환 (재시도, 재방문, 여러 채용 담당자)
+        if not bypass_cache:
+            cached = get_cached_llm_analysis(resume_text, job_title, job_description,
+                                             job_requirements)
+            if cached is not None:
+                return cached
+
+        if rule_result is not None:
+            record_escalation()
+        response = client.chat_completion(**build_analysis_request(
+            resume_text, job_title, job_description, job_requirements))
+
+        result = parse_analysis_response(response.choices[0].message.content)
+        get_llm_cache().put(
+            llm_cache_key(resume_text, job_title, job_description, job_requirements), result)
         return result
 
     except Exception as e:
+        if rule_result is not None:
+            # 캐스케이드 모드: LLM 분석에 실패하면 규칙 기반 결과를 사용
+            st.warning(f"AI 분석 중 오류가 발생해 규칙 기반 분석 결과를 표시합니다: {str(e)}")
+            return rule_result
         st.error(f"AI 분석 중 오류 발생: {str(e)}")
         return None
 
 
+async def analyze_resume_async(resume_text, job_title, job_description, job_requirements,
+                               api_key, on_event=None):
+    """
+    analyze_resume()의 LLM 경로를 asyncio로 실행합니다.
+
+    백그라운드 이벤트 루프(analysis_runner)에서 실행되므로 Streamlit을 호출하지
+    않고 오류를 그대로 발생시킵니다. 캐시 조회는 호출자가 제출 전에 수행하며,
+    받은 결과는 응답 캐시에 저장합니다.
+
+    LLM_STREAM이 켜져 있으면 응답을 스트리밍으로 받으며, success_rate와 각
+    strengths / improvement_areas / recommendations 항목이 완성되는 대로
+    on_event를 호출합니다 (stream_json.IncrementalJSONParser 이벤트).
+
+    Args:
+        resume_text (str): Text content of the resume
+        job_title (str): The title of the job
+        job_description (str): The job description text
+        job_requirements (list): List of job requirements
+        api_key (str): OpenAI API 키 (스크립트 스레드에서 읽은 값)
+        on_event (callable): on_event(kind, key, value) - 부분 결과 콜백 (선택)
+
+    Returns:
+        dict: 분석 결과
+    """
+    client = get_async_llm_client(api_key)
+    request = build_analysis_request(resume_text, job_title, job_description, job_requirements)
+    if LLM_STREAM:
+        parser = IncrementalJSONParser()
+        async for chunk in client.stream_chat_completion(**request):
+            for event in parser.feed(chunk):
+                if on_event is not None:
+                    on_event(*event)
+        content = parser.text
+    else:
+        response = await client.chat_completion(**request)
+        content = response.choices[0].message.content
+    result = parse_analysis_response(content)
+    await asyncio.to_thread(
+        get_llm_cache().put,
+        llm_cache_key(resume_text, job_title, job_description, job_requirements), result)
+    return result
+
+
 def get_rule_based_analysis(resume_text, job_title):
     """
     규칙 기반의 고정된 점수 평가 시스템을 사용하여 이력서를 분석합니다.
     특정 키워드와 패턴에 따라 일관된 점수를 부여합니다.
 
+    규칙은 data/lexicons/scoring_rules.json에 데이터로 정의되어 있으며,
+    rule_engine이 직무별로 컴파일한 규칙 묶음으로 한 번에 평가합니다.
+
     Args:
         resume_text (str): 이력서 텍스트
         job_title (str): 직무 제목
@@ -238,505 +429,34 @@ def get_rule_based_analysis(resume_text, job_title):
     Returns:
         dict: 분석 결과
     """
-    resume_lower = resume_text.lower()  # 대소문자 구분 없이 검색하기 위해 소문자로 변환
-
-    # 기본 결과 구조 설정
-    result = {
-        "success_rate": 0,
-        "strengths": [],
-        "improvement_areas": [],
-        "recommendations": [],
-        "competency_ratings": {},
-        "qualification_ratings": {
-            "academic": {"score": 0, "description": "", "meets_requirement": False},
-            "language": {"score": 0, "description": "", "meets_requirement": False},
-            "certificate": {"score": 0, "description": "", "meets_requirement": False},
-            "experience": {"score": 0, "description": "", "meets_requirement": False},
-            "skills": {"score": 0, "description": "", "meets_requirement": False}
-        }
-    }
-
-    # 1. 학력 평가
-    academic_score = 60  # 기본 점수
-    academic_description = "학력 정보가 충분하지 않습니다."
-    
-    # 대학교 등급별 점수 부여
-    top_universities = ["서울대", "연세대", "고려대", "카이스트"]
-    good_universities = ["성균관대", "한양대", "이화여대", "서강대", "중앙대", "경희대"]
-    
-    for univ in top_universities:
-        if univ in resume_text:
-            academic_score = 95
-            academic_description = f"{univ} 출신으로 최상위권 학력"
-            break
-    
-    if academic_score < 90:  # 최상위권이 아니라면 좋은 대학 체크
-        for univ in good_universities:
-            if univ in resume_text:
-                academic_score = 85
-                academic_description = f"{univ} 출신으로 우수한 학력"
-                break
-    
-    # 인서울 대학 키워드
-    if academic_score < 80 and ("인서울" in resume_text or "4년제" in resume_text):
-        academic_score = 75
-        academic_description = "인서울 4년제 대학 학력"
-    
-    # 학점 체크
-    gpa_patterns = [
-        r'학점[\s]*:[\s]*([0-9]+\.[0-9]+)',
-        r'GPA[\s]*:[\s]*([0-9]+\.[0-9]+)',
-        r'평점[\s]*:[\s]*([0-9]+\.[0-9]+)'
-    ]
-    
-    for pattern in gpa_patterns:
-        match = re.search(pattern, resume_text)
-        if match:
-            try:
-                gpa = float(match.group(1))
-                if gpa >= 4.0:
-                    academic_score += 10
-                    academic_description += ", 우수한 학점(4.0 이상)"
-                elif gpa >= 3.5:
-                    academic_score += 7
-                    academic_description += ", 양호한 학점(3.5 이상)"
-                elif gpa >= 3.0:
-                    academic_score += 5
-                    academic_description += ", 평균 이상 학점(3.0 이상)"
-            except:
-                pass
-            break
-    
-    # 전공 체크 (직무별)
-    if job_title == "IT 개발자":
-        relevant_majors = ["컴퓨터", "소프트웨어", "정보", "전산", "전자", "컴공"]
-        for major in relevant_majors:
-            if major in resume_text:
-                academic_score += 5
-                academic_description += f", {major} 관련 전공"
-                break
-    elif job_title == "인사 담당자":
-        relevant_majors = ["경영", "인사", "심리", "HR", "인적자원"]
-        for major in relevant_majors:
-            if major in resume_text:
-                academic_score += 5
-                academic_description += f", {major} 관련 전공"
-                break
-    
-    # 최종 학력 점수 조정 (최대 100점)
-    academic_score = min(100, academic_score)
-    
-    # 2. 어학 능력 평가
-    language_score = 50  # 기본 점수
-    language_description = "어학 능력 정보가 충분하지 않습니다."
-    
-    # 토익 점수 체크
-    toeic_patterns = [
-        r'토익[\s]*:[\s]*([0-9]+)',
-        r'TOEIC[\s]*:[\s]*([0-9]+)',
-        r'토익[\s]*([0-9]+)점'
-    ]
-    
-    for pattern in toeic_patterns:
-        match = re.search(pattern, resume_text)
-        if match:
-            try:
-                toeic = int(match.group(1))
-                if toeic >= 900:
-                    language_score = 95
-                    language_description = f"토익 {toeic}점으로 매우 우수"
-                elif toeic >= 850:
-                    language_score = 90
-                    language_description = f"토익 {toeic}점으로 우수"
-                elif toeic >= 800:
-                    language_score = 85
-                    language_description = f"토익 {toeic}점으로 상위권"
-                elif toeic >= 750:
-                    language_score = 80
-                    language_description = f"토익 {toeic}점으로 양호"
-                elif toeic >= 700:
-                    language_score = 75
-                    language_description = f"토익 {toeic}점으로 평균 이상"
-                elif toeic >= 650:
-                    language_score = 70
-                    language_description = f"토익 {toeic}점으로 보통"
-                elif toeic >= 600:
-                    language_score = 65
-                    language_description = f"토익 {toeic}점으로 기본 수준"
-                else:
-                    language_score = 60
-                    language_description = f"토익 {toeic}점으로 기초 수준"
-            except:
-                pass
-            break
-    
-    # 3. 자격증 평가
-    certificate_score = 60  # 기본 점수
-    certificate_description = "관련 자격증 정보가 충분하지 않습니다."
-    
-    # 직무별 관련 자격증
-    if job_title == "IT 개발자":
-        relevant_certs = ["정보처리기사", "SQLD", "AWS", "Azure", "Google", "리눅스마스터", 
-                          "네트워크", "보안", "정보보안", "CCNA", "클라우드"]
-        cert_count = 0
-        found_certs = []
-        
-        for cert in relevant_certs:
-            if cert in resume_text:
-                cert_count += 1
-                found_certs.append(cert)
-        
-        if cert_count > 0:
-            certificate_score = 60 + (cert_count * 10)
-            certificate_description = f"{', '.join(found_certs)} 자격증 보유"
-            
-    elif job_title == "인사 담당자":
-        relevant_certs = ["공인노무사", "인사관리사", "경영지도사", "CS", "사내강사", "NLP", "코칭"]
-        cert_count = 0
-        found_certs = []
-        
-        for cert in relevant_certs:
-            if cert in resume_text:
-                cert_count += 1
-                found_certs.append(cert)
-        
-        if cert_count > 0:
-            certificate_score = 60 + (cert_count * 10)
-            certificate_description = f"{', '.join(found_certs)} 자격증 보유"
-    
-    # 최종 자격증 점수 조정 (최대 100점)
-    certificate_score = min(100, certificate_score)
-    
-    # 4. 경험 평가
-    experience_score = 60  # 기본 점수
-    experience_description = "관련 경험 정보가 충분하지 않습니다."
-    
-    # 인턴 경험 체크
-    if "인턴" in resume_text:
-        experience_score += 10
-        experience_description = "인턴 경험 보유"
-    
-    # 프로젝트 경험 체크
-    if "프로젝트" in resume_text:
-        experience_score += 10
-        experience_description += ", 프로젝트 경험 보유"
-    
-    # 경력 연차 체크
-    year_patterns = [
-        r'([0-9]+)년차',
-        r'([0-9]+)[\s]*년[\s]*경력',
-        r'경력[\s]*:[\s]*([0-9]+)[\s]*년'
-    ]
-    
-    for pattern in year_patterns:
-        match = re.search(pattern, resume_text)
-        if match:
-            try:
-                years = int(match.group(1))
-                if years >= 5:
-                    experience_score += 25
-                    experience_description += f", {years}년 경력으로 경험 풍부"
-                elif years >= 3:
-                    experience_score += 20
-                    experience_description += f", {years}년 경력으로 경험 우수"
-                elif years >= 1:
-                    experience_score += 15
-                    experience_description += f", {years}년 경력"
-            except:
-                pass
-            break
-    
-    # 최종 경험 점수 조정 (최대 100점)
-    experience_score = min(100, experience_score)
-    
-    # 5. 스킬 평가
-    skills_score = 60  # 기본 점수
-    skills_description = "관련 스킬 정보가 충분하지 않습니다."
-    
-    # 직무별 관련 스킬
-    if job_title == "IT 개발자":
-        tech_skills = ["Java", "Python", "JavaScript", "React", "Node.js", "Spring", 
-                      "SQL", "AWS", "Git", "Docker", "kubernetes", "C#", "TypeScript"]
-        skill_count = 0
-        found_skills = []
-        
-        for skill in tech_skills:
-            if skill.lower() in resume_lower:
-                skill_count += 1
-                found_skills.append(skill)
-        
-        if skill_count > 0:
-            skills_score = 60 + (skill_count * 5)
-            skills_description = f"{', '.join(found_skills)} 스킬 보유"
-            
-    elif job_title == "인사 담당자":
-        hr_skills = ["인사관리", "채용", "교육", "평가", "급여", "복리후생", "노무", "조직문화", 
-                    "HR", "성과관리", "인재개발", "엑셀", "PowerPoint", "Word"]
-        skill_count = 0
-        found_skills = []
-        
-        for skill in hr_skills:
-            if skill.lower() in resume_lower:
-                skill_count += 1
-                found_skills.append(skill)
-        
-        if skill_count > 0:
-            skills_score = 60 + (skill_count * 5)
-            skills_description = f"{', '.join(found_skills)} 스킬 보유"
-    
-    # 최종 스킬 점수 조정 (최대 100점)
-    skills_score = min(100, skills_score)
-    
-    # 자격 요건 점수 설정
-    result["qualification_ratings"]["academic"] = {
-        "score": academic_score,
-        "description": academic_description,
-        "meets_requirement": academic_score >= 70
-    }
-    
-    result["qualification_ratings"]["language"] = {
-        "score": language_score,
-        "description": language_description,
-        "meets_requirement": language_score >= 70
-    }
-    
-    result["qualification_ratings"]["certificate"] = {
-        "score": certificate_score,
-        "description": certificate_description,
-        "meets_requirement": certificate_score >= 70
-    }
-    
-    result["qualification_ratings"]["experience"] = {
-        "score": experience_score,
-        "description": experience_description,
-        "meets_requirement": experience_score >= 70
-    }
-    
-    result["qualification_ratings"]["skills"] = {
-        "score": skills_score,
-        "description": skills_description,
-        "meets_requirement": skills_score >= 70
-    }
-    
-    # 역량 평가 - 직무별 설정
-    if job_title == "IT 개발자":
-        result["competency_ratings"] = {
-            "technical_skills": {
-                "score": skills_score,
-                "description": "기술적 역량: " + skills_description
-            },
-            "problem_solving": {
-                "score": max(65, min(90, skills_score - 5)),
-                "description": "문제 해결 능력: 프로젝트 경험에서 문제 해결 역량 확인"
-            },
-            "system_design": {
-                "score": max(60, min(85, skills_score - 10)),
-                "description": "시스템 설계 능력: 기본적인 시스템 설계 역량 보유"
-            },
-            "code_quality": {
-                "score": max(65, min(90, skills_score - 5)),
-                "description": "코드 품질: 코드 작성 및 품질 관리 역량 확인"
-            },
-            "teamwork": {
-                "score": 75,
-                "description": "팀 협업 능력: 프로젝트 및 업무 경험에서 협업 역량 확인"
-            },
-            "continuous_learning": {
-                "score": max(70, certificate_score),
-                "description": "지속적 학습 능력: 자격증 및 새로운 기술 습득 노력 확인"
-            }
-        }
-    elif job_title == "인사 담당자":
-        result["competency_ratings"] = {
-            "hr_knowledge": {
-                "score": max(skills_score, certificate_score),
-                "description": "인사 지식: 관련 지식 및 자격증 보유"
-            },
-            "recruitment": {
-                "score": skills_score if "채용" in resume_text else 65,
-                "description": "채용 역량: 채용 관련 경험 및 지식 보유"
-            },
-            "employee_relations": {
-                "score": 70,
-                "description": "직원 관계 관리: 조직 내 인간관계 및 관리 역량"
-            },
-            "organizational_development": {
-                "score": 70,
-                "description": "조직 개발 능력: 조직문화 및 개발 역량"
-            },
-            "communication": {
-                "score": 75,
-                "description": "커뮤니케이션 능력: 의사소통 및 협업 역량"
-            },
-            "data_analysis": {
-                "score": 65,
-                "description": "데이터 분석 능력: 기본적인 데이터 분석 역량"
-            }
-        }
-    else:
-        # 다른 직무에 대한 기본 역량 평가
-        result["competency_ratings"] = {
-            "job_knowledge": {
-                "score": max(skills_score, certificate_score),
-                "description": "직무 지식: 관련 지식 및 자격증 보유"
-            },
-            "communication": {
-                "score": 75,
-                "description": "커뮤니케이션 능력: 의사소통 및 협업 역량"
-            },
-            "problem_solving": {
-                "score": 70,
-                "description": "문제 해결 능력: 업무 경험에서의 문제 해결 역량"
-            },
-            "adaptability": {
-                "score": 75,
-                "description": "적응력: 새로운 환경 및 변화에 적응하는 역량"
-            },
-            "teamwork": {
-                "score": 75,
-                "description": "팀워크: 조직 내 협업 및 팀 프로젝트 역량"
-            }
-        }
-    
-    # 강점, 개선사항, 추천사항 설정 (직무별 분기)
-    if job_title == "IT 개발자":
-        # 강점
-        if skills_score >= 80:
-            result["strengths"].append("다양한 기술 스택에 대한 이해와 활용 능력이 우수함")
-        if certificate_score >= 75:
-            result["strengths"].append("관련 자격증 보유로 전문성을 입증함")
-        if academic_score >= 80:
-            result["strengths"].append("관련 전공과 우수한 학업 성취도를 보여줌")
-        if experience_score >= 75:
-            result["strengths"].append("실무 경험을 통한 실전 역량을 갖추고 있음")
-        if "프로젝트" in resume_text:
-            result["strengths"].append("다양한 프로젝트 경험을 보유하고 있음")
-        
-        # 개선사항
-        if skills_score < 75:
-            result["improvement_areas"].append("최신 기술 스택에 대한 경험 강화 필요")
-        if "테스트" not in resume_lower and "tdd" not in resume_lower:
-            result["improvement_areas"].append("테스트 방법론에 대한 경험 부족")
-        if certificate_score < 70:
-            result["improvement_areas"].append("관련 자격증 추가 취득으로 전문성 강화 필요")
-        if "sql" not in resume_lower and "데이터베이스" not in resume_lower:
-            result["improvement_areas"].append("데이터베이스 관련 기술 역량 보강 필요")
-        if "git" not in resume_lower:
-            result["improvement_areas"].append("버전 관리 시스템 경험 강조 필요")
-        
-        # 추천사항
-        if skills_score < 80:
-            result["recommendations"].append("최신 개발 트렌드에 맞는 기술 스택 학습 및 프로젝트 경험 추가")
-        if certificate_score < 75:
-            result["recommendations"].append("직무 관련 자격증 취득으로 전문성 강화")
-        if "테스트" not in resume_lower:
-            result["recommendations"].append("TDD 등 테스트 방법론 학습 및 프로젝트 적용 경험 추가")
-        if experience_score < 75:
-            result["recommendations"].append("오픈소스 프로젝트 참여 또는 포트폴리오 강화")
-        result["recommendations"].append("프로젝트 경험에서 문제 해결 과정을 구체적으로 기술하여 문제 해결 능력 강조")
-    
-    elif job_title == "인사 담당자":
-        # 강점
-        if skills_score >= 80:
-            result["strengths"].append("인사 관련 다양한 업무 영역에 대한 이해도가 높음")
-        if certificate_score >= 75:
-            result["strengths"].append("관련 자격증 보유로 전문성을 입증함")
-        if academic_score >= 80:
-            result["strengths"].append("관련 전공과 우수한 학업 성취도를 보여줌")
-        if experience_score >= 75:
-            result["strengths"].append("인사 분야 실무 경험을 통한 실전 역량 보유")
-        if "채용" in resume_text:
-            result["strengths"].append("채용 프로세스에 대한 이해 및 경험이 있음")
-        
-        # 개선사항
-        if skills_score < 75:
-            result["improvement_areas"].append("인사 관리 전반에 대한 경험 강화 필요")
-        if "노무" not in resume_lower and "법규" not in resume_lower:
-            result["improvement_areas"].append("노동법 및 인사 법규에 대한 지식 보강 필요")
-        if certificate_score < 70:
-            result["improvement_areas"].append("관련 자격증 추가 취득으로 전문성 강화 필요")
-        if "데이터" not in resume_lower and "분석" not in resume_lower:
-            result["improvement_areas"].append("데이터 기반 의사결정 역량 강화 필요")
-        if "조직문화" not in resume_lower:
-            result["improvement_areas"].append("조직문화 개선 관련 경험 부족")
-        
-        # 추천사항
-        if skills_score < 80:
-            result["recommendations"].append("인사 관리 다양한 영역(채용, 교육, 평가, 보상 등) 경험 확대")
-        if certificate_score < 75:
-            result["recommendations"].append("인사 관리사 또는 노무 관련 자격증 취득 고려")
-        if "노무" not in resume_lower:
-            result["recommendations"].append("노동법 및 인사 관련 법규 이해도 강화")
-        if "데이터" not in resume_lower:
-            result["recommendations"].append("데이터 분석 도구 활용 및 인사 지표 관리 경험 추가")
-        result["recommendations"].append("인사 제도 개선이나 조직문화 활동 경험을 구체적으로 기술")
-    
-    else:
-        # 다른 직무에 대한 기본 강점/개선사항/추천사항
-        result["strengths"] = [
-            "직무 관련 기본 지식과 역량 보유",
-            "학업 및 경험을 통한 역량 개발",
-            "기본적인 커뮤니케이션 능력 보유"
-        ]
-        
-        result["improvement_areas"] = [
-            "직무 특화 역량 강화 필요",
-            "관련 자격증 및 전문성 강화 필요",
-            "실무 경험 추가 필요"
-        ]
-        
-        result["recommendations"] = [
-            "직무 관련 실무 경험 확대",
-            "관련 자격증 취득으로 전문성 강화",
-            "직무 특화 기술 및 역량 개발",
-            "커뮤니케이션 및 협업 능력 강조"
-        ]
-    
-    # 최종 성공률 계산 (자격 요건 점수 평균)
-    qualification_scores = [
-        result["qualification_ratings"]["academic"]["score"],
-        result["qualification_ratings"]["language"]["score"],
-        result["qualification_ratings"]["certificate"]["score"],
-        result["qualification_ratings"]["experience"]["score"],
-        result["qualification_ratings"]["skills"]["score"]
-    ]
-    
-    result["success_rate"] = int(sum(qualification_scores) / len(qualification_scores))
-    
-    # 결과에 충분한 항목이 없는 경우 보완
-    while len(result["strengths"]) < 3:
-        if "직무에 대한 관심과 열정을 보여줌" not in result["strengths"]:
-            result["strengths"].append("직무에 대한 관심과 열정을 보여줌")
-        elif "기본적인 직무 역량 보유" not in result["strengths"]:
-            result["strengths"].append("기본적인 직무 역량 보유")
-        elif "학습 의지와 발전 가능성을 갖춤" not in result["strengths"]:
-            result["strengths"].append("학습 의지와 발전 가능성을 갖춤")
-        else:
-            result["strengths"].append("커뮤니케이션 및 협업 능력 보유")
-    
-    while len(result["improvement_areas"]) < 3:
-        if "실무 경험 강화 필요" not in result["improvement_areas"]:
-            result["improvement_areas"].append("실무 경험 강화 필요")
-        elif "전문성 및 자격증 보강 필요" not in result["improvement_areas"]:
-            result["improvement_areas"].append("전문성 및 자격증 보강 필요")
-        elif "직무 관련 기술 역량 향상 필요" not in result["improvement_areas"]:
-            result["improvement_areas"].append("직무 관련 기술 역량 향상 필요")
-        else:
-            result["improvement_areas"].append("문제 해결 능력 강화 필요")
-    
-    while len(result["recommendations"]) < 3:
-        if "실무 중심 포트폴리오 구성" not in result["recommendations"]:
-            result["recommendations"].append("실무 중심 포트폴리오 구성")
-        elif "직무 관련 교육 및 자격증 취득" not in result["recommendations"]:
-            result["recommendations"].append("직무 관련 교육 및 자격증 취득")
-        elif "직무 역량 강화를 위한 프로젝트 참여" not in result["recommendations"]:
-            result["recommendations"].append("직무 역량 강화를 위한 프로젝트 참여")
-        else:
-            result["recommendations"].append("이력서에 성과와 결과 중심의 경험 기술")
-    
+    # 결과는 (텍스트 해시, 직무, 규칙 테이블 버전)으로 메모이즈되며 규칙이 바뀌면 자동으로 무효화됩니다
+    rules_version = rule_engine.rule_table_fingerprint()
+    cache = get_analysis_cache()
+    key = make_analysis_key(resume_text, job_title, rules_version)
+    result = cache.get(key, rules_version)
+    if result is None:
+        result = rule_engine.evaluate(resume_text, job_title)
+        cache.put(key, result, rules_version)
     return result
 
 
+def analyze_resumes_batch(texts, job_title):
+    """
+    여러 이력서를 한 번에 규칙 기반으로 평가합니다.
+
+    점수는 지원자별 dict 대신 열(column) 단위 NumPy 배열로 반환되며,
+    지원자별 분석 결과 dict는 필요할 때 record(i)/records()로 만듭니다.
+
+    Args:
+        texts (list): 이력서 텍스트 목록
+        job_title (str): 직무 제목
+
+    Returns:
+        rule_engine.BatchScores: success_rate, 자격 요건/역량 점수 배열 등
+    """
+    return rule_engine.evaluate_batch(texts, job_title)
+
+
 def get_test_analysis(job_title):
     """
     API 키가 없을 때 직무에 맞는 테스트 분석 결과를 반환합니다.
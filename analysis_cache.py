@@ -0,0 +1,115 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# In-process LRU size, in entries
+ANALYSIS_MEMORY_ENTRIES = int(os.environ.get("ANALYSIS_MEMORY_ENTRIES", 1024))
+
+
+def make_analysis_key(resume_text, job_title, rules_version):
+    """
+    Build the memoization key of one rule-based analysis.
+
+    Args:
+        resume_text (str): 이력서 텍스트
+        job_title (str): 직무 제목
+        rules_version (str): Fingerprint of the rule tables (rule_engine.rule_table_fingerprint)
+
+    Returns:
+        str: Cache key
+    """
+    digest = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    return f"{rules_version}:{job_title}:{digest}"
+
+
+class AnalysisCache:
+    """
+    In-process LRU memoization of rule-based analysis results.
+
+    There is no disk tier: rule_engine.evaluate() takes a fraction of a
+    millisecond, while a SQLite lookup alone costs several, so a shared
+    database would make every cache miss and most hits slower than
+    recomputing. Results are stored as JSON, so every hit returns a fresh
+    dict the caller may modify.
+
+    Keys carry the rule-table version. When a lookup sees a new version the
+    cache is dropped, so results never outlive the rules that produced them.
+    """
+
+    def __init__(self, memory_entries=ANALYSIS_MEMORY_ENTRIES):
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def _check_version(self, rules_version):
+        """Drop everything produced under other rule versions once a new one shows up"""
+        if rules_version == self._version:
+            return
+        with self._lock:
+            if rules_version == self._version:
+                return
+            self._counts["invalidations"] += len(self._memory)
+            self._memory.clear()
+            self._version = rules_version
+
+    def get(self, key, rules_version):
+        """Return the cached result for ``key``, or None on a miss"""
+        self._check_version(rules_version)
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is None:
+                self._counts["misses"] += 1
+                return None
+            self._memory.move_to_end(key)
+            self._counts["hits"] += 1
+        return json.loads(payload)
+
+    def put(self, key, result, rules_version):
+        """Store ``result``, evicting the least recently used entries beyond memory_entries"""
+        self._check_version(rules_version)
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def stats(self):
+        """
+        Return hit statistics of this process's cache, for sizing ANALYSIS_MEMORY_ENTRIES.
+
+        Returns:
+            dict: {"hits", "misses", "evictions", "invalidations", "entries",
+                   "capacity", "rules_version", "hit_rate"}
+        """
+        with self._lock:
+            stats = dict(self._counts, entries=len(self._memory),
+                         capacity=self.memory_entries, rules_version=self._version)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            self._counts = dict.fromkeys(self._counts, 0)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Return the process-wide analysis cache instance"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnalysisCache()
+    return _cache
@@ -0,0 +1,156 @@
+import os
+import time
+import asyncio
+import threading
+
+import streamlit as st
+
+import ai_analysis
+from cascade import record_escalation
+from llm_client import get_api_key
+
+# Seconds between status checks of a pending analysis on the detail page
+ANALYSIS_POLL_INTERVAL = float(os.environ.get("ANALYSIS_POLL_INTERVAL", 1.0))
+
+
+class AnalysisHandle:
+    """
+    Handle to one resume analysis, returned as soon as it is submitted.
+
+    LLM analyses run on the shared background event loop; the handle wraps
+    their future and collects the pieces of a streamed response as they
+    arrive (see partial()). Analyses that finish on the spot (rule-based
+    scoring, the demo response without an API key) are wrapped already
+    completed. rule_based tells whether the result is the rule engine's, which
+    the live editor (live_scoring.LiveScorer) can re-score. In cascade mode a
+    failed LLM analysis falls back to the rule-based result it escalated.
+    """
+
+    def __init__(self, future=None, result=None, rule_based=False, fallback=None):
+        self._future = future
+        self._result = result
+        self._fallback = fallback
+        self.rule_based = rule_based
+        self._partial = dict(result or {})
+        self._partial_lock = threading.Lock()
+        self.submitted_at = time.time()
+
+    @classmethod
+    def completed(cls, result, rule_based=False):
+        return cls(result=result, rule_based=rule_based)
+
+    def done(self):
+        return self._future is None or self._future.done()
+
+    def record_event(self, kind, key, value):
+        """Collect one stream_json.IncrementalJSONParser event (called on the event loop)"""
+        with self._partial_lock:
+            if kind == "item":
+                self._partial.setdefault(key, []).append(value)
+            else:
+                self._partial[key] = value
+
+    def partial(self):
+        """
+        지금까지 도착한 분석 결과 일부를 반환합니다 (스트리밍 중 점진적 표시용).
+
+        Returns:
+            dict: 완성된 키와 목록 항목만 담은 분석 결과 사본
+        """
+        with self._partial_lock:
+            return {key: list(value) if isinstance(value, list) else value
+                    for key, value in self._partial.items()}
+
+    def elapsed(self):
+        """Seconds since submission"""
+        return time.time() - self.submitted_at
+
+    def result(self):
+        """
+        완료된 분석 결과를 반환합니다. analyze_resume()과 마찬가지로 실패하면
+        오류를 표시하고 None을 반환합니다 (캐스케이드 모드에서는 규칙 기반 결과).
+        스크립트 스레드에서 호출해야 합니다.
+
+        Returns:
+            dict: 분석 결과, 진행 중이거나 실패한 경우 None
+        """
+        if self._future is None:
+            return self._result
+        if not self._future.done():
+            return None
+        try:
+            return self._future.result()
+        except Exception as e:
+            if self._fallback is not None:
+                st.warning(f"AI 분석 중 오류가 발생해 규칙 기반 분석 결과를 표시합니다: {str(e)}")
+                self.rule_based = True
+                return self._fallback
+            st.error(f"AI 분석 중 오류 발생: {str(e)}")
+            return None
+
+    def cancel(self):
+        """Cancel the request if it is still pending"""
+        if self._future is not None:
+            self._future.cancel()
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """The process-wide event loop running LLM analyses, started on first use"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="analysis-runner",
+                                 daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def submit_analysis(resume_text, job_title, job_description, job_requirements,
+                    bypass_cache=False):
+    """
+    이력서 분석을 시작하고 바로 핸들을 반환합니다.
+
+    LLM 분석은 모든 세션이 공유하는 백그라운드 asyncio 루프에서 실행되며,
+    동시 요청 수는 AsyncLLMClient의 제한(LLM_MAX_CONCURRENCY)을 따릅니다.
+    규칙 기반 평가(캐스케이드 모드에서 확신할 수 있는 경우 포함), API 키가
+    없을 때의 대체 결과와 LLM 응답 캐시 적중은 즉시 완료됩니다.
+
+    Args:
+        resume_text (str): 이력서 텍스트
+        job_title (str): 직무 제목
+        job_description (str): 직무 설명
+        job_requirements (list): 직무 요구사항 목록
+        bypass_cache (bool): True이면 캐시된 LLM 응답을 무시하고 새로 요청합니다
+
+    Returns:
+        AnalysisHandle: 분석 핸들
+    """
+    rule_result, needs_llm = ai_analysis.get_rule_first_analysis(resume_text, job_title)
+    if not needs_llm:
+        return AnalysisHandle.completed(rule_result, rule_based=True)
+    api_key = get_api_key()
+    if not api_key:
+        # 캐스케이드는 규칙 기반 결과를, "llm" 모드는 데모 응답을 사용
+        if rule_result is not None:
+            return AnalysisHandle.completed(rule_result, rule_based=True)
+        return AnalysisHandle.completed(ai_analysis.analyze_resume(
+            resume_text, job_title, job_description, job_requirements))
+    if not bypass_cache:
+        cached = ai_analysis.get_cached_llm_analysis(
+            resume_text, job_title, job_description, job_requirements)
+        if cached is not None:
+            return AnalysisHandle.completed(cached)
+    handle = AnalysisHandle(fallback=rule_result)
+    if rule_result is not None:
+        record_escalation()
+    coroutine = ai_analysis.analyze_resume_async(
+        resume_text, job_title, job_description, job_requirements, api_key,
+        on_event=handle.record_event)
+    handle._future = asyncio.run_coroutine_threadsafe(coroutine, _get_loop())
+    return handle
@@ -1,10 +1,9 @@
 import streamlit as st
-import os
-import tempfile
 import time
-from utils import display_job_description, validate_file, extract_text_from_file
+from utils import display_job_description, ingest_upload
 from job_data import get_job_details
-from ai_analysis import analyze_resume
+from analysis_runner import submit_analysis, ANALYSIS_POLL_INTERVAL
+from live_scoring import LiveScorer
 from styles import set_page_styling, display_custom_css
 
 # Set page configuration - MUST be the first Streamlit command
@@ -29,6 +28,14 @@ if 'resume_text' not in st.session_state:
     st.session_state.resume_text = None
 if 'analysis_result' not in st.session_state:
     st.session_state.analysis_result = None
+if 'analysis_handle' not in st.session_state:
+    st.session_state.analysis_handle = None
+if 'analysis_rule_based' not in st.session_state:
+    st.session_state.analysis_rule_based = False
+if 'live_scorer' not in st.session_state:
+    st.session_state.live_scorer = None
+if 'results_revealed' not in st.session_state:
+    st.session_state.results_revealed = False
 
 # Check for job_id in query params for detailed view
 query_params = st.query_params
@@ -54,6 +61,12 @@ if job_id_from_query and st.session_state.job_id != job_id_from_query:
     st.session_state.resume_processed = False
     st.session_state.resume_text = None
     st.session_state.analysis_result = None
+    st.session_state.analysis_rule_based = False
+    if st.session_state.analysis_handle is not None:
+        st.session_state.analysis_handle.cancel()
+    st.session_state.analysis_handle = None
+    st.session_state.live_scorer = None
+    st.session_state.results_revealed = False
 
 # Get current job_id from session state
 job_id = st.session_state.job_id
@@ -72,6 +85,12 @@ if not st.session_state.job_id:
     st.session_state.resume_processed = False
     st.session_state.resume_text = None
     st.session_state.analysis_result = None
+    st.session_state.analysis_rule_based = False
+    if st.session_state.analysis_handle is not None:
+        st.session_state.analysis_handle.cancel()
+    st.session_state.analysis_handle = None
+    st.session_state.live_scorer = None
+    st.session_state.results_revealed = False
     # Page title with icon
     st.markdown(
         '<div class="main-title"><span class="icon">💼</span> 무한상사 채용 플랫폼</div>',
@@ -279,18 +298,10 @@ else:
 
     if uploaded_file and not st.session_state.resume_processed:
         with st.spinner("이력서 처리 및 분석 중..."): # Combined spinner message
-            is_valid, file_type = validate_file(uploaded_file)
-
-            if is_valid:
-                # Save uploaded file to temp location
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
-                    temp_file_path = tmp_file.name
-
-                # Extract text
-                resume_text = extract_text_from_file(temp_file_path, file_type)
-                os.unlink(temp_file_path) # Remove temp file
+            # Validate and extract in one in-memory pass (no temp file, single parse)
+            file_type, resume_text = ingest_upload(uploaded_file)
 
+            if file_type:
                 if resume_text:
                     st.session_state.resume_text = resume_text
                     # Get job requirements
@@ -298,15 +309,27 @@ else:
                     job_description = job_details["description"]
                     job_title = job_details["title"]
 
-                    # Analyze resume
-                    analysis_result = analyze_resume(
+                    # Analyze resume: LLM 분석은 백그라운드에서 진행되고 아래에서 완료 여부를 확인
+                    handle = submit_analysis(
                         resume_text, job_title, job_description,
                         job_requirements)
 
-                    st.session_state.analysis_result = analysis_result
+                    st.session_state.analysis_rule_based = handle.rule_based
+                    if handle.done():
+                        st.session_state.analysis_result = handle.result()
+                        st.session_state.analysis_handle = None
+                    else:
+                        st.session_state.analysis_result = None
+                        st.session_state.analysis_handle = handle
                     st.session_state.resume_processed = True
+                    # A new resume starts a fresh live editor
+                    st.session_state.live_scorer = None
+                    st.session_state.pop(f"resume_editor_{st.session_state.job_id}", None)
                     st.session_state.show_login = True # Show login popup AFTER processing
-                    st.success("이력서 분석 완료! 마케팅 활용에 동의해주세요.")
+                    if handle.done():
+                        st.success("이력서 분석 완료! 마케팅 활용에 동의해주세요.")
+                    else:
+                        st.success("이력서 업로드 완료! 분석이 진행되는 동안 마케팅 활용에 동의해주세요.")
                     time.sleep(1) # Short delay before rerun
                     st.rerun()
                 else:
@@ -316,6 +339,47 @@ else:
                 st.error("유효한 PDF 파일을 업로드해 주세요.")
                 st.session_state.resume_processed = False # Reset flag on error
 
+    # 백그라운드 분석 진행 확인: 진행 중에는 fragment만 주기적으로 다시 실행하고,
+    # 완료되면 한 번만 전체 재실행해 결과를 반영
+    @st.fragment(run_every=ANALYSIS_POLL_INTERVAL)
+    def poll_analysis():
+        handle = st.session_state.analysis_handle
+        if handle is None:
+            return
+        if handle.done():
+            st.rerun()
+        if not st.session_state.login_success:
+            st.caption(f"🔄 AI 분석 진행 중... ({handle.elapsed():.0f}초)")
+            return
+        # 스트리밍 응답에서 완성된 항목부터 바로 표시
+        partial = handle.partial()
+        st.markdown("## 분석 결과")
+        if "success_rate" in partial:
+            st.markdown(
+                f'<div class="success-rate">예상 합격률: <span class="rate-value">{partial["success_rate"]}%</span></div>',
+                unsafe_allow_html=True)
+        for key, title, marker in (("strengths", "#### 강점", "✓"),
+                                   ("improvement_areas", "#### 개선 영역", "△")):
+            if partial.get(key):
+                st.markdown(title, unsafe_allow_html=True)
+                for item in partial[key]:
+                    st.markdown(f'<div class="analysis-item">{marker} {item}</div>', unsafe_allow_html=True)
+        if partial.get("recommendations"):
+            st.markdown("### 맞춤형 추천사항")
+            for i, recommendation in enumerate(partial["recommendations"], 1):
+                st.markdown(
+                    f'<div class="recommendation-item">{i}. {recommendation}</div>',
+                    unsafe_allow_html=True)
+        st.caption(f"🔄 AI 분석 진행 중... ({handle.elapsed():.0f}초) · 완성된 항목부터 표시됩니다")
+
+    handle = st.session_state.analysis_handle
+    if handle is not None and handle.done():
+        st.session_state.analysis_result = handle.result()
+        st.session_state.analysis_rule_based = handle.rule_based
+        st.session_state.analysis_handle = None
+    elif handle is not None and not st.session_state.login_success:
+        poll_analysis()
+
     # --- Marketing Consent Popup Logic (Using st.dialog) ---
     dialog_result = None
     if st.session_state.show_login and not st.session_state.login_success:
@@ -364,10 +428,32 @@ else:
             <p>이제 합격률 분석 결과를 확인할 수 있습니다.</p>
         </div>
         """, unsafe_allow_html=True)
-        time.sleep(2) # Show message briefly before showing results
+        if not st.session_state.results_revealed:
+            time.sleep(2) # Show message briefly before showing results (first time only, not on every edit)
+            st.session_state.results_revealed = True
 
         # Now display the analysis results if processing was done
         if st.session_state.resume_processed and st.session_state.analysis_result:
+            # 이력서 실시간 편집: 수정한 부분에 걸린 규칙만 다시 평가해 아래 결과에 바로 반영
+            # (규칙 기반 결과일 때만 - LLM 분석 결과를 규칙 기반 점수로 덮어쓰지 않도록)
+            if st.session_state.analysis_rule_based:
+                editor_key = f"resume_editor_{job_id}"
+                if editor_key not in st.session_state:
+                    st.session_state[editor_key] = st.session_state.resume_text
+                with st.expander("✏️ 이력서를 수정하며 합격률 변화 확인하기"):
+                    edited_text = st.text_area(
+                        "이력서 텍스트 (수정 후 Ctrl+Enter 또는 바깥을 클릭하면 바로 다시 평가됩니다)",
+                        key=editor_key, height=300)
+                    scorer = st.session_state.live_scorer
+                    if edited_text != st.session_state.resume_text or scorer is not None:
+                        if scorer is None:
+                            scorer = st.session_state.live_scorer = LiveScorer(job_details["title"])
+                            scorer.update(st.session_state.resume_text)
+                        st.session_state.analysis_result = scorer.update(edited_text)
+                        st.session_state.resume_text = edited_text
+                        st.caption(f"재평가 {scorer.last_update_ms:.1f}ms · "
+                                   f"다시 계산된 자격 요건 {len(scorer.reevaluated)}개")
+
             analysis_result = st.session_state.analysis_result
             st.markdown('<div class="analysis-results">', unsafe_allow_html=True)
             st.markdown("## 분석 결과")
@@ -813,6 +899,8 @@ else:
                 st.markdown(href, unsafe_allow_html=True)
 
             st.markdown('</div>', unsafe_allow_html=True)
+        elif st.session_state.analysis_handle is not None:
+            poll_analysis()
         elif st.session_state.resume_processed and not st.session_state.analysis_result:
              st.error("분석 결과가 없습니다. 이력서를 다시 업로드해주세요.")
 
@@ -0,0 +1,135 @@
+"""
+Throughput and text fidelity of every PDF extraction backend, per document class.
+
+Usage:
+    python benchmarks/bench_backends.py [--corpus DIR] [--repeat 3] [--write]
+
+--corpus points at a directory of PDFs, each with a ground-truth .txt next to
+it (same stem, one expected line per line); use real Korean resumes here to
+measure Hangul fidelity. Without it a synthetic text-heavy and table-heavy
+corpus is generated. --write stores the fastest adequate backend per class in
+extract_backends.BACKEND_SELECTION_PATH, which "auto" mode then uses.
+"""
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import PyPDF2  # noqa: E402
+
+import extract_backends  # noqa: E402
+from fixtures import make_pdf, make_table_pdf, table_pages, text_pages  # noqa: E402
+
+# A backend is adequate for a class when it recovers this share of expected lines
+ADEQUATE_LINE_RECALL = 0.95
+
+_SPACES = re.compile(r"\s+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def _normalize(text):
+    return _SPACES.sub(" ", text).strip()
+
+
+def _synthetic_corpus():
+    yield "synthetic-text.pdf", make_pdf(10), [line for page in text_pages(10) for line in page]
+    yield "synthetic-table.pdf", make_table_pdf(5), [
+        " ".join(row) for page in table_pages(5) for row in page]
+
+
+def _directory_corpus(directory):
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith(".pdf"):
+            continue
+        truth_path = os.path.join(directory, os.path.splitext(name)[0] + ".txt")
+        if not os.path.exists(truth_path):
+            print(f"skip {name}: no ground truth")
+            continue
+        with open(os.path.join(directory, name), "rb") as f:
+            data = f.read()
+        with open(truth_path, encoding="utf-8") as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        yield name, data, lines
+
+
+def fidelity(extracted, expected_lines):
+    """
+    Returns:
+        tuple: (line recall: share of expected lines found verbatim in reading order
+        up to whitespace, Hangul recall: share of expected Hangul characters
+        extracted, or None if the ground truth has none)
+    """
+    normalized = _normalize(extracted)
+    line_recall = sum(1 for line in expected_lines if _normalize(line) in normalized)
+    line_recall /= max(1, len(expected_lines))
+
+    expected_hangul = Counter(_HANGUL.findall("".join(expected_lines)))
+    if not expected_hangul:
+        return line_recall, None
+    found = Counter(_HANGUL.findall(extracted))
+    hangul_recall = sum(min(count, found[char]) for char, count in expected_hangul.items())
+    return line_recall, hangul_recall / sum(expected_hangul.values())
+
+
+def _run(backend, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        start = time.perf_counter()
+        text = extract_backends.PAGE_SEPARATOR.join(
+            backend.iter_page_texts(reader, len(reader.pages), parallel=False))
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(reader.pages), text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--write", action="store_true")
+    args = parser.parse_args()
+
+    corpus = _directory_corpus(args.corpus) if args.corpus else _synthetic_corpus()
+    backends = extract_backends.available_backends()
+    # class -> backend -> [total seconds, total pages, line recalls]
+    totals = {}
+
+    print(f"{'document':<24} {'class':<6} {'backend':<11} {'pages/s':>8} {'lines':>6} {'hangul':>7}")
+    for name, data, expected in corpus:
+        doc_class = extract_backends.classify_document(PyPDF2.PdfReader(io.BytesIO(data)))
+        for backend_name in backends:
+            seconds, pages, text = _run(extract_backends.get_backend(backend_name), data, args.repeat)
+            line_recall, hangul_recall = fidelity(text, expected)
+            stats = totals.setdefault(doc_class, {}).setdefault(backend_name, [0.0, 0, []])
+            stats[0] += seconds
+            stats[1] += pages
+            stats[2].append(line_recall)
+            hangul = "-" if hangul_recall is None else f"{hangul_recall:.2f}"
+            print(f"{name:<24} {doc_class:<6} {backend_name:<11} {pages / seconds:>8.1f} "
+                  f"{line_recall:>6.2f} {hangul:>7}")
+
+    selection = {}
+    for doc_class, by_backend in totals.items():
+        scored = {name: (pages / seconds, sum(recalls) / len(recalls))
+                  for name, (seconds, pages, recalls) in by_backend.items()}
+        adequate = [name for name, (_, recall) in scored.items() if recall >= ADEQUATE_LINE_RECALL]
+        if adequate:
+            selection[doc_class] = max(adequate, key=lambda name: scored[name][0])
+        else:
+            selection[doc_class] = max(scored, key=lambda name: scored[name][1])
+    print(f"selection: {selection}")
+
+    if args.write:
+        with open(extract_backends.BACKEND_SELECTION_PATH, "w", encoding="utf-8") as f:
+            json.dump(selection, f, ensure_ascii=False, indent=2)
+        print(f"wrote {extract_backends.BACKEND_SELECTION_PATH}")
+
+
+if __name__ == "__main__":
+    main()
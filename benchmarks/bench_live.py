@@ -0,0 +1,89 @@
+"""
+Incremental re-scoring (live_scoring.LiveScorer) vs. full rule evaluation on random edits.
+
+Usage:
+    python benchmarks/bench_live.py [--resumes 30] [--edits 150] [--lines 20]
+
+Every resume is edited --edits times per job with a random insert, delete or
+replacement: single characters, newlines, whole keywords of the job's rules
+or their halves, and scores, dates and GPAs. After each edit the LiveScorer
+result is compared with rule_engine.evaluate() on the full text; the run
+fails if any result differs. The defaults make 18,000 edits.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import rule_engine  # noqa: E402
+from fixtures import KOREAN_RESUME_LINES, make_resume_texts  # noqa: E402
+from live_scoring import LiveScorer  # noqa: E402
+
+JOBS = ["IT 개발자", "인사 담당자", "재무/회계 담당자", "영업 담당자"]
+SNIPPETS = [" ", "\n", "a", "가", "1", "0", ".", "/", "-", "년", "TOEIC 900", "GPA 3.9",
+            "2019년 - 2023년", "4.5"]
+
+
+def _edit(rnd, text, pieces):
+    """Apply one random insert, delete or replacement"""
+    start = rnd.randint(0, len(text))
+    end = min(len(text), start + rnd.choice((0, 1, 1, 2, 5, 20)))
+    piece = rnd.choice(pieces)
+    if piece and rnd.random() < 0.3:
+        piece = piece[:rnd.randint(1, len(piece))]
+    kind = rnd.random()
+    if kind < 0.4:
+        return text[:start] + piece + text[start:]
+    if kind < 0.7:
+        return text[:start] + text[end:]
+    return text[:start] + piece + text[end:]
+
+
+def _percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=30)
+    parser.add_argument("--edits", type=int, default=150)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    texts = make_resume_texts(args.resumes, args.lines, seed=args.seed)
+    mismatches = edits = 0
+    live_ms, full_ms = [], []
+    for job in JOBS:
+        pack = rule_engine.get_rule_pack(job)
+        pieces = SNIPPETS + KOREAN_RESUME_LINES + [keyword for keyword, _, _ in pack.lookups]
+        for text in texts:
+            scorer = LiveScorer(job)
+            scorer.update(text)
+            for _ in range(args.edits):
+                text = _edit(rnd, text, pieces)
+                start = time.perf_counter()
+                actual = scorer.update(text)
+                live_ms.append((time.perf_counter() - start) * 1000)
+                start = time.perf_counter()
+                expected = rule_engine.evaluate(text, job)
+                full_ms.append((time.perf_counter() - start) * 1000)
+                edits += 1
+                mismatches += (json.dumps(actual, ensure_ascii=False)
+                               != json.dumps(expected, ensure_ascii=False))
+
+    print(f"{'implementation':<16}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, timings in (("live scorer", live_ms), ("full evaluate", full_ms)):
+        print(f"{name:<16}{_percentile(timings, 0.5):>10.4f}{_percentile(timings, 0.99):>10.4f}")
+    print(f"edits: {edits}, mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Throughput, latency and retry behaviour of the LLM client against the local stand-in.
+
+Usage:
+    python benchmarks/bench_llm.py [--requests 200] [--concurrency 1 4 8 16]
+        [--latency lognormal:0.8,0.4] [--rate-429 0.05] [--rate-500 0.02]
+        [--retry-after 0.5] [--max-inflight 0] [--stream]
+
+Every run starts llm_standin.StandInServer in-process and sends analysis
+requests for synthetic resumes through AsyncLLMClient from --concurrency
+workers, with the client's semaphore set to the same value. The table shows
+requests/s, latency percentiles (time to first chunk with --stream), client
+retries and failures, and what the server saw: injected 429/500s, peak
+concurrent requests and connections opened.
+The run fails if any successful response is not valid analysis JSON.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import openai  # noqa: E402
+
+from ai_analysis import build_analysis_request, parse_analysis_response  # noqa: E402
+from fixtures import make_resume_texts  # noqa: E402
+from job_data import get_job_details  # noqa: E402
+from llm_client import AsyncLLMClient  # noqa: E402
+from llm_standin import ANALYSIS_KEYS, StandInServer  # noqa: E402
+
+
+def _percentile(values, share):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+async def _one(client, request, stream):
+    """(latency, time to first chunk, content) of one analysis request"""
+    start = time.perf_counter()
+    if not stream:
+        response = await client.chat_completion(**request)
+        latency = time.perf_counter() - start
+        return latency, latency, response.choices[0].message.content
+    first = None
+    parts = []
+    async for chunk in client.stream_chat_completion(**request):
+        if first is None:
+            first = time.perf_counter() - start
+        parts.append(chunk)
+    return time.perf_counter() - start, first, "".join(parts)
+
+
+async def _run(base_url, requests, concurrency, args):
+    """Closed loop: ``concurrency`` workers each send their share of requests back to back"""
+    client = AsyncLLMClient("standin", base_url=base_url, max_concurrency=concurrency,
+                            backoff_base=args.backoff_base)
+    outcomes = [None] * len(requests)
+
+    async def worker(offset):
+        for index in range(offset, len(requests), concurrency):
+            try:
+                outcomes[index] = await _one(client, requests[index], args.stream)
+            except openai.OpenAIError as error:
+                outcomes[index] = error
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(offset) for offset in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    stats = client.stats()
+    await client.close()
+    return elapsed, outcomes, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--job", default="it-개발자")
+    parser.add_argument("--latency", default="lognormal:0.8,0.4")
+    parser.add_argument("--rate-429", type=float, default=0.05)
+    parser.add_argument("--rate-500", type=float, default=0.02)
+    parser.add_argument("--retry-after", type=float)
+    parser.add_argument("--max-inflight", type=int, default=0)
+    parser.add_argument("--chunk-delay", type=float, default=0.01)
+    parser.add_argument("--backoff-base", type=float, default=0.5)
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    job = get_job_details(args.job)
+    requests = [build_analysis_request(text, job["title"], job["description"],
+                                       job["requirements"])
+                for text in make_resume_texts(args.requests, seed=args.seed)]
+    server = StandInServer(latency=args.latency, rate_429=args.rate_429,
+                           rate_500=args.rate_500, retry_after=args.retry_after,
+                           max_inflight=args.max_inflight, chunk_delay=args.chunk_delay,
+                           seed=args.seed)
+    base_url = server.start()
+    logging.getLogger("llm_client").setLevel(logging.ERROR)  # per-retry log lines
+
+    latency_label = "ttft" if args.stream else "latency"
+    print(f"{'concurrency':>11}{'req/s':>8}{latency_label + ' p50':>13}{'p95':>7}"
+          f"{'retries':>9}{'failed':>8}{'429s':>6}{'500s':>6}{'peak':>6}{'conns':>7}")
+    invalid = 0
+    for concurrency in args.concurrency:
+        server.reset_stats()
+        elapsed, outcomes, stats = asyncio.run(_run(base_url, requests, concurrency, args))
+        succeeded = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        for _, _, content in succeeded:
+            result = parse_analysis_response(content)
+            invalid += set(result) != set(ANALYSIS_KEYS)
+        failed = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        timings = [first if args.stream else latency for latency, first, _ in succeeded]
+        server_stats = server.stats()
+        print(f"{concurrency:>11}{len(succeeded) / elapsed:>8.1f}"
+              f"{_percentile(timings, 0.5) * 1000:>11.0f}ms{_percentile(timings, 0.95):>6.2f}s"
+              f"{stats['retries']:>9}{len(failed):>8}{server_stats['rate_limited']:>6}"
+              f"{server_stats['server_errors']:>6}{server_stats['peak_in_flight']:>6}"
+              f"{server_stats['connections']:>7}")
+    server.shutdown()
+    server.server_close()
+    print(f"invalid responses: {invalid}")
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Serial vs. process-pool PDF extraction, to locate the page-count crossover.
+
+Usage:
+    python benchmarks/bench_pdf_parallel.py [--pages 5 10 20 40 80 160] [--repeat 3]
+
+The smallest page count at which the parallel path wins is a good value for
+pdf_parallel.PARALLEL_PAGE_THRESHOLD on the host the benchmark ran on.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import PyPDF2  # noqa: E402
+
+import pdf_parallel  # noqa: E402
+from fixtures import make_pdf  # noqa: E402
+
+
+def _serial(data):
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def _parallel(data):
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+    return pdf_parallel.extract_pages_parallel(data, page_count)
+
+
+def _best_of(func, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 10, 20, 40, 80, 160])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"workers={pdf_parallel.MAX_WORKERS} cpus={os.cpu_count()}")
+    _parallel(make_pdf(2))  # warm up the pool so process start-up is not measured
+
+    crossover = None
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    for pages in args.pages:
+        data = make_pdf(pages)
+        assert _serial(data) == _parallel(data)
+        serial = _best_of(_serial, data, args.repeat)
+        parallel = _best_of(_parallel, data, args.repeat)
+        if crossover is None and parallel < serial:
+            crossover = pages
+        print(f"{pages:>6} {serial * 1000:>10.1f} {parallel * 1000:>12.1f} {serial / parallel:>7.2f}x")
+
+    print(f"crossover: {crossover if crossover else 'not reached'} pages "
+          f"(PARALLEL_PAGE_THRESHOLD={pdf_parallel.PARALLEL_PAGE_THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
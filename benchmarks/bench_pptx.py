@@ -0,0 +1,63 @@
+"""
+Streaming slide-XML extraction vs. the python-pptx Presentation object model.
+
+Usage:
+    python benchmarks/bench_pptx.py [--slides 10 50 100] [--image-mb 2] [--repeat 3]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pptx import Presentation  # noqa: E402
+
+import pptx_extract  # noqa: E402
+from fixtures import make_pptx  # noqa: E402
+
+
+def _presentation(data):
+    """The previous extractor: top-level shape.text only"""
+    text = ""
+    for slide in Presentation(io.BytesIO(data)).slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text"):
+                text += shape.text + "\n"
+    return text
+
+
+def _streaming(data):
+    return "".join(pptx_extract.iter_slide_texts(pptx_extract.open_pptx(io.BytesIO(data))))
+
+
+def _best_of(func, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slides", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--image-mb", type=float, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'slides':>6} {'file MB':>8} {'pptx ms':>9} {'chars':>7} "
+          f"{'stream ms':>10} {'chars':>7} {'speedup':>8}")
+    for slides in args.slides:
+        data = make_pptx(slides, int(args.image_mb * 1024 * 1024))
+        baseline, baseline_chars = _best_of(_presentation, data, args.repeat)
+        streaming, streaming_chars = _best_of(_streaming, data, args.repeat)
+        print(f"{slides:>6} {len(data) / 1024 / 1024:>8.1f} {baseline * 1000:>9.1f} "
+              f"{baseline_chars:>7} {streaming * 1000:>10.1f} {streaming_chars:>7} "
+              f"{baseline / streaming:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
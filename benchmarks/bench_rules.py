@@ -0,0 +1,95 @@
+"""
+Compiled rule engine vs. the previous if/elif cascade for rule-based scoring,
+and per-resume vs. vectorized batch scoring.
+
+Usage:
+    python benchmarks/bench_rules.py [--resumes 500] [--lines 20] [--repeat 3]
+
+All implementations score the same synthetic Korean resumes for every job;
+the run fails if any result differs.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import rule_engine  # noqa: E402
+from fixtures import make_resume_texts  # noqa: E402
+from legacy_rules import legacy_rule_based_analysis  # noqa: E402
+from resume_index import get_resume_index  # noqa: E402
+
+JOBS = ["IT 개발자", "인사 담당자", "재무/회계 담당자", "영업 담당자"]
+
+
+def _time(analyze, texts, repeat, warm=False):
+    """
+    Best per-resume time in ms for scoring every job. Cold runs include
+    building the resume's index; warm runs build it first and time the rules alone.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        get_resume_index.cache_clear()
+        elapsed = 0.0
+        for text in texts:
+            if warm:
+                get_resume_index(text)
+            start = time.perf_counter()
+            for job in JOBS:
+                analyze(text, job)
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed)
+    return best / (len(texts) * len(JOBS)) * 1000
+
+
+def _time_batch(texts, repeat):
+    """Best per-resume time in ms for evaluate_batch (columns only, no dicts)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for job in JOBS:
+            rule_engine.evaluate_batch(texts, job)
+        best = min(best, time.perf_counter() - start)
+    return best / (len(texts) * len(JOBS)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = make_resume_texts(args.resumes, args.lines)
+    for job in JOBS:
+        rule_engine.get_rule_pack(job)  # compile outside the timed runs
+
+    mismatches = 0
+    for text in texts:
+        for job in JOBS:
+            expected = json.dumps(legacy_rule_based_analysis(text, job), ensure_ascii=False)
+            actual = json.dumps(rule_engine.evaluate(text, job), ensure_ascii=False)
+            mismatches += expected != actual
+    for job in JOBS:
+        batch = rule_engine.evaluate_batch(texts, job)
+        for row, text in enumerate(texts):
+            expected = json.dumps(rule_engine.evaluate(text, job), ensure_ascii=False)
+            mismatches += expected != json.dumps(batch.record(row), ensure_ascii=False)
+
+    print(f"{'implementation':<16}{'cold ms':>10}{'warm ms':>10}")
+    timings = {}
+    for name, analyze in (("legacy cascade", legacy_rule_based_analysis),
+                          ("rule engine", rule_engine.evaluate)):
+        timings[name] = [_time(analyze, texts, args.repeat, warm) for warm in (False, True)]
+        print(f"{name:<16}{timings[name][0]:>10.4f}{timings[name][1]:>10.4f}")
+    batch_ms = _time_batch(texts, args.repeat)
+    print(f"{'batch (columns)':<16}{batch_ms:>10.4f}")
+    speedups = [old / new for old, new in zip(timings["legacy cascade"], timings["rule engine"])]
+    print(f"speedup: {speedups[0]:.2f}x cold, {speedups[1]:.2f}x warm, mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Keyword translation (utils.translate_university_names) vs. the original str.replace chain.
+
+Usage:
+    python benchmarks/bench_translate.py [--kb 16] [--repeat 20]
+
+Times one translation pass over a mostly-English and a mostly-Korean resume
+of about --kb kilobytes, against the chain of str.replace calls it replaced
+(one call per lexicon term). The chain also expands terms inside longer terms
+and words ("AI" in "PAID"), so only timings are compared, not output.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import lexicons  # noqa: E402
+import utils  # noqa: E402
+from fixtures import KOREAN_RESUME_LINES, RESUME_LINES  # noqa: E402
+
+
+def _replace_chain(text, terms):
+    for english, korean in terms:
+        text = text.replace(english, f"{english} {korean}")
+    return text
+
+
+def _resume(lines, kb, seed=0):
+    rnd = random.Random(seed)
+    parts, size = [], 0
+    while size < kb * 1024:
+        parts.append(rnd.choice(lines))
+        size += len(parts[-1].encode()) + 1
+    return "\n".join(parts)
+
+
+def _best_of(func, text, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kb", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    store = lexicons.get_store()
+    terms = [item for name in utils.TRANSLATION_LEXICONS
+             for item in store.get(name).entries.items()]
+    utils.translate_university_names("KAIST")  # build the matcher outside the timed runs
+
+    print(f"{'resume':<10}{'chain ms':>10}{'translate ms':>14}{'speedup':>9}")
+    for name, lines in (("english", RESUME_LINES), ("korean", KOREAN_RESUME_LINES)):
+        text = _resume(lines, args.kb)
+        chain = _best_of(lambda t: _replace_chain(t, terms), text, args.repeat)
+        single = _best_of(utils.translate_university_names, text, args.repeat)
+        print(f"{name:<10}{chain * 1000:>10.2f}{single * 1000:>14.2f}{chain / single:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Synthetic documents for the extraction benchmarks (no extra dependencies)."""
+import random
+
+RESUME_LINES = [
+    "Seoul National University, Bachelor of Science in Computer Science",
+    "GPA: 3.8 / 4.5, TOEIC: 870",
+    "Internship: Backend Development, 6 months (Python, Django, SQL, Git)",
+    "Project: Machine Learning pipeline for Data Analysis on AWS",
+    "Skills: Java, JavaScript, React, TypeScript, Docker, Kubernetes",
+    "Certificates: SQLD, AWS Solutions Architect",
+]
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _assemble_pdf(page_streams):
+    """Wrap raw content streams (one per page) into a minimal Helvetica PDF"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for stream in page_streams:
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_id, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % obj_id + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_at)
+    return bytes(out)
+
+
+def text_pages(pages, lines_per_page=45):
+    """Ground-truth lines for make_pdf: one list of lines per page"""
+    return [[f"p{page_num + 1} " + RESUME_LINES[(page_num + line_num) % len(RESUME_LINES)]
+             for line_num in range(lines_per_page)]
+            for page_num in range(pages)]
+
+
+def make_pdf(pages, lines_per_page=45):
+    """
+    Build a text-native PDF with the given number of pages.
+
+    Args:
+        pages (int): Number of pages
+        lines_per_page (int): Text lines drawn on each page
+
+    Returns:
+        bytes: PDF file contents
+    """
+    streams = []
+    for lines in text_pages(pages, lines_per_page):
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"]
+        ops.extend(f"({_escape(line)}) Tj T*" for line in lines)
+        ops.append("ET")
+        streams.append("\n".join(ops).encode("latin-1"))
+    return _assemble_pdf(streams)
+
+
+def table_pages(pages, rows=30, cols=3):
+    """Ground-truth cells for make_table_pdf: one list of rows per page"""
+    words = " ".join(RESUME_LINES).replace(",", "").split()
+    return [[[f"{words[(page_num + row * cols + col) % len(words)]}{row}"
+              for col in range(cols)] for row in range(rows)]
+            for page_num in range(pages)]
+
+
+def make_table_pdf(pages, rows=30, cols=3):
+    """
+    Build a table-heavy PDF: every page is a ruled grid with one word per cell.
+
+    Args:
+        pages (int): Number of pages
+        rows (int): Table rows per page
+        cols (int): Table columns
+
+    Returns:
+        bytes: PDF file contents
+    """
+    cell_w, cell_h, left, top = 160, 24, 50, 800
+    streams = []
+    for table in table_pages(pages, rows, cols):
+        ops = ["0.5 w"]
+        for row, cells in enumerate(table):
+            for col, cell in enumerate(cells):
+                x, y = left + col * cell_w, top - (row + 1) * cell_h
+                ops.append(f"{x} {y} {cell_w} {cell_h} re S")
+                ops.append(f"BT /F1 10 Tf {x + 6} {y + 8} Td ({_escape(cell)}) Tj ET")
+        streams.append("\n".join(ops).encode("latin-1"))
+    return _assemble_pdf(streams)
+
+
+def make_pptx(slides, image_bytes=0):
+    """
+    Build a portfolio-like deck with groups, tables, notes and embedded images.
+
+    Requires python-pptx and Pillow.
+
+    Args:
+        slides (int): Number of slides
+        image_bytes (int): Approximate size of the incompressible image embedded
+            on every slide (0 for none)
+
+    Returns:
+        bytes: .pptx file contents
+    """
+    import io
+    import os
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    image = None
+    if image_bytes:
+        side = max(1, int((image_bytes / 3) ** 0.5))
+        buffer = io.BytesIO()
+        Image.frombytes("RGB", (side, side), os.urandom(side * side * 3)).save(buffer, "PNG")
+        image = buffer.getvalue()
+
+    prs = Presentation()
+    layout = prs.slide_layouts[5]  # title only
+    for slide_num in range(slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Project {slide_num + 1}: {RESUME_LINES[slide_num % len(RESUME_LINES)]}"
+        group = slide.shapes.add_group_shape()
+        box = group.shapes.add_textbox(Inches(1), Inches(2), Inches(4), Inches(1))
+        box.text_frame.text = "Grouped: " + RESUME_LINES[(slide_num + 1) % len(RESUME_LINES)]
+        table = slide.shapes.add_table(2, 2, Inches(5), Inches(2), Inches(4), Inches(1)).table
+        for row in range(2):
+            for col in range(2):
+                table.cell(row, col).text = f"cell {row}{col} Python SQL Git"
+        slide.notes_slide.notes_text_frame.text = f"Speaker notes for slide {slide_num + 1}"
+        if image:
+            slide.shapes.add_picture(io.BytesIO(image + bytes([slide_num % 256])),
+                                     Inches(1), Inches(4), Inches(3))
+    out = io.BytesIO()
+    prs.save(out)
+    return out.getvalue()
+
+
+KOREAN_RESUME_LINES = [
+    "학력: 서울대학교 컴퓨터공학과 졸업 (학점: 3.8)",
+    "연세대 경영학과 복수전공, GPA: 4.1",
+    "어학: TOEIC: 870, 토익 905점",
+    "경력: 3년 (백엔드 개발), 5년차 인사 담당",
+    "인턴: 네이버 HR팀 채용 및 교육 담당",
+    "프로젝트: Python, Django, SQL, Git 기반 데이터 분석 플랫폼 구축",
+    "기술: Java, JavaScript, React, TypeScript, Docker, Kubernetes, AWS",
+    "자격증: 정보처리기사, SQLD, 인사관리사, 공인노무사",
+    "조직문화 개선 TF 참여, 노무 법규 교육 이수, 성과관리 제도 설계",
+    "테스트 자동화(TDD) 도입 및 데이터베이스 튜닝 경험",
+    "동아리 회장으로 리더십 발휘, 봉사활동 200시간",
+    "자기소개: 문제를 끝까지 파고드는 개발자가 되고 싶습니다.",
+]
+
+
+def make_resume_texts(count, lines=20, seed=0):
+    """
+    Build Korean resume texts with a random mix of rule-relevant lines.
+
+    Args:
+        count (int): Number of resumes
+        lines (int): Lines per resume
+        seed (int): Random seed, so runs are comparable
+
+    Returns:
+        list: Resume texts (all distinct)
+    """
+    rnd = random.Random(seed)
+    return [f"이력서 {num}\n" + "\n".join(rnd.choice(KOREAN_RESUME_LINES) for _ in range(lines))
+            for num in range(count)]
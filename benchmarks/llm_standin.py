@@ -0,0 +1,457 @@
+"""
+Local OpenAI-compatible stand-in server for load-testing the LLM path offline.
+
+Usage:
+    python benchmarks/llm_standin.py [--port 8000] [--latency lognormal:1.5,0.4]
+        [--rate-429 0.05] [--rate-500 0.02] [--retry-after 1] [--max-inflight 16]
+        [--chunk-delay 0.02] [--batch-delay 5] [--seed 0]
+
+Point the app, llm_batch.py or a benchmark at it:
+    OPENAI_BASE_URL=http://127.0.0.1:8000/v1 OPENAI_API_KEY=standin ANALYSIS_MODE=llm streamlit run app.py
+
+POST /v1/chat/completions answers with the rule-based analysis of the resume
+and job in the analysis prompt (ai_analysis.get_rule_based_analysis), so every
+response is valid analysis JSON whose scores follow the input. Plain and
+streamed (SSE) responses are supported. /v1/files and /v1/batches implement
+enough of the Batch API for llm_batch.py.
+
+Latency specs: "0.5" or "fixed:0.5", "uniform:LOW,HIGH", "normal:MEAN,SD",
+"lognormal:MEDIAN,SIGMA", "exp:MEAN" (seconds). For streamed responses the
+sample is the time to the first chunk, followed by --chunk-delay per chunk.
+Requests fail with 429 (with Retry-After when --retry-after is set) or 500 at
+the given rates, and with 429 whenever more than --max-inflight are running.
+GET /stats returns the server's counters; POST /stats/reset clears them.
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from ai_analysis import ANALYSIS_PROMPT, get_rule_based_analysis  # noqa: E402
+from prompt_budget import count_tokens  # noqa: E402
+
+# Members of the analysis JSON the prompt asks for
+ANALYSIS_KEYS = ("success_rate", "strengths", "improvement_areas", "recommendations",
+                 "competency_ratings", "qualification_ratings")
+
+
+def parse_latency(spec):
+    """
+    Parse a latency spec into a sampler.
+
+    Args:
+        spec (str): "0.5", "fixed:S", "uniform:LOW,HIGH", "normal:MEAN,SD",
+            "lognormal:MEDIAN,SIGMA" or "exp:MEAN"
+
+    Returns:
+        callable: sampler(rng) -> 지연 시간(초)
+
+    Raises:
+        ValueError: 알 수 없는 분포이거나 인자가 잘못된 경우
+    """
+    kind, _, params = spec.partition(":")
+    if not params:
+        kind, params = "fixed", kind
+    try:
+        values = [float(value) for value in params.split(",")]
+    except ValueError:
+        raise ValueError(f"invalid latency spec: {spec!r}") from None
+    samplers = {
+        ("fixed", 1): lambda rng: values[0],
+        ("uniform", 2): lambda rng: rng.uniform(values[0], values[1]),
+        ("normal", 2): lambda rng: max(0.0, rng.gauss(values[0], values[1])),
+        ("lognormal", 2): lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+        ("exp", 1): lambda rng: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0,
+    }
+    sampler = samplers.get((kind, len(values)))
+    if sampler is None or min(values) < 0:
+        raise ValueError(f"invalid latency spec: {spec!r}")
+    return sampler
+
+
+def _prompt_pattern():
+    """Regex recovering job_title and resume_text from an ANALYSIS_PROMPT message"""
+    groups = {"job_title": "(?P<job_title>.*?)", "resume_text": "(?P<resume_text>.*)"}
+    parts = re.split(r"\{(\w+)\}", ANALYSIS_PROMPT)
+    pattern = "".join(re.escape(part) if i % 2 == 0 else groups.get(part, ".*?")
+                      for i, part in enumerate(parts))
+    return re.compile(pattern, re.S)
+
+
+_PROMPT = _prompt_pattern()
+
+
+def analysis_content(messages):
+    """
+    Analysis JSON answering an analysis prompt.
+
+    Messages that are not an ANALYSIS_PROMPT are scored as a resume on their
+    own, so ad-hoc requests still get a schema-valid answer.
+
+    Returns:
+        str: JSON 응답 본문
+    """
+    prompt = next((message["content"] for message in reversed(messages)
+                   if message.get("role") == "user"), "")
+    match = _PROMPT.fullmatch(prompt)
+    if match:
+        result = get_rule_based_analysis(match["resume_text"], match["job_title"])
+    else:
+        result = get_rule_based_analysis(prompt, "")
+    return json.dumps({key: result[key] for key in ANALYSIS_KEYS}, ensure_ascii=False)
+
+
+def _usage(messages, content):
+    prompt_tokens = sum(count_tokens(message.get("content") or "") for message in messages)
+    completion_tokens = count_tokens(content)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens}
+
+
+def _error_body(status, message):
+    kinds = {429: ("rate_limit_error", "rate_limit_exceeded"), 500: ("server_error", None),
+             400: ("invalid_request_error", None), 404: ("invalid_request_error", None)}
+    kind, code = kinds.get(status, ("server_error", None))
+    return {"error": {"message": message, "type": kind, "param": None, "code": code}}
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server with the stand-in's configuration and counters.
+
+    Use start() to serve from a daemon thread inside a benchmark; base_url is
+    what LLMClient / OPENAI_BASE_URL expects.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), latency="fixed:0", rate_429=0.0,
+                 rate_500=0.0, retry_after=None, max_inflight=0, chunk_delay=0.0,
+                 chunk_size=16, batch_delay=2.0, seed=None):
+        super().__init__(address, _Handler)
+        self.latency = parse_latency(latency)
+        self.rate_429 = rate_429
+        self.rate_500 = rate_500
+        self.retry_after = retry_after
+        self.max_inflight = max_inflight
+        self.chunk_delay = chunk_delay
+        self.chunk_size = chunk_size
+        self.batch_delay = batch_delay
+        self._rng = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._batch_lock = threading.Lock()
+        self.files = {}
+        self.batches = {}
+        self.reset_stats()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """Serve from a daemon thread and return base_url"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def new_id(self, prefix):
+        return f"{prefix}-standin-{next(self._ids)}"
+
+    def reset_stats(self):
+        with self._lock:
+            in_flight = getattr(self, "_counts", {}).get("in_flight", 0)
+            self._counts = {"requests": 0, "completions": 0, "streams": 0, "rate_limited": 0,
+                            "server_errors": 0, "in_flight": in_flight,
+                            "peak_in_flight": in_flight}
+            self._connections = set()
+
+    def stats(self):
+        """
+        Returns:
+            dict: 요청 수, 주입한 429/500 수, 동시 처리 요청 수(현재/최대), 연결 수
+        """
+        with self._lock:
+            stats = dict(self._counts)
+            stats["connections"] = len(self._connections)
+        return stats
+
+    def sample_latency(self):
+        with self._lock:
+            return self.latency(self._rng)
+
+    def draw_failure(self):
+        """Status code to inject for the next request (429, 500), or None"""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.rate_500:
+            return 500
+        return None
+
+    def enter(self, client_address):
+        """Count a chat request; returns False when it exceeds --max-inflight"""
+        with self._lock:
+            self._counts["requests"] += 1
+            self._connections.add(client_address)
+            if self.max_inflight and self._counts["in_flight"] >= self.max_inflight:
+                return False
+            self._counts["in_flight"] += 1
+            self._counts["peak_in_flight"] = max(self._counts["peak_in_flight"],
+                                                 self._counts["in_flight"])
+            return True
+
+    def leave(self, outcome):
+        with self._lock:
+            self._counts["in_flight"] -= 1
+            if outcome:
+                self._counts[outcome] += 1
+
+    def count(self, outcome):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def completion(self, request):
+        """chat.completion object answering ``request``"""
+        messages = request.get("messages", [])
+        content = analysis_content(messages)
+        return {
+            "id": self.new_id("chatcmpl"), "object": "chat.completion",
+            "created": int(time.time()), "model": request.get("model", ""),
+            "choices": [{"index": 0, "finish_reason": "stop", "logprobs": None,
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": _usage(messages, content),
+        }
+
+    def batch_object(self, batch):
+        """The batch as the API reports it, finishing it once batch_delay has passed"""
+        elapsed = time.time() - batch["created_at"]
+        with self._batch_lock:
+            if batch["status"] != "completed" and elapsed >= self.batch_delay:
+                self._finish_batch(batch)
+            elif batch["status"] == "validating" and elapsed >= self.batch_delay / 2:
+                batch["status"] = "in_progress"
+            return {key: value for key, value in batch.items() if key != "lines"}
+
+    def _finish_batch(self, batch):
+        output, errors = [], []
+        for line in batch["lines"]:
+            status = self.draw_failure()
+            if status is None:
+                response = {"status_code": 200, "request_id": self.new_id("req"),
+                            "body": self.completion(line["body"])}
+                output.append({"id": self.new_id("batch_req"), "custom_id": line["custom_id"],
+                               "response": response, "error": None})
+            else:
+                response = {"status_code": status, "request_id": self.new_id("req"),
+                            "body": _error_body(status, "injected failure")}
+                errors.append({"id": self.new_id("batch_req"), "custom_id": line["custom_id"],
+                               "response": response, "error": None})
+        for key, lines in (("output_file_id", output), ("error_file_id", errors)):
+            if lines:
+                file_id = self.new_id("file")
+                self.files[file_id] = "".join(
+                    json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode()
+                batch[key] = file_id
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+        batch["request_counts"] = {"total": len(batch["lines"]), "completed": len(output),
+                                   "failed": len(errors)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status, message):
+        headers = {}
+        if status == 429 and self.server.retry_after is not None:
+            headers["Retry-After"] = str(self.server.retry_after)
+        self._send_json(status, _error_body(status, message), headers)
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?", 1)[0]
+        if path == "/stats":
+            return self._send_json(200, server.stats())
+        match = re.fullmatch(r"/v1/batches/([^/]+)", path)
+        if match and match[1] in server.batches:
+            return self._send_json(200, server.batch_object(server.batches[match[1]]))
+        match = re.fullmatch(r"/v1/files/([^/]+)/content", path)
+        if match and match[1] in server.files:
+            data = server.files[match[1]]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/jsonl")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self._send_error(404, f"unknown path: {path}")
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        body = self._read_body()
+        if path == "/v1/chat/completions":
+            return self._chat_completion(json.loads(body))
+        if path == "/v1/files":
+            return self._upload(body)
+        if path == "/v1/batches":
+            return self._create_batch(json.loads(body))
+        if path == "/stats/reset":
+            self.server.reset_stats()
+            return self._send_json(200, self.server.stats())
+        self._send_error(404, f"unknown path: {path}")
+
+    def _chat_completion(self, request):
+        server = self.server
+        if not server.enter(self.client_address):
+            server.count("rate_limited")
+            return self._send_error(429, "too many concurrent requests")
+        outcome = None
+        try:
+            status = server.draw_failure()
+            if status == 429:
+                outcome = "rate_limited"
+                return self._send_error(429, "injected rate limit")
+            time.sleep(server.sample_latency())
+            if status == 500:
+                outcome = "server_errors"
+                return self._send_error(500, "injected server error")
+            completion = server.completion(request)
+            if request.get("stream"):
+                outcome = "streams"
+                return self._stream(completion)
+            outcome = "completions"
+            self._send_json(200, completion)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client went away (cancelled analysis)
+        finally:
+            server.leave(outcome)
+
+    def _stream(self, completion):
+        """Send ``completion`` as chat.completion.chunk server-sent events"""
+        server = self.server
+        content = completion["choices"][0]["message"]["content"]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send(data):
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def event(delta, finish_reason=None):
+            chunk = {"id": completion["id"], "object": "chat.completion.chunk",
+                     "created": completion["created"], "model": completion["model"],
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason,
+                                  "logprobs": None}]}
+            send(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode())
+
+        event({"role": "assistant", "content": ""})
+        for start in range(0, len(content), server.chunk_size):
+            if start:
+                time.sleep(server.chunk_delay)
+            event({"content": content[start:start + server.chunk_size]})
+        event({}, "stop")
+        send(b"data: [DONE]\n\n")
+        send(b"")
+
+    def _upload(self, body):
+        server = self.server
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body)
+        fields = {part.get_param("name", header="content-disposition"): part
+                  for part in message.iter_parts()}
+        if "file" not in fields:
+            return self._send_error(400, "missing file")
+        data = fields["file"].get_payload(decode=True)
+        file_id = server.new_id("file")
+        server.files[file_id] = data
+        purpose = fields["purpose"].get_content().strip() if "purpose" in fields else "batch"
+        self._send_json(200, {"id": file_id, "object": "file", "bytes": len(data),
+                              "created_at": int(time.time()),
+                              "filename": fields["file"].get_filename() or "upload.jsonl",
+                              "purpose": purpose, "status": "processed"})
+
+    def _create_batch(self, request):
+        server = self.server
+        data = server.files.get(request.get("input_file_id"))
+        if data is None:
+            return self._send_error(400, "unknown input_file_id")
+        batch_id = server.new_id("batch")
+        server.batches[batch_id] = {
+            "id": batch_id, "object": "batch", "endpoint": request.get("endpoint"),
+            "input_file_id": request["input_file_id"],
+            "completion_window": request.get("completion_window", "24h"),
+            "status": "validating", "created_at": int(time.time()),
+            "output_file_id": None, "error_file_id": None,
+            "metadata": request.get("metadata"), "errors": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+            "lines": [json.loads(line) for line in data.decode().splitlines() if line.strip()],
+        }
+        self._send_json(200, server.batch_object(server.batches[batch_id]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", default="fixed:0.5")
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-500", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds on 429s")
+    parser.add_argument("--max-inflight", type=int, default=0,
+                        help="answer 429 above this many concurrent requests (0: no limit)")
+    parser.add_argument("--chunk-delay", type=float, default=0.02)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--batch-delay", type=float, default=5.0,
+                        help="seconds until a batch completes")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    try:
+        parse_latency(args.latency)
+    except ValueError as e:
+        parser.error(str(e))
+    server = StandInServer((args.host, args.port), args.latency, args.rate_429, args.rate_500,
+                           args.retry_after, args.max_inflight, args.chunk_delay,
+                           args.chunk_size, args.batch_delay, args.seed)
+    print(f"stand-in serving on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import threading
+
+import rule_engine
+
+# Escalate when fewer qualification fields than this were found in the resume
+CASCADE_MIN_FIELDS = int(os.environ.get("CASCADE_MIN_FIELDS", 3))
+# Escalate when success_rate is within this many points of a decision threshold
+CASCADE_MARGIN = float(os.environ.get("CASCADE_MARGIN", 5))
+# Comma-separated success_rate thresholds; empty means the rule table's pass_score
+CASCADE_THRESHOLDS = tuple(
+    float(value) for value in os.environ.get("CASCADE_THRESHOLDS", "").split(",") if value.strip())
+
+_counts = {"assessed": 0, "escalated": 0, "few_fields": 0, "borderline": 0}
+_counts_lock = threading.Lock()
+
+
+def assess_confidence(result, job_title):
+    """
+    규칙 기반 분석 결과의 신뢰도를 평가합니다.
+
+    자격 요건 항목 중 실제로 규칙이 적용된(기본 설명이 아닌) 항목 수와
+    success_rate가 합격 기준선에 얼마나 가까운지를 봅니다.
+
+    Args:
+        result (dict): get_rule_based_analysis() 결과
+        job_title (str): 직무 제목
+
+    Returns:
+        dict: {"extracted", "fields", "missing", "margin", "reasons", "escalate"}
+    """
+    pack = rule_engine.get_rule_pack(job_title)
+    ratings = result.get("qualification_ratings", {})
+    missing = [
+        qualification["name"] for qualification in pack.qualifications
+        if ratings.get(qualification["name"], {}).get("description",
+                                                      qualification["description"])
+        == qualification["description"]
+    ]
+    extracted = len(pack.qualifications) - len(missing)
+    thresholds = CASCADE_THRESHOLDS or (pack.pass_score,)
+    margin = min(abs(result["success_rate"] - threshold) for threshold in thresholds)
+
+    reasons = []
+    if extracted < CASCADE_MIN_FIELDS:
+        reasons.append("few_fields")
+    if margin <= CASCADE_MARGIN:
+        reasons.append("borderline")
+    return {
+        "extracted": extracted,
+        "fields": len(pack.qualifications),
+        "missing": missing,
+        "margin": margin,
+        "reasons": reasons,
+        "escalate": bool(reasons),
+    }
+
+
+def should_escalate(result, job_title):
+    """
+    규칙 기반 결과를 LLM 분석으로 넘겨야 하는지 판단하고 지표를 기록합니다.
+
+    전환 건수는 여기서 세지 않습니다. LLM 요청을 실제로 보낼 때
+    record_escalation()으로 기록합니다 (API 키가 없거나 캐시에 적중하면 요청하지 않음).
+
+    Returns:
+        bool: 불확실한 결과라 LLM 분석이 필요하면 True
+    """
+    assessment = assess_confidence(result, job_title)
+    with _counts_lock:
+        _counts["assessed"] += 1
+        for reason in assessment["reasons"]:
+            _counts[reason] += 1
+    if assessment["escalate"]:
+        print(f"LLM 분석 필요: {', '.join(assessment['reasons'])} "
+              f"(추출 {assessment['extracted']}/{assessment['fields']}, "
+              f"기준선과의 차이 {assessment['margin']:.0f}점)")
+    return assessment["escalate"]
+
+
+def record_escalation():
+    """Count one escalated resume whose LLM request is being sent"""
+    with _counts_lock:
+        _counts["escalated"] += 1
+
+
+def cascade_stats():
+    """
+    Escalation counters of this process, for tuning the thresholds.
+
+    Returns:
+        dict: {"assessed", "escalated", "few_fields", "borderline", "escalation_rate"}
+    """
+    with _counts_lock:
+        stats = dict(_counts)
+    stats["escalation_rate"] = stats["escalated"] / stats["assessed"] if stats["assessed"] else 0.0
+    return stats
@@ -0,0 +1,164 @@
+import os
+import re
+import json
+
+from pdf_parallel import should_extract_in_parallel, extract_pages_parallel
+
+try:
+    import pdfplumber
+except ImportError:  # Optional backend
+    pdfplumber = None
+
+# "auto" picks a backend per document class; any registered name forces that backend
+PDF_BACKEND = os.environ.get("PDF_EXTRACTION_BACKEND", "auto")
+# Document class -> backend used in auto mode; benchmarks/bench_backends.py --write updates it
+BACKEND_SELECTION_PATH = os.environ.get(
+    "PDF_BACKEND_SELECTION",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend_selection.json"))
+DEFAULT_BACKEND_BY_CLASS = {"text": "pypdf2", "table": "pdfplumber"}
+
+# Documents whose sampled pages draw at least this many rectangles/line segments
+# per page are treated as table-heavy
+TABLE_OPS_PER_PAGE = 40
+CLASSIFY_SAMPLE_PAGES = 3
+# Backends yield bare page texts; every consumer joins pages with this, so the
+# text (and its rule scores and cache entries) does not depend on the backend
+PAGE_SEPARATOR = "\n"
+
+_PATH_OPS = re.compile(rb"(?<![A-Za-z])(?:re|l)(?![A-Za-z])")
+
+_backends = {}
+
+
+class PDFBackend:
+    """
+    Interface for PDF text extraction backends.
+
+    Backends receive the PyPDF2 reader built during validation, so the page
+    tree is parsed once; a backend that needs its own parser can read the raw
+    bytes from ``reader.stream``.
+    """
+
+    name = None
+
+    def available(self):
+        """Whether the backend's dependencies are installed"""
+        return True
+
+    def iter_page_texts(self, reader, page_count, parallel=True):
+        """Yield the text of the first ``page_count`` pages, in order, without separators"""
+        raise NotImplementedError
+
+
+def register_backend(backend_class):
+    """Class decorator adding a PDFBackend to the registry under its ``name``"""
+    _backends[backend_class.name] = backend_class()
+    return backend_class
+
+
+def get_backend(name):
+    """Return a registered, available backend by name"""
+    backend = _backends.get(name)
+    if backend is None or not backend.available():
+        raise ValueError(f"사용할 수 없는 PDF 추출 백엔드입니다: {name}")
+    return backend
+
+
+def available_backends():
+    """Return the names of all registered backends whose dependencies are installed"""
+    return [name for name, backend in _backends.items() if backend.available()]
+
+
+@register_backend
+class PyPDF2Backend(PDFBackend):
+    """PyPDF2 text layer; large documents are split across the process pool"""
+
+    name = "pypdf2"
+
+    def iter_page_texts(self, reader, page_count, parallel=True):
+        if parallel and should_extract_in_parallel(page_count):
+            yield from extract_pages_parallel(reader.stream.getvalue(), page_count)
+            return
+        for page_num in range(page_count):
+            yield reader.pages[page_num].extract_text() or ""
+
+
+@register_backend
+class PdfplumberBackend(PDFBackend):
+    """pdfminer layout analysis; keeps table cells and columns in reading order"""
+
+    name = "pdfplumber"
+
+    def available(self):
+        return pdfplumber is not None
+
+    def iter_page_texts(self, reader, page_count, parallel=True):
+        reader.stream.seek(0)
+        with pdfplumber.open(reader.stream) as pdf:
+            for page in pdf.pages[:page_count]:
+                yield page.extract_text() or ""
+                page.flush_cache()
+
+
+def classify_document(reader):
+    """
+    Classify a PDF as "text" or "table" heavy from its first content streams.
+
+    Counts rectangle and line-segment operators, which is what table grids are
+    drawn with, without extracting any text.
+    """
+    sample = min(CLASSIFY_SAMPLE_PAGES, len(reader.pages))
+    if sample == 0:
+        return "text"
+    ops = 0
+    for page_num in range(sample):
+        try:
+            contents = reader.pages[page_num].get_contents()
+            data = contents.get_data() if contents is not None else b""
+        except Exception:
+            data = b""
+        ops += len(_PATH_OPS.findall(data))
+    return "table" if ops / sample >= TABLE_OPS_PER_PAGE else "text"
+
+
+_selection = None
+
+
+def _backend_by_class():
+    """Class -> backend mapping, from the benchmark's selection file if present"""
+    global _selection
+    if _selection is None:
+        _selection = dict(DEFAULT_BACKEND_BY_CLASS)
+        try:
+            with open(BACKEND_SELECTION_PATH, encoding="utf-8") as f:
+                _selection.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return _selection
+
+
+def config_fingerprint():
+    """Short string identifying the backend configuration, for cache keys"""
+    mapping = ",".join(f"{cls}={name}" for cls, name in sorted(_backend_by_class().items()))
+    return f"{PDF_BACKEND}[{mapping}]"
+
+
+def select_backend(reader, name=None):
+    """
+    Choose the extraction backend for a document.
+
+    Args:
+        reader (PyPDF2.PdfReader): Parsed document
+        name (str): Backend name or "auto" (defaults to PDF_BACKEND)
+
+    Returns:
+        PDFBackend: The backend to use; falls back to PyPDF2 when the preferred
+        backend is not installed
+    """
+    name = name or PDF_BACKEND
+    if name == "auto":
+        name = _backend_by_class().get(classify_document(reader), "pypdf2")
+    backend = _backends.get(name)
+    if backend is None or not backend.available():
+        return _backends["pypdf2"]
+    return backend
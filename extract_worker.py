@@ -0,0 +1,207 @@
+import io
+import os
+import queue
+import signal
+import threading
+import multiprocessing
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: workers run without a memory cap
+    resource = None
+
+# Run extraction in sandboxed worker processes (set EXTRACTION_ISOLATION=0 to disable)
+ISOLATION_ENABLED = os.environ.get("EXTRACTION_ISOLATION", "1") == "1"
+WORKER_COUNT = int(os.environ.get("EXTRACTION_WORKERS", 2))
+# Wall-clock budget for one document, in seconds
+WORKER_TIMEOUT = float(os.environ.get("EXTRACTION_TIMEOUT", 30))
+# Share of that budget OCR may use inside a worker. ocr_engine.OCR_TIMEOUT is
+# lowered to fit, so a slow scan ends in the OCR fallback text instead of the
+# worker being killed and the whole upload failing with TIMEOUT.
+WORKER_OCR_SHARE = float(os.environ.get("EXTRACTION_OCR_SHARE", 0.8))
+# pdf_parallel processes per worker. The worker pool is the unit of
+# parallelism, so by default large PDFs are extracted serially inside a
+# worker and pdf_parallel's process-pool path only runs with isolation off.
+WORKER_PDF_PROCESSES = int(os.environ.get("EXTRACTION_WORKER_PDF_PROCESSES", 1))
+# Address space a worker may grow by while extracting one document, in bytes
+WORKER_MEMORY_LIMIT = int(os.environ.get("EXTRACTION_MEMORY_LIMIT", 768 * 1024 * 1024))
+# How long a new worker may take to import the extraction stack before it counts as crashed
+WORKER_START_TIMEOUT = float(os.environ.get("EXTRACTION_WORKER_START_TIMEOUT", 60))
+# Workers are replaced after this many documents to bound leaks and fragmentation
+WORKER_MAX_TASKS = int(os.environ.get("EXTRACTION_WORKER_MAX_TASKS", 50))
+
+# Result statuses
+OK = "ok"
+INVALID = "invalid"      # file could not be opened/validated
+FAILED = "failed"        # text extraction raised
+TIMEOUT = "timeout"      # wall-clock limit exceeded, worker killed
+MEMORY = "memory"        # memory cap hit, worker recycled
+CRASHED = "crashed"      # worker died unexpectedly
+
+
+def _current_address_space():
+    """Current virtual memory size of this process, or None if unknown"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _apply_memory_limit(limit):
+    if resource is None or not limit:
+        return
+    # The cap is relative to the worker's footprint after imports, so it bounds
+    # what one document may allocate rather than the interpreter itself
+    baseline = _current_address_space() or 0
+    cap = baseline + limit
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        cap = min(cap, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+
+
+def _worker_main(conn, memory_limit):
+    """Worker process loop: receive (data, file_type, timeout), reply with a result dict"""
+    import ocr_engine
+    import pdf_parallel
+    from utils import open_document, extract_text_from_document
+
+    if hasattr(os, "setpgrp"):
+        # Own process group, so stopping the worker also stops its tesseract children
+        os.setpgrp()
+    pdf_parallel.MAX_WORKERS = max(1, WORKER_PDF_PROCESSES)
+    ocr_timeout = ocr_engine.OCR_TIMEOUT
+    _apply_memory_limit(memory_limit)
+    conn.send("ready")  # start-up is not charged to the first document's timeout
+    while True:
+        try:
+            data, file_type, timeout = conn.recv()
+        except (EOFError, OSError):
+            return
+        ocr_engine.OCR_TIMEOUT = min(ocr_timeout, timeout * WORKER_OCR_SHARE)
+        try:
+            try:
+                document = open_document(io.BytesIO(data), file_type)
+            except MemoryError:
+                raise
+            except Exception as e:
+                conn.send({"status": INVALID, "message": str(e)})
+                continue
+            text = extract_text_from_document(document, file_type)
+            conn.send({"status": OK, "text": text})
+        except MemoryError:
+            conn.send({"status": MEMORY, "message": "메모리 한도를 초과했습니다."})
+            return  # exit so the parent starts a fresh worker
+        except Exception as e:
+            conn.send({"status": FAILED, "message": str(e)})
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, WORKER_MEMORY_LIMIT), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.ready = False
+
+    def run(self, data, file_type, timeout):
+        self.tasks += 1
+        try:
+            if not self.ready:
+                if not self.conn.poll(WORKER_START_TIMEOUT) or self.conn.recv() != "ready":
+                    return {"status": CRASHED, "message": "추출 작업 프로세스가 시작되지 않았습니다."}
+                self.ready = True
+            self.conn.send((data, file_type, timeout))
+            if not self.conn.poll(timeout):
+                return {"status": TIMEOUT,
+                        "message": f"텍스트 추출이 {timeout:.0f}초 안에 끝나지 않았습니다."}
+            return self.conn.recv()
+        except (EOFError, OSError, BrokenPipeError):
+            return {"status": CRASHED, "message": "추출 작업 프로세스가 비정상 종료되었습니다."}
+
+    def healthy(self):
+        return self.process.is_alive() and self.tasks < WORKER_MAX_TASKS
+
+    def stop(self):
+        self.conn.close()
+        try:
+            # The worker leads its own process group: kill it with any tesseract
+            # or pdf_parallel children, which would otherwise keep running
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join(timeout=1)
+
+
+class WorkerPool:
+    """
+    Fixed-size pool of sandboxed extraction processes.
+
+    Each document runs in a worker with a hard wall-clock timeout and an
+    RLIMIT_AS memory cap. Workers that time out, crash, hit the memory cap or
+    reach WORKER_MAX_TASKS are killed together with their child processes and
+    replaced on next use.
+    """
+
+    def __init__(self, size=WORKER_COUNT):
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)  # slot without a started worker yet
+
+    def extract(self, data, file_type, timeout=WORKER_TIMEOUT):
+        """
+        Open and extract a document in a worker process.
+
+        Args:
+            data (bytes): Raw document bytes
+            file_type (str): Internal file type ("pdf", "pptx", "image")
+            timeout (float): Wall-clock limit in seconds
+
+        Returns:
+            dict: {"status": OK, "text": str} or {"status": <error status>, "message": str}
+        """
+        worker = self._idle.get()
+        try:
+            if worker is None:
+                worker = _Worker(self._context)
+            result = worker.run(bytes(data), file_type, timeout)
+            if result["status"] in (TIMEOUT, MEMORY, CRASHED) or not worker.healthy():
+                worker.stop()
+                worker = None
+            return result
+        finally:
+            self._idle.put(worker)
+
+    def shutdown(self):
+        """Stop all idle workers"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool():
+    """Return the process-wide extraction worker pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = WorkerPool()
+    return _pool
+
+
+def extract_isolated(data, file_type, timeout=WORKER_TIMEOUT):
+    """Open and extract a document in a sandboxed worker (see WorkerPool.extract)"""
+    return get_worker_pool().extract(data, file_type, timeout)
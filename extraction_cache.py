@@ -0,0 +1,178 @@
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+
+# Location and size bound of the on-disk cache (overridable via environment)
+CACHE_PATH = os.environ.get(
+    "EXTRACTION_CACHE_PATH", os.path.join(".cache", "extraction_cache.sqlite3"))
+CACHE_MAX_BYTES = int(os.environ.get("EXTRACTION_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def make_cache_key(data, file_type, extractor_version):
+    """
+    Build a content-addressed cache key for an upload.
+
+    Args:
+        data (bytes | memoryview): Raw upload bytes
+        file_type (str): Internal file type ("pdf", "pptx", "image")
+        extractor_version (str): Version of the extraction pipeline
+
+    Returns:
+        str: Cache key
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{extractor_version}:{file_type}:{digest}"
+
+
+class ExtractionCache:
+    """
+    SQLite-backed cache of extracted (and translated) resume text.
+
+    Entries are evicted least-recently-used first once the stored text exceeds
+    ``max_bytes``. Every operation opens its own connection, so one instance can
+    be shared by Streamlit sessions and the database by several server processes.
+    Cache errors never propagate: a broken cache behaves like a miss.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_bytes=CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS extractions (
+                            key TEXT PRIMARY KEY,
+                            text TEXT NOT NULL,
+                            size INTEGER NOT NULL,
+                            last_access REAL NOT NULL
+                        )""")
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_extractions_access "
+                        "ON extractions (last_access)")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS counters (
+                            name TEXT PRIMARY KEY,
+                            value INTEGER NOT NULL
+                        )""")
+                    self._initialized = True
+        return conn
+
+    def _bump(self, conn, name):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,))
+
+    def get(self, key):
+        """Return the cached text for ``key``, or None on a miss"""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT text FROM extractions WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self._bump(conn, "misses")
+                    return None
+                conn.execute(
+                    "UPDATE extractions SET last_access = ? WHERE key = ?",
+                    (time.time(), key))
+                self._bump(conn, "hits")
+                return row[0]
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+    def put(self, key, text):
+        """Store ``text`` under ``key`` and evict old entries if over budget"""
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions (key, text, size, last_access) "
+                    "VALUES (?, ?, ?, ?)", (key, text, size, time.time()))
+                self._evict(conn)
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute(
+                "SELECT key, size FROM extractions ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM extractions WHERE key = ?", victims)
+        for _ in victims:
+            self._bump(conn, "evictions")
+
+    def stats(self):
+        """
+        Return cache counters shared by all processes using this database.
+
+        Returns:
+            dict: hits, misses, evictions, hit_rate, entries and bytes
+        """
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+        try:
+            conn = self._connect()
+            try:
+                for name, value in conn.execute("SELECT name, value FROM counters"):
+                    stats[name] = value
+                stats["entries"], stats["bytes"] = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM extractions")
+                conn.execute("DELETE FROM counters")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    """Return the process-wide extraction cache instance"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ExtractionCache()
+    return _cache
@@ -0,0 +1,95 @@
+import re
+
+# Characters a word-boundary keyword may not touch
+_WORD_CHAR = "A-Za-z0-9"
+
+
+def _is_word_char(char):
+    return char.isascii() and char.isalnum()
+
+
+class KeywordMatcher:
+    """
+    Rewrites many keywords in one pass over a text.
+
+    Matches are leftmost-longest and never overlap, so a keyword that
+    is part of a longer one ("Master" in "Master of Science") only matches
+    where the longer one does not.
+
+    The keywords are compiled into a single regular expression, an alternation
+    sorted longest-first, so the scan runs inside the C regex engine. At each
+    position the first alternative that matches is the longest keyword there,
+    and a keyword rejected by a word boundary falls through to shorter ones,
+    exactly as a leftmost-longest scan would.
+    """
+
+    def __init__(self, keywords, ignore_case=False, word_boundary=False):
+        """
+        Args:
+            keywords (dict | iterable): keyword -> value (an iterable maps each keyword to itself)
+            ignore_case (bool): Match case-insensitively
+            word_boundary (bool): Reject matches whose keyword starts/ends with an
+                ASCII letter or digit but sits next to another ASCII letter or digit
+        """
+        if not isinstance(keywords, dict):
+            keywords = {keyword: keyword for keyword in keywords}
+        self.ignore_case = ignore_case
+        self.word_boundary = word_boundary
+
+        # Later keywords win over earlier ones that are equal after lowercasing
+        self._values = {}
+        for keyword, value in keywords.items():
+            if keyword:
+                self._values[keyword.lower() if ignore_case else keyword] = value
+        ordered = sorted(self._values, key=len, reverse=True)
+        self._pattern = re.compile(
+            "|".join(self._alternative(key) for key in ordered)) if ordered else None
+
+    def _alternative(self, keyword):
+        # Every alternative starts with a literal so the engine can skip
+        # alternatives (and positions) by their first character; the
+        # word-boundary lookbehind therefore comes after the first character
+        first = re.escape(keyword[0])
+        pattern = first
+        if self.word_boundary and _is_word_char(keyword[0]):
+            pattern += f"(?<![{_WORD_CHAR}]{first})"
+        pattern += re.escape(keyword[1:])
+        if self.word_boundary and _is_word_char(keyword[-1]):
+            pattern += f"(?![{_WORD_CHAR}])"
+        return pattern
+
+    def _haystack(self, text):
+        # Lowercasing can change the length ("İ"), which would shift every
+        # offset; such texts are matched as they are against the lowercase keys
+        if self.ignore_case:
+            lowered = text.lower()
+            if len(lowered) == len(text):
+                return lowered
+        return text
+
+    def replace(self, text, replacement):
+        """
+        Rewrite every match in a single pass.
+
+        Args:
+            text (str): Input text
+            replacement (callable): f(matched_text, value) -> replacement string
+
+        Returns:
+            str: Rewritten text
+        """
+        if self._pattern is None:
+            return text
+        values = self._values
+        haystack = self._haystack(text)
+        if haystack is text:
+            return self._pattern.sub(
+                lambda match: replacement(match.group(), values[match.group()]), text)
+        parts, position = [], 0
+        for match in self._pattern.finditer(haystack):
+            start, end = match.span()
+            parts.append(text[position:start])
+            parts.append(replacement(text[start:end], values[match.group()]))
+            position = end
+        parts.append(text[position:])
+        return "".join(parts)
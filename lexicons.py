@@ -0,0 +1,148 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Versioned vocabulary files: data/lexicons/<name>.json = {"name", "version", "entries"}
+LEXICON_DIR = os.environ.get(
+    "LEXICON_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "lexicons"))
+# How often (seconds) get_lexicon() checks the files for changes; 0 disables hot reload
+RELOAD_INTERVAL = float(os.environ.get("LEXICON_RELOAD_INTERVAL", 2.0))
+
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class Lexicon:
+    """
+    One immutable vocabulary loaded from a data file.
+
+    ``entries`` is either a read-only mapping or a tuple, preserving file order.
+    """
+
+    def __init__(self, name, version, entries, digest):
+        self.name = name
+        self.version = version
+        self.entries = freeze(entries)
+        self.digest = digest
+
+    def __getitem__(self, key):
+        return self.entries[key]
+
+    def get(self, key, default=()):
+        return self.entries.get(key, default)
+
+
+def _load_file(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+    return Lexicon(data["name"], data.get("version", 1), data["entries"],
+                   hashlib.sha256(raw).hexdigest()[:16])
+
+
+class LexiconStore:
+    """
+    Loads every lexicon file once and reloads individual files when they change.
+
+    Reloading swaps in a new Lexicon object; consumers holding the old one keep
+    a consistent snapshot until their next get().
+    """
+
+    def __init__(self, directory=LEXICON_DIR, reload_interval=RELOAD_INTERVAL):
+        self.directory = directory
+        self.reload_interval = reload_interval
+        self._lexicons = {}
+        self._signatures = {}
+        self._names = {}  # path -> lexicon name
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _scan(self):
+        signatures = {}
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".json"):
+                path = os.path.join(self.directory, filename)
+                stat = os.stat(path)
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def reload(self):
+        """
+        Load new or changed files and drop removed ones.
+
+        A file that fails to parse keeps its previously loaded version.
+
+        Returns:
+            list: Names of lexicons that were (re)loaded
+        """
+        with self._lock:
+            signatures = self._scan()
+            lexicons = dict(self._lexicons)
+            loaded = []
+            for path, signature in signatures.items():
+                if self._signatures.get(path) == signature:
+                    continue
+                try:
+                    lexicon = _load_file(path)
+                except (OSError, ValueError, KeyError) as e:
+                    # Keep the previous version; retry once the file changes again
+                    logger.warning("Lexicon reload failed for %s: %s", path, e)
+                    continue
+                lexicons[lexicon.name] = lexicon
+                self._names[path] = lexicon.name
+                loaded.append(lexicon.name)
+            for path in set(self._signatures) - set(signatures):
+                lexicons.pop(self._names.pop(path, None), None)
+            self._lexicons = lexicons
+            self._signatures = signatures
+            self._checked_at = time.monotonic()
+            return loaded
+
+    def _maybe_reload(self):
+        if self.reload_interval and time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+
+    def get(self, name):
+        """Return the current Lexicon called ``name`` (KeyError if unknown)"""
+        self._maybe_reload()
+        return self._lexicons[name]
+
+    def fingerprint(self, names=None):
+        """Short hash of the given lexicons' contents, for cache keys"""
+        self._maybe_reload()
+        names = sorted(self._lexicons if names is None else names)
+        digest = hashlib.sha256(
+            "|".join(f"{name}@{self._lexicons[name].digest}" for name in names).encode())
+        return digest.hexdigest()[:16]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide lexicon store shared by all consumers"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = LexiconStore()
+    return _store
+
+
+def get_lexicon(name):
+    """Shortcut for get_store().get(name)"""
+    return get_store().get(name)
@@ -0,0 +1,204 @@
+import time
+
+from resume_index import text_views
+from rule_engine import get_rule_pack
+
+# Index view each lookup field is counted in (see resume_index.keyword_key)
+_COUNTED_FIELDS = {"compact": "compact", "token_text": "token_text", "token": "token_text"}
+
+
+def _common_prefix(a, b):
+    """Length of the common prefix, by bisection over C-level slice comparisons"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(a, b, limit):
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def changed_span(old, new):
+    """
+    The edited region between two versions of a text.
+
+    Returns:
+        tuple: (start, old_end, new_end) - old[start:old_end] was replaced by
+        new[start:new_end]; None if the texts are equal
+    """
+    if old == new:
+        return None
+    start = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - start)
+    return start, len(old) - suffix, len(new) - suffix
+
+
+def _count(haystack, key, start, end):
+    """Occurrences of key (overlapping) lying entirely within haystack[start:end]"""
+    count = 0
+    position = haystack.find(key, start, end)
+    while position >= 0:
+        count += 1
+        position = haystack.find(key, position + 1, end)
+    return count
+
+
+class LiveScorer:
+    """
+    Re-scores a resume incrementally while it is being edited.
+
+    Each update only redoes the work the edit can affect:
+
+    - the index views (normalized, compact, tokens) are kept per line, and
+      only the edited lines are re-normalized;
+    - keyword occurrence counts are adjusted by recounting only occurrences
+      that overlap the edited span of each view;
+    - only qualifications whose keyword hits or pattern values changed are
+      re-scored; the rest reuse the previous score and description.
+
+    Pattern rules (GPA, TOEIC, years) are re-searched on every update, since a
+    regex match can depend on context outside the edited span; the few
+    precompiled searches are cheap. The result always equals
+    rule_engine.evaluate() on the full text.
+    """
+
+    def __init__(self, job_title):
+        self.job_title = job_title
+        self.text = None
+        self.result = None
+        self.last_update_ms = 0.0
+        self.reevaluated = []  # qualifications re-scored by the last update
+        self._pack = None
+
+    def _join_views(self):
+        """Whole-text views from the per-line ones (see resume_index.text_views)"""
+        normalized = [views[0] for views in self._line_views if views[0]]
+        folded = [views[1] for views in self._line_views if views[1]]
+        tokens = [token for views in self._line_views for token in views[3]]
+        return {
+            "normalized": " ".join(normalized),
+            "folded": " ".join(folded),
+            "compact": "".join(views[2] for views in self._line_views),
+            "token_text": " " + " ".join(tokens) + " ",
+        }
+
+    def _splice_lines(self, old, new):
+        """Re-derive the views of the lines an edit touched"""
+        start, old_end, new_end = changed_span(old, new)
+        line_start = old.rfind("\n", 0, start) + 1
+        old_stop = old.find("\n", old_end)
+        new_stop = new.find("\n", new_end)
+        old_segment = old[line_start:len(old) if old_stop < 0 else old_stop]
+        new_segment = new[line_start:len(new) if new_stop < 0 else new_stop]
+        first = old.count("\n", 0, line_start)
+        last = first + old_segment.count("\n") + 1
+        self._line_views[first:last] = [text_views(line) for line in new_segment.split("\n")]
+
+    def _lookup(self, keyword, field, key, views):
+        if field == "folded":
+            return bool(key) and key in views["folded"]
+        return self._counts[keyword] > 0
+
+    def _full(self, text):
+        pack = self._pack
+        self._line_views = [text_views(line) for line in text.split("\n")]
+        views = self._join_views()
+        self._counts = {}
+        for keyword, field, key in pack.lookups:
+            if field in _COUNTED_FIELDS:
+                haystack = views[_COUNTED_FIELDS[field]]
+                needle = f" {key} " if field == "token" else key
+                self._counts[keyword] = _count(haystack, needle, 0, len(haystack))
+        self._hits = {keyword for keyword, field, key in pack.lookups
+                      if self._lookup(keyword, field, key, views)}
+        self._values = [pack.first_value(rule["compiled_patterns"], views["normalized"])
+                        for rule in pack.pattern_rules]
+        self._dependencies = {q["name"]: pack.qualification_dependencies(q)
+                              for q in pack.qualifications}
+        self._scored = {q["name"]: pack.score_qualification(q, self._hits, self._value_of)
+                        for q in pack.qualifications}
+        self._views = views
+        return list(self._scored)
+
+    def _value_of(self, rule):
+        return self._values[rule["slot"]]
+
+    def _incremental(self, text):
+        pack = self._pack
+        self._splice_lines(self.text, text)
+        views = self._join_views()
+        spans = {view: changed_span(self._views[view], views[view])
+                 for view in ("compact", "token_text")}
+
+        flipped = set()
+        for keyword, field, key in pack.lookups:
+            if field in _COUNTED_FIELDS:
+                view = _COUNTED_FIELDS[field]
+                span = spans[view]
+                if span is None:
+                    continue
+                start, old_end, new_end = span
+                needle = f" {key} " if field == "token" else key
+                # occurrences overlapping the edit start at most len(needle)-1 before it
+                lead = max(0, start - len(needle) + 1)
+                tail = len(needle) - 1
+                self._counts[keyword] += (_count(views[view], needle, lead, new_end + tail)
+                                          - _count(self._views[view], needle, lead, old_end + tail))
+            hit = self._lookup(keyword, field, key, views)
+            if hit != (keyword in self._hits):
+                flipped.add(keyword)
+                (self._hits.add if hit else self._hits.discard)(keyword)
+
+        changed_slots = set()
+        for rule in pack.pattern_rules:
+            value = pack.first_value(rule["compiled_patterns"], views["normalized"])
+            if value != self._values[rule["slot"]]:
+                self._values[rule["slot"]] = value
+                changed_slots.add(rule["slot"])
+
+        reevaluated = []
+        for qualification in pack.qualifications:
+            keywords, slots = self._dependencies[qualification["name"]]
+            if keywords & flipped or slots & changed_slots:
+                self._scored[qualification["name"]] = pack.score_qualification(
+                    qualification, self._hits, self._value_of)
+                reevaluated.append(qualification["name"])
+        self._views = views
+        return reevaluated
+
+    def update(self, text):
+        """
+        Score the current text of the resume.
+
+        Args:
+            text (str): 편집 중인 이력서 전체 텍스트
+
+        Returns:
+            dict: get_rule_based_analysis()와 같은 구조의 분석 결과
+        """
+        if text == self.text and self.result is not None:
+            return self.result
+        start = time.perf_counter()
+        pack = get_rule_pack(self.job_title)
+        if pack is not self._pack or self.result is None:
+            # first update, or the rule table / lexicons were reloaded
+            self._pack = pack
+            self.reevaluated = self._full(text)
+        else:
+            self.reevaluated = self._incremental(text)
+        self.text = text
+        self.result = pack.build_result(self._scored, self._hits)
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+        return self.result
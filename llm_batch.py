@@ -0,0 +1,318 @@
+"""
+Offline LLM analysis of a whole applicant pool through the OpenAI Batch API.
+
+    python llm_batch.py --job it-개발자 --name 2025-final candidates.jsonl results.jsonl
+
+candidates.jsonl has one {"candidate_id": ..., "resume_text": ...} per line;
+results.jsonl gets one {"candidate_id", "result", "error"} per line in input
+order. Re-running the same command is safe: finished results come from the
+run's results file, submitted batches are resumed from their manifest
+instead of being sent again, and only failed or new candidates are submitted.
+"""
+import os
+import json
+import time
+import argparse
+
+from ai_analysis import build_analysis_request, llm_cache_key, parse_analysis_response
+from job_data import get_job_details
+from llm_cache import get_llm_cache
+from llm_client import get_llm_client
+
+# Manifests and request files of batch runs
+LLM_BATCH_DIR = os.environ.get("LLM_BATCH_DIR", os.path.join(".cache", "batches"))
+LLM_BATCH_POLL_INTERVAL = float(os.environ.get("LLM_BATCH_POLL_INTERVAL", 30.0))
+# Requests per batch file (the Batch API accepts up to 50,000)
+LLM_BATCH_MAX_REQUESTS = int(os.environ.get("LLM_BATCH_MAX_REQUESTS", 50000))
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def _write_json(path, data):
+    """Replace ``path`` atomically, so an interrupted run never leaves a torn manifest"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def _response_content(line):
+    """(content, error) of one line of a batch output or error file"""
+    response = line.get("response") or {}
+    if line.get("error") or response.get("status_code") != 200:
+        error = line.get("error") or response.get("body", {}).get("error") or response
+        return None, json.dumps(error, ensure_ascii=False)
+    return response["body"]["choices"][0]["message"]["content"], None
+
+
+class BatchAnalysis:
+    """
+    One named batch run of the analysis prompt over a set of candidates.
+
+    The manifest (<LLM_BATCH_DIR>/<name>.json) records every submitted batch
+    with the cache key of each request, keyed by candidate id (the batch
+    custom_id). Collected results are appended to <name>-results.jsonl under
+    those keys, which is what the run relies on, and are also put into the
+    LLM response cache so interactive analyses of the same resume and posting
+    hit them. Lookups read the results file first and check the remaining
+    keys in the (size-bounded) cache in bulk. Collecting a batch twice is
+    harmless. A run name belongs to one job posting.
+    """
+
+    def __init__(self, name, job, client=None, cache=None, directory=LLM_BATCH_DIR):
+        self.name = name
+        self.job = job
+        self.client = client
+        self.cache = cache or get_llm_cache()
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, f"{name}.json")
+        self.results_path = os.path.join(directory, f"{name}-results.jsonl")
+        self.errors = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+            if self.manifest["job_id"] != job["id"]:
+                raise ValueError(f"배치 실행 '{name}'은(는) 다른 직무({self.manifest['job_id']})의 "
+                                 f"실행입니다. 다른 --name을 사용하세요")
+        else:
+            self.manifest = {"name": name, "job_id": job["id"], "batches": []}
+
+    def _save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        _write_json(self.manifest_path, self.manifest)
+
+    def _key(self, resume_text):
+        return llm_cache_key(resume_text, self.job["title"], self.job["description"],
+                             self.job["requirements"])
+
+    def _stored(self, keys):
+        """
+        Collected results of this run for the given cache keys.
+
+        Returns:
+            dict: {cache key: result}
+        """
+        stored = {}
+        if not keys or not os.path.exists(self.results_path):
+            return stored
+        with open(self.results_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # a line torn by an interrupted collect
+                if record["key"] in keys:
+                    stored[record["key"]] = record["result"]
+        return stored
+
+    def _lookup(self, keys):
+        """
+        Results for the given cache keys from the results file, else from the
+        LLM response cache (one bulk query, not counted in its statistics).
+
+        Returns:
+            dict: {cache key: result} for the keys that have one
+        """
+        found = self._stored(keys)
+        found.update(self.cache.get_many(set(keys) - set(found)))
+        return found
+
+    def pending(self, candidates):
+        """
+        Candidates that still need a request: no collected result and not part
+        of a batch that is still running or not yet collected.
+        """
+        in_flight = {
+            key for batch in self.manifest["batches"] if not batch["collected"]
+            for key in batch["requests"].values()
+        }
+        keys = [self._key(resume_text) for _, resume_text in candidates]
+        found = self._lookup({key for key in keys if key not in in_flight})
+        return [candidate for candidate, key in zip(candidates, keys)
+                if key not in in_flight and key not in found]
+
+    def submit(self, candidates):
+        """
+        Write request files for the pending candidates and create their batches.
+
+        Returns:
+            int: 새로 제출한 요청 수
+        """
+        pending = self.pending(candidates)
+        for start in range(0, len(pending), LLM_BATCH_MAX_REQUESTS):
+            chunk = pending[start:start + LLM_BATCH_MAX_REQUESTS]
+            number = len(self.manifest["batches"])
+            input_path = os.path.join(self.directory, f"{self.name}-{number}.jsonl")
+            os.makedirs(self.directory, exist_ok=True)
+            requests = {}
+            with open(input_path, "w", encoding="utf-8") as f:
+                for candidate_id, resume_text in chunk:
+                    body = build_analysis_request(resume_text, self.job["title"],
+                                                  self.job["description"],
+                                                  self.job["requirements"])
+                    f.write(json.dumps({"custom_id": candidate_id, "method": "POST",
+                                        "url": BATCH_ENDPOINT, "body": body},
+                                       ensure_ascii=False) + "\n")
+                    requests[candidate_id] = self._key(resume_text)
+            with open(input_path, "rb") as f:
+                data = f.read()
+            uploaded = self.client.call(self.client.api.files.create,
+                                        file=(os.path.basename(input_path), data),
+                                        purpose="batch")
+            batch = self.client.call(self.client.api.batches.create,
+                                     input_file_id=uploaded.id, endpoint=BATCH_ENDPOINT,
+                                     completion_window="24h",
+                                     metadata={"run": self.name, "part": str(number)})
+            self.manifest["batches"].append({
+                "batch_id": batch.id, "input_file_id": uploaded.id, "input_path": input_path,
+                "status": batch.status, "collected": False, "requests": requests,
+            })
+            self._save()
+            print(f"배치 제출: {batch.id} ({len(chunk)}건)")
+        return len(pending)
+
+    def poll(self, interval=LLM_BATCH_POLL_INTERVAL, timeout=None):
+        """
+        Wait for every uncollected batch to finish and collect it.
+
+        Returns:
+            bool: True if all batches were collected, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            waiting = 0
+            for batch in self.manifest["batches"]:
+                if batch["collected"]:
+                    continue
+                info = self.client.call(self.client.api.batches.retrieve, batch["batch_id"])
+                if info.status != batch["status"]:
+                    batch["status"] = info.status
+                    self._save()
+                    print(f"배치 {batch['batch_id']}: {info.status}")
+                if info.status in TERMINAL_STATUSES:
+                    self._collect(batch, info)
+                else:
+                    waiting += 1
+            if not waiting:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+    def _collect(self, batch, info):
+        """Store the results of a finished batch and record failed requests"""
+        requests = batch["requests"]
+        stored = 0
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.results_path, "a", encoding="utf-8") as results_file:
+            for file_id in (info.output_file_id, info.error_file_id):
+                if not file_id:
+                    continue
+                content = self.client.call(self.client.api.files.content, file_id).text
+                for raw in content.splitlines():
+                    if not raw.strip():
+                        continue
+                    line = json.loads(raw)
+                    key = requests.get(line.get("custom_id"))
+                    if key is None:
+                        continue
+                    text, error = _response_content(line)
+                    if error is None:
+                        try:
+                            result = parse_analysis_response(text)
+                        except ValueError as e:
+                            error = f"JSON 파싱 실패: {e}"
+                        else:
+                            results_file.write(json.dumps({"key": key, "result": result},
+                                                          ensure_ascii=False) + "\n")
+                            self.cache.put(key, result)
+                            stored += 1
+                            continue
+                    self.errors[line["custom_id"]] = error
+            # the batch is only marked collected once its results are on disk
+            results_file.flush()
+            os.fsync(results_file.fileno())
+        if info.status != "completed" and stored < len(requests):
+            for candidate_id in requests:
+                self.errors.setdefault(candidate_id, f"배치 {info.status}")
+        batch["collected"] = True
+        self._save()
+        print(f"배치 {batch['batch_id']} 수집: 성공 {stored}건, 실패 {len(requests) - stored}건")
+
+    def results(self, candidates):
+        """
+        Returns:
+            list: 입력 순서대로 {"candidate_id", "result", "error"}
+        """
+        keys = [self._key(resume_text) for _, resume_text in candidates]
+        found = self._lookup(set(keys))
+        rows = []
+        for (candidate_id, _), key in zip(candidates, keys):
+            result = found.get(key)
+            error = None if result is not None else self.errors.get(candidate_id, "결과 없음")
+            rows.append({"candidate_id": candidate_id, "result": result, "error": error})
+        return rows
+
+    def run(self, candidates, interval=LLM_BATCH_POLL_INTERVAL, timeout=None):
+        """
+        Submit what is missing, wait for the batches and return every candidate's result.
+
+        Args:
+            candidates (list): [(candidate_id, resume_text)]
+            interval (float): 상태 확인 간격(초)
+            timeout (float): 최대 대기 시간(초), None이면 끝날 때까지
+
+        Returns:
+            list: 입력 순서대로 {"candidate_id", "result", "error"}
+        """
+        ids = [candidate_id for candidate_id, _ in candidates]
+        if len(set(ids)) != len(ids):
+            raise ValueError("candidate_id가 중복되었습니다")
+        self.submit(candidates)
+        self.poll(interval, timeout)
+        return self.results(candidates)
+
+
+def read_candidates(path):
+    """Read (candidate_id, resume_text) pairs from a JSONL file"""
+    candidates = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                candidates.append((str(record["candidate_id"]), record["resume_text"]))
+    return candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("candidates", help="JSONL of {candidate_id, resume_text}")
+    parser.add_argument("output", help="JSONL to write {candidate_id, result, error} to")
+    parser.add_argument("--job", required=True, help="job id (job_data.get_job_details)")
+    parser.add_argument("--name", help="run name for the manifest (default: the job id)")
+    parser.add_argument("--poll-interval", type=float, default=LLM_BATCH_POLL_INTERVAL)
+    parser.add_argument("--timeout", type=float, help="stop waiting after this many seconds")
+    args = parser.parse_args()
+
+    # get_job_details() falls back to a default posting for unknown ids
+    job = get_job_details(args.job)
+    if job["id"] != args.job:
+        parser.error(f"unknown job id: {args.job}")
+    client = get_llm_client()
+    if client is None:
+        parser.error("OpenAI API key not configured (OPENAI_API_KEY)")
+    try:
+        run = BatchAnalysis(args.name or args.job, job, client)
+    except ValueError as e:
+        parser.error(str(e))
+    rows = run.run(read_candidates(args.candidates), args.poll_interval, args.timeout)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    failed = sum(row["result"] is None for row in rows)
+    print(f"{len(rows)}명 중 {len(rows) - failed}명 분석 완료, {failed}명 실패 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
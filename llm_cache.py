@@ -0,0 +1,232 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+
+# Location, size bound and entry lifetime of the on-disk cache (overridable via environment)
+LLM_CACHE_PATH = os.environ.get(
+    "LLM_CACHE_PATH", os.path.join(".cache", "llm_cache.sqlite3"))
+LLM_CACHE_MAX_BYTES = int(os.environ.get("LLM_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", 7 * 24 * 3600))
+# Skip cache reads everywhere (fresh results are still stored)
+LLM_CACHE_BYPASS = os.environ.get("LLM_CACHE_BYPASS", "0") == "1"
+
+
+def _digest(value):
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def make_llm_cache_key(model, template_version, resume_text, job_title, job_description,
+                       job_requirements):
+    """
+    Build the cache key of one LLM resume analysis.
+
+    Args:
+        model (str): 모델 이름
+        template_version (str): Version of the prompt template
+        resume_text (str): 이력서 텍스트
+        job_title (str): 직무 제목
+        job_description (str): 직무 설명
+        job_requirements (list): 직무 요구사항 목록
+
+    Returns:
+        str: Cache key
+    """
+    job = _digest([job_title, job_description, list(job_requirements)])
+    return f"{model}:{template_version}:{_digest(resume_text)}:{job}"
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of parsed LLM analysis results.
+
+    Entries expire ``ttl`` seconds after they were stored and are evicted
+    least-recently-used first once the stored JSON exceeds ``max_bytes``.
+    Every operation opens its own connection, so one instance can be shared
+    by Streamlit sessions, the background analysis loop and several server
+    processes. Cache errors never propagate: a broken cache behaves like a miss.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, max_bytes=LLM_CACHE_MAX_BYTES, ttl=LLM_CACHE_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS responses (
+                            key TEXT PRIMARY KEY,
+                            result TEXT NOT NULL,
+                            size INTEGER NOT NULL,
+                            created_at REAL NOT NULL,
+                            last_access REAL NOT NULL
+                        )""")
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_responses_access "
+                        "ON responses (last_access)")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS counters (
+                            name TEXT PRIMARY KEY,
+                            value INTEGER NOT NULL
+                        )""")
+                    self._initialized = True
+        return conn
+
+    def _bump(self, conn, name, amount=1):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + ?", (name, amount, amount))
+
+    def get(self, key):
+        """Return the cached result for ``key``, or None on a miss or expired entry"""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT result, created_at FROM responses WHERE key = ?",
+                                   (key,)).fetchone()
+                if row is not None and row[1] < now - self.ttl:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._bump(conn, "expirations")
+                    row = None
+                if row is None:
+                    self._bump(conn, "misses")
+                    return None
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self._bump(conn, "hits")
+                return json.loads(row[0])
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def get_many(self, keys):
+        """
+        Look up many keys at once, for bulk jobs (llm_batch).
+
+        Unlike get(), this neither counts hits and misses nor touches
+        last_access, so bulk lookups do not skew the interactive statistics.
+
+        Returns:
+            dict: {key: result} for the keys with an unexpired entry
+        """
+        keys = list(keys)
+        found = {}
+        oldest = time.time() - self.ttl
+        try:
+            conn = self._connect()
+            try:
+                # stay below SQLite's limit on bound parameters per statement
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    rows = conn.execute(
+                        "SELECT key, result FROM responses WHERE created_at >= ? "
+                        f"AND key IN ({', '.join('?' * len(chunk))})", [oldest, *chunk])
+                    for key, payload in rows:
+                        found[key] = json.loads(payload)
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError):
+            pass
+        return found
+
+    def put(self, key, result):
+        """Store ``result``, dropping expired entries and evicting old ones if over budget"""
+        payload = json.dumps(result, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, result, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)", (key, payload, size, now, now))
+                expired = conn.execute("DELETE FROM responses WHERE created_at < ?",
+                                       (now - self.ttl,)).rowcount
+                if expired > 0:
+                    self._bump(conn, "expirations", expired)
+                self._evict(conn)
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._bump(conn, "evictions", len(victims))
+
+    def stats(self):
+        """
+        Return hit statistics for sizing the cache.
+
+        Returns:
+            dict: {"hits", "misses", "evictions", "expirations", "entries", "bytes", "hit_rate"}
+        """
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "entries": 0, "bytes": 0}
+        try:
+            conn = self._connect()
+            try:
+                for name, value in conn.execute("SELECT name, value FROM counters"):
+                    stats[name] = value
+                stats["entries"], stats["bytes"] = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM responses")
+                conn.execute("DELETE FROM counters")
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Return the process-wide LLM response cache instance"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache()
+    return _cache
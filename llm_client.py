@@ -0,0 +1,291 @@
+import os
+import time
+import logging
+import asyncio
+import random
+import threading
+import email.utils
+
+import openai
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Endpoint; point it at a local OpenAI-compatible server for testing
+LLM_BASE_URL = os.environ.get("OPENAI_BASE_URL") or None
+# Per-request timeouts in seconds (read covers the whole response wait)
+LLM_CONNECT_TIMEOUT = float(os.environ.get("LLM_CONNECT_TIMEOUT", 5.0))
+LLM_READ_TIMEOUT = float(os.environ.get("LLM_READ_TIMEOUT", 60.0))
+# Retries on 429/5xx/connection errors, with jittered exponential backoff
+LLM_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", 4))
+LLM_BACKOFF_BASE = float(os.environ.get("LLM_BACKOFF_BASE", 0.5))
+LLM_BACKOFF_MAX = float(os.environ.get("LLM_BACKOFF_MAX", 20.0))
+# Requests in flight at once across the process; also the pool size
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", 8))
+LLM_KEEPALIVE_EXPIRY = float(os.environ.get("LLM_KEEPALIVE_EXPIRY", 60.0))
+
+
+def get_api_key():
+    """
+    OpenAI API 키를 반환합니다. st.secrets["API_KEY"]를 우선하고, 없으면
+    OPENAI_API_KEY 환경 변수를 사용합니다.
+
+    Returns:
+        str: API 키, 설정되지 않은 경우 None
+    """
+    try:
+        return st.secrets["API_KEY"]
+    except Exception:
+        return os.environ.get("OPENAI_API_KEY")
+
+
+def _retry_after(error):
+    """Seconds requested by a Retry-After header, if the server sent one"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(error):
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class LLMClient:
+    """
+    Long-lived OpenAI client shared by every analysis in the process.
+
+    One HTTP connection pool is kept alive across calls, so requests after the
+    first skip the TCP/TLS handshake. The SDK's own retries are disabled in
+    favour of full-jitter exponential backoff on 429, 5xx, timeouts and
+    connection errors (a Retry-After header takes precedence), and a semaphore
+    caps the requests in flight; backoff sleeps do not hold a slot.
+    """
+
+    def __init__(self, api_key, base_url=None, max_retries=LLM_MAX_RETRIES,
+                 backoff_base=LLM_BACKOFF_BASE, backoff_max=LLM_BACKOFF_MAX,
+                 max_concurrency=LLM_MAX_CONCURRENCY):
+        self.api_key = api_key
+        self.base_url = base_url or LLM_BASE_URL
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrency = max_concurrency
+        self.timeout = openai.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+        # the SDK's limits type is httpx.Limits or httpx2.Limits depending on its version
+        limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=max_concurrency, max_keepalive_connections=max_concurrency,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY)
+        self._client = self._build_client(limits)
+        self._slots = self._build_slots()
+        self._lock = threading.Lock()
+        self._counts = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _build_client(self, limits):
+        http_client = openai.DefaultHttpxClient(limits=limits, timeout=self.timeout)
+        return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0,
+                             timeout=self.timeout, http_client=http_client)
+
+    def _build_slots(self):
+        return threading.BoundedSemaphore(self.max_concurrency)
+
+    def backoff(self, attempt, error=None):
+        """Delay before retry number ``attempt`` (0-based)"""
+        requested = _retry_after(error) if error is not None else None
+        if requested is not None:
+            return min(requested, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _bump(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _retry_delay(self, attempt, error):
+        """Seconds to wait before retrying after ``error``, or None to give up"""
+        if not _is_retryable(error) or attempt >= self.max_retries:
+            self._bump("failures")
+            return None
+        delay = self.backoff(attempt, error)
+        logger.warning("LLM 요청 재시도 %d/%d (%s), %.2f초 후",
+                       attempt + 1, self.max_retries, type(error).__name__, delay)
+        self._bump("retries")
+        return delay
+
+    @property
+    def api(self):
+        """The underlying openai client, for endpoints without a wrapper here"""
+        return self._client
+
+    def call(self, method, *args, **kwargs):
+        """
+        ``api``의 메서드(예: api.files.create)를 재시도와 동시성 제한을 적용해 호출합니다.
+
+        Raises:
+            openai.OpenAIError: 재시도할 수 없는 오류이거나 재시도 횟수를 모두 사용한 경우
+        """
+        self._bump("requests")
+        attempt = 0
+        while True:
+            try:
+                with self._slots:
+                    return method(*args, **kwargs)
+            except openai.OpenAIError as error:
+                delay = self._retry_delay(attempt, error)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+
+    def chat_completion(self, **kwargs):
+        """
+        client.chat.completions.create()를 재시도와 동시성 제한을 적용해 호출합니다.
+
+        Args:
+            **kwargs: chat.completions.create()에 전달할 인자 (model, messages 등).
+                timeout을 지정하면 기본 요청 타임아웃 대신 사용합니다.
+
+        Returns:
+            ChatCompletion: API 응답
+
+        Raises:
+            openai.OpenAIError: 재시도할 수 없는 오류이거나 재시도 횟수를 모두 사용한 경우
+        """
+        return self.call(self._client.chat.completions.create, **kwargs)
+
+    def stats(self):
+        """
+        Returns:
+            dict: {"requests", "retries", "failures"} 누적 횟수
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self):
+        """Close the pooled connections"""
+        self._client.close()
+
+
+class AsyncLLMClient(LLMClient):
+    """
+    Asyncio counterpart of LLMClient with the same pooling, timeouts and
+    backoff. Its semaphore and connection pool belong to the event loop that
+    first uses it, so it must only be used from that loop.
+    """
+
+    def _build_client(self, limits):
+        http_client = openai.DefaultAsyncHttpxClient(limits=limits, timeout=self.timeout)
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0,
+                                  timeout=self.timeout, http_client=http_client)
+
+    def _build_slots(self):
+        return asyncio.Semaphore(self.max_concurrency)
+
+    async def call(self, method, *args, **kwargs):
+        """LLMClient.call()의 비동기 버전 (``method``는 api의 코루틴 메서드)"""
+        self._bump("requests")
+        attempt = 0
+        while True:
+            try:
+                async with self._slots:
+                    return await method(*args, **kwargs)
+            except openai.OpenAIError as error:
+                delay = self._retry_delay(attempt, error)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def chat_completion(self, **kwargs):
+        """LLMClient.chat_completion()의 비동기 버전"""
+        return await self.call(self._client.chat.completions.create, **kwargs)
+
+    async def stream_chat_completion(self, **kwargs):
+        """
+        chat_completion()의 스트리밍 버전으로, 응답 텍스트 조각을 도착하는 대로 생성합니다.
+        재시도는 스트림이 열리기 전의 오류에만 적용되며, 스트림이 끝날 때까지
+        동시 요청 슬롯 하나를 사용합니다.
+
+        Yields:
+            str: 응답 메시지 내용 조각
+        """
+        self._bump("requests")
+        attempt = 0
+        while True:
+            await self._slots.acquire()
+            try:
+                stream = await self._client.chat.completions.create(stream=True, **kwargs)
+            except BaseException as error:
+                self._slots.release()
+                if not isinstance(error, openai.OpenAIError):
+                    raise
+                delay = self._retry_delay(attempt, error)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                self._slots.release()
+                await stream.close()
+            return
+
+    async def close(self):
+        """Close the pooled connections"""
+        await self._client.close()
+
+
+_clients = {}
+_client_lock = threading.Lock()
+
+
+def _shared_client(cls, api_key):
+    base_url = LLM_BASE_URL
+    client = _clients.get(cls)
+    if client is not None and client.api_key == api_key and client.base_url == base_url:
+        return client
+    with _client_lock:
+        client = _clients.get(cls)
+        if client is None or client.api_key != api_key or client.base_url != base_url:
+            # the old client is left open: other threads may still be using it
+            client = _clients[cls] = cls(api_key, base_url=base_url)
+        return client
+
+
+def get_llm_client():
+    """
+    Return the process-wide LLM client, or None when no API key is configured.
+
+    The client is rebuilt only if the API key or base URL changes.
+    """
+    api_key = get_api_key()
+    if not api_key:
+        return None
+    return _shared_client(LLMClient, api_key)
+
+
+def get_async_llm_client(api_key):
+    """
+    Return the process-wide asyncio LLM client (see AsyncLLMClient).
+
+    The key is passed in because st.secrets is read on the script thread,
+    not on the event loop running the request.
+    """
+    return _shared_client(AsyncLLMClient, api_key)
@@ -0,0 +1,198 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from PIL import Image, ImageOps
+import pytesseract
+
+# Keep each tesseract process single-threaded so CPU use scales with the pool size only
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+OCR_LANG = "kor+eng"
+# Maximum number of tesseract processes running at once (per server process)
+OCR_MAX_WORKERS = int(os.environ.get("OCR_MAX_WORKERS", 2))
+# Wall-clock budget for one image, including time spent waiting for a worker.
+# Sandboxed extraction workers lower it to fit their own budget (extract_worker.py).
+OCR_TIMEOUT = float(os.environ.get("OCR_TIMEOUT", 60))
+# Images wider than this are downscaled before recognition (~300 DPI A4 width)
+OCR_MAX_WIDTH = 2480
+# Images taller than this are recognized as horizontal strips
+OCR_TILE_HEIGHT = 3508
+# How far around a strip boundary to look for a blank row to cut on
+OCR_TILE_SEARCH = 120
+
+
+class OCRError(Exception):
+    """OCR failed or timed out"""
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the shared OCR worker pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=OCR_MAX_WORKERS, thread_name_prefix="ocr")
+    return _executor
+
+
+def _otsu_threshold(histogram):
+    """Return the Otsu threshold for a 256-bin grayscale histogram"""
+    total = sum(histogram)
+    sum_all = sum(i * count for i, count in enumerate(histogram))
+    sum_bg = weight_bg = 0
+    best_threshold, best_variance = 127, 0.0
+    for level, count in enumerate(histogram):
+        weight_bg += count
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += level * count
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = level, variance
+    return best_threshold
+
+
+def preprocess_image(img, max_width=OCR_MAX_WIDTH):
+    """
+    Prepare an image for recognition: downscale, grayscale and binarize.
+
+    JPEGs that have not been loaded yet are decoded in draft mode, letting
+    libjpeg downscale during decoding instead of materializing the full image.
+
+    Args:
+        img (PIL.Image.Image): Image opened with Image.open
+        max_width (int): Target maximum width in pixels
+
+    Returns:
+        PIL.Image.Image: Binarized ("L" mode, 0/255) image
+    """
+    if img.width > max_width:
+        scale = max_width / img.width
+        target = (max_width, max(1, int(img.height * scale)))
+        if img.format == "JPEG":
+            img.draft("L", target)  # no-op once the image has been loaded
+        if img.width > max_width:
+            img = img.resize((max_width, max(1, int(img.height * max_width / img.width))),
+                             Image.LANCZOS)
+
+    img = ImageOps.exif_transpose(img)
+    img = img.convert("L")
+    threshold = _otsu_threshold(img.histogram())
+    return img.point(lambda value: 255 if value > threshold else 0)
+
+
+def _cut_rows(img, tile_height=OCR_TILE_HEIGHT, search=OCR_TILE_SEARCH):
+    """Choose strip boundaries near multiples of tile_height that fall on blank rows"""
+    # Average brightness per row: a width-1 box resize is much cheaper than a pixel loop
+    row_means = list(img.resize((1, img.height), Image.BOX).getdata())
+    cuts = [0]
+    while img.height - cuts[-1] > tile_height:
+        target = cuts[-1] + tile_height
+        window = range(max(cuts[-1] + 1, target - search), min(img.height, target + search))
+        cuts.append(max(window, key=lambda row: row_means[row]))
+    cuts.append(img.height)
+    return cuts
+
+
+def _recognize_tile(tile, lang, timeout):
+    return pytesseract.image_to_string(tile, lang=lang, timeout=timeout)
+
+
+def _submit(img, lang, timeout):
+    """Preprocess an image and queue its strips on the worker pool"""
+    try:
+        prepared = preprocess_image(img)
+    except MemoryError:
+        raise  # let sandboxed extraction workers report the memory cap
+    except Exception as e:
+        raise OCRError(f"이미지 전처리 실패: {e}") from e
+
+    cuts = _cut_rows(prepared)
+    executor = _get_executor()
+    return [executor.submit(_recognize_tile,
+                            prepared.crop((0, top, prepared.width, bottom)), lang, timeout)
+            for top, bottom in zip(cuts, cuts[1:])]
+
+
+def _collect(futures, deadline):
+    """Wait for an image's strips and join their text in order"""
+    try:
+        return "\n".join(
+            future.result(timeout=max(0, deadline - time.monotonic()))
+            for future in futures)
+    except FutureTimeoutError as e:
+        raise OCRError("OCR 처리 시간이 초과되었습니다.") from e
+    except (pytesseract.TesseractError, pytesseract.TesseractNotFoundError,
+            RuntimeError, OSError) as e:
+        raise OCRError(f"OCR 처리 실패: {e}") from e
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def recognize(img, lang=OCR_LANG, timeout=None):
+    """
+    Run OCR on an image using the shared, bounded worker pool.
+
+    Tall scans are split into strips on blank rows and recognized in parallel.
+
+    Args:
+        img (PIL.Image.Image): Image to recognize
+        lang (str): Tesseract language codes
+        timeout (float): Wall-clock budget for the whole image, in seconds
+            (defaults to OCR_TIMEOUT)
+
+    Returns:
+        str: Recognized text
+
+    Raises:
+        OCRError: If tesseract is unavailable, fails or exceeds the timeout
+    """
+    if timeout is None:
+        timeout = OCR_TIMEOUT
+    deadline = time.monotonic() + timeout
+    return _collect(_submit(img, lang, timeout), deadline)
+
+
+def recognize_many(images, lang=OCR_LANG, timeout=None):
+    """
+    Run OCR on several images at once, sharing the worker pool between them.
+
+    Args:
+        images (list): PIL images to recognize
+        lang (str): Tesseract language codes
+        timeout (float): Wall-clock budget for the whole batch, in seconds
+            (defaults to OCR_TIMEOUT)
+
+    Returns:
+        list: Recognized text per image, or None where recognition failed
+    """
+    if timeout is None:
+        timeout = OCR_TIMEOUT
+    deadline = time.monotonic() + timeout
+    pending = []
+    for img in images:
+        try:
+            pending.append(_submit(img, lang, timeout))
+        except OCRError:
+            pending.append(None)
+
+    results = []
+    for futures in pending:
+        try:
+            results.append(None if futures is None else _collect(futures, deadline))
+        except OCRError:
+            results.append(None)
+    return results
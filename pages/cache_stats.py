@@ -0,0 +1,45 @@
+import streamlit as st
+
+from analysis_cache import get_analysis_cache
+from cascade import cascade_stats
+from extraction_cache import get_extraction_cache
+from llm_cache import get_llm_cache
+
+st.set_page_config(page_title="캐시 통계", layout="wide")
+
+st.title("캐시 통계")
+st.caption("캐시 크기 조정을 위한 적중률 지표입니다. 분석 결과 캐시는 현재 서버 프로세스 기준, 디스크 캐시는 모든 프로세스 합계입니다.")
+
+analysis = get_analysis_cache().stats()
+st.markdown("### 분석 결과 캐시")
+col1, col2, col3 = st.columns(3)
+col1.metric("적중률", f"{analysis['hit_rate']:.1%}")
+col2.metric("저장 항목", f"{analysis['entries']} / {analysis['capacity']}")
+col3.metric("축출 · 무효화", f"{analysis['evictions']} · {analysis['invalidations']}")
+st.json(analysis, expanded=False)
+
+llm = get_llm_cache().stats()
+st.markdown("### LLM 응답 캐시")
+col1, col2, col3 = st.columns(3)
+col1.metric("적중률", f"{llm['hit_rate']:.1%}")
+col2.metric("저장 항목", f"{llm['entries']}", f"{llm['bytes'] / 1024:.0f} KB",
+            delta_color="off")
+col3.metric("만료 · 축출", f"{llm['expirations']} · {llm['evictions']}")
+st.json(llm, expanded=False)
+
+escalation = cascade_stats()
+st.markdown("### 규칙 → LLM 전환 (캐스케이드)")
+col1, col2, col3 = st.columns(3)
+col1.metric("LLM 전환율", f"{escalation['escalation_rate']:.1%}",
+            f"{escalation['escalated']} / {escalation['assessed']} 건", delta_color="off")
+col2.metric("추출 항목 부족", f"{escalation['few_fields']}")
+col3.metric("합격 기준선 근접", f"{escalation['borderline']}")
+st.json(escalation, expanded=False)
+
+extraction = get_extraction_cache().stats()
+st.markdown("### 텍스트 추출 캐시")
+col1, col2 = st.columns(2)
+col1.metric("적중률", f"{extraction['hit_rate']:.1%}")
+col2.metric("저장 항목", f"{extraction['entries']}", f"{extraction['bytes'] / 1024:.0f} KB",
+            delta_color="off")
+st.json(extraction, expanded=False)
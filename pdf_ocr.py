@@ -0,0 +1,109 @@
+import os
+import time
+
+import ocr_engine
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Rasterizing is optional: without it scanned pages keep their (empty) text
+    pdfium = None
+
+# A page needs OCR when it has fewer usable characters per square inch than this
+# (an A4 page is ~97 sq in, so 0.2 means fewer than ~20 readable characters)
+MIN_CHAR_DENSITY = 0.2
+# ... or when less than this share of its characters are Hangul/Latin/digits/punctuation
+MIN_USABLE_RATIO = 0.5
+# Rasterization DPI bounds; the DPI is chosen so the page renders at OCR_MAX_WIDTH
+MIN_OCR_DPI = 150
+MAX_OCR_DPI = 300
+# Pages rasterized at once. A page image is several MB, so long scans are rendered
+# and recognized in batches of this size instead of all at once
+OCR_BATCH_PAGES = int(os.environ.get("OCR_BATCH_PAGES", ocr_engine.OCR_MAX_WORKERS))
+# No new batch is started with less than this many seconds left before the deadline
+MIN_OCR_SECONDS = 1.0
+
+
+def _is_usable_char(char):
+    """Characters expected in a Korean/English resume text layer"""
+    return ("가" <= char <= "힣" or "ㄱ" <= char <= "ㆎ" or " " <= char <= "~"
+            or char in "·•‧–—‘’“”…")
+
+
+def needs_ocr(text, width_pt, height_pt):
+    """
+    Decide cheaply whether a page lacks a usable text layer.
+
+    Args:
+        text (str): Text extracted from the page's text layer
+        width_pt (float): Page width in PDF points
+        height_pt (float): Page height in PDF points
+
+    Returns:
+        bool: True if the page should be rasterized and OCR'd
+    """
+    chars = [char for char in text if not char.isspace()]
+    if not chars:
+        return True
+    usable = sum(1 for char in chars if _is_usable_char(char))
+    area_sq_in = max(1.0, (width_pt / 72) * (height_pt / 72))
+    return usable / area_sq_in < MIN_CHAR_DENSITY or usable / len(chars) < MIN_USABLE_RATIO
+
+
+def choose_dpi(width_pt):
+    """Pick a rendering DPI so the page width maps to about OCR_MAX_WIDTH pixels"""
+    dpi = ocr_engine.OCR_MAX_WIDTH / max(1.0, width_pt / 72)
+    return max(MIN_OCR_DPI, min(MAX_OCR_DPI, dpi))
+
+
+def _render(document, page_num):
+    page = document[page_num]
+    try:
+        width_pt, _ = page.get_size()
+        return page.render(scale=choose_dpi(width_pt) / 72, grayscale=True).to_pil()
+    finally:
+        page.close()
+
+
+def ocr_pages(data, page_numbers, deadline=None):
+    """
+    Rasterize the given PDF pages and OCR them, OCR_BATCH_PAGES at a time.
+
+    Only one batch of page images is held in memory. Once the deadline is
+    near no further batch is started, so a long scan yields the pages that
+    were recognized in time instead of failing as a whole.
+
+    Args:
+        data (bytes): Raw PDF bytes
+        page_numbers (list): Zero-based page indices to OCR
+        deadline (float): time.monotonic() by which OCR must end
+            (defaults to OCR_TIMEOUT from now)
+
+    Returns:
+        dict: page index -> recognized text, for pages that were recognized
+    """
+    if pdfium is None or not page_numbers:
+        return {}
+    if deadline is None:
+        deadline = time.monotonic() + ocr_engine.OCR_TIMEOUT
+
+    recognized = {}
+    batch_size = max(1, OCR_BATCH_PAGES)
+    document = pdfium.PdfDocument(data)
+    try:
+        for start in range(0, len(page_numbers), batch_size):
+            remaining = deadline - time.monotonic()
+            if remaining < MIN_OCR_SECONDS:
+                break  # the remaining pages keep their text layer
+            batch = page_numbers[start:start + batch_size]
+            images = []
+            try:
+                for page_num in batch:
+                    images.append(_render(document, page_num))
+                texts = ocr_engine.recognize_many(images, timeout=remaining)
+            finally:
+                for image in images:
+                    image.close()
+            recognized.update((page_num, text) for page_num, text in zip(batch, texts) if text)
+    finally:
+        document.close()
+    return recognized
@@ -0,0 +1,85 @@
+import io
+import os
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import PyPDF2
+
+# Documents with at least this many pages are split across the process pool;
+# smaller ones are cheaper to extract serially on the calling thread.
+PARALLEL_PAGE_THRESHOLD = 40
+
+# Upper bound on worker processes (defaults to the number of CPUs). Sandboxed
+# extraction workers override it with extract_worker.WORKER_PDF_PROCESSES (1 by
+# default), so with isolation on this pool is only used when that is raised.
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+_executor = None
+
+
+def _get_executor():
+    """Return the shared process pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        # spawn: forking a multi-threaded Streamlit server is not safe
+        _executor = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+    return _executor
+
+
+def _extract_page_range(data, start, stop):
+    """Worker: extract the text of pages [start, stop) from raw PDF bytes"""
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def split_page_ranges(page_count, workers):
+    """
+    Split page indices into contiguous ranges, one per worker.
+
+    Args:
+        page_count (int): Number of pages to extract
+        workers (int): Number of workers
+
+    Returns:
+        list: (start, stop) tuples in page order
+    """
+    workers = max(1, min(workers, page_count))
+    chunk = -(-page_count // workers)  # ceil division
+    return [(start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)]
+
+
+def should_extract_in_parallel(page_count, threshold=None):
+    """Whether a document is large enough to be worth the process pool"""
+    if threshold is None:
+        threshold = PARALLEL_PAGE_THRESHOLD
+    return MAX_WORKERS > 1 and page_count >= threshold
+
+
+def extract_pages_parallel(data, page_count, workers=None):
+    """
+    Extract page texts on the process pool and merge them in page order.
+
+    Args:
+        data (bytes): Raw PDF bytes
+        page_count (int): Number of leading pages to extract
+        workers (int): Number of page ranges to split into (defaults to MAX_WORKERS)
+
+    Returns:
+        list: Page texts, in page order
+    """
+    if page_count <= 0:
+        return []
+    executor = _get_executor()
+    ranges = split_page_ranges(page_count, workers or MAX_WORKERS)
+    futures = [executor.submit(_extract_page_range, data, start, stop)
+               for start, stop in ranges]
+
+    pages = []
+    for future in futures:  # futures are in page order
+        pages.extend(future.result())
+    return pages
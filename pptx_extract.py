@@ -0,0 +1,108 @@
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+# OOXML namespaces used by slide parts
+_NS_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_NS_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_NS_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_NOTES_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+
+_PRESENTATION_PART = "ppt/presentation.xml"
+
+
+def open_pptx(source):
+    """
+    Open a .pptx package without loading its object model or media.
+
+    Args:
+        source: File path or binary file-like object
+
+    Returns:
+        zipfile.ZipFile: The opened package
+
+    Raises:
+        ValueError: If the archive is not a PowerPoint presentation
+    """
+    package = zipfile.ZipFile(source)
+    if _PRESENTATION_PART not in package.NameToInfo:
+        package.close()
+        raise ValueError("PowerPoint 프레젠테이션 파일이 아닙니다.")
+    return package
+
+
+def _rels_path(part):
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+def _read_rels(package, part):
+    """Return {rId: (type, absolute target)} for a part's relationships"""
+    rels_part = _rels_path(part)
+    if rels_part not in package.NameToInfo:
+        return {}
+    base = posixpath.dirname(part)
+    rels = {}
+    root = ET.fromstring(package.read(rels_part))
+    for rel in root.iter(f"{_NS_REL}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(base, rel.get("Target")))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def slide_parts(package):
+    """Return slide part names in presentation order"""
+    rels = _read_rels(package, _PRESENTATION_PART)
+    root = ET.fromstring(package.read(_PRESENTATION_PART))
+    parts = []
+    for slide_id in root.iter(f"{_NS_P}sldId"):
+        rel = rels.get(slide_id.get(f"{_NS_R}id"))
+        if rel and rel[1] in package.NameToInfo:
+            parts.append(rel[1])
+    return parts
+
+
+def _iter_part_paragraphs(package, part):
+    """
+    Stream paragraph texts out of one XML part.
+
+    Every a:p is read regardless of where it sits, so text inside group shapes
+    and table cells is included. Elements are cleared as soon as they are read.
+    """
+    with package.open(part) as stream:
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag == f"{_NS_A}p":
+                pieces = []
+                for child in elem.iter():
+                    if child.tag == f"{_NS_A}t" and child.text:
+                        pieces.append(child.text)
+                    elif child.tag == f"{_NS_A}br":
+                        pieces.append("\v")
+                if pieces:
+                    yield "".join(pieces)
+                elem.clear()
+
+
+def iter_slide_texts(package, include_notes=True):
+    """
+    Lazily yield the text of each slide (and its speaker notes).
+
+    Only slide and notes XML parts are decompressed; embedded media is never read.
+
+    Args:
+        package (zipfile.ZipFile): Package returned by open_pptx
+        include_notes (bool): Append the slide's speaker notes
+
+    Yields:
+        str: Text of the next slide, one paragraph per line
+    """
+    for part in slide_parts(package):
+        lines = list(_iter_part_paragraphs(package, part))
+        if include_notes:
+            for rel_type, target in _read_rels(package, part).values():
+                if rel_type == _NOTES_REL_TYPE and target in package.NameToInfo:
+                    lines.extend(_iter_part_paragraphs(package, target))
+        yield "".join(line + "\n" for line in lines)
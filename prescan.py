@@ -0,0 +1,396 @@
+import re
+import io
+import zlib
+import zipfile
+import itertools
+
+import numpy as np
+from PIL import Image
+
+# Verdicts
+ACCEPT = "accept"
+ACCEPT_WITH_TRUNCATION = "accept_with_truncation"
+REJECT = "reject"
+
+# Guardrails
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+MAX_PDF_PAGES = 500          # more pages than this is rejected outright
+TRUNCATE_PDF_PAGES = 100     # more pages than this is only partially extracted
+MAX_IMAGE_PIXELS = 60_000_000
+MAX_SLIDES = 300
+MAX_PPTX_XML_BYTES = 100 * 1024 * 1024  # uncompressed slide/notes XML (zip-bomb guard)
+
+# Rough per-unit extraction costs used for the estimate, in milliseconds
+PDF_MS_PER_PAGE = 2.0
+OCR_MS_PER_MEGAPIXEL = 400.0
+PPTX_MS_PER_SLIDE = 0.5
+
+_PDF_TAIL_BYTES = 2048
+_OBJECT_WINDOW = 4096            # bytes read at a stream's or xref section's offset
+_MAX_OBJECT_BYTES = 1024 * 1024  # a page tree root with a flat /Kids array can be long
+_MAX_XREF_SECTIONS = 32          # incremental updates followed through /Prev
+_MAX_STREAM_BYTES = 4 * 1024 * 1024  # decompressed xref / object stream (zip-bomb guard)
+_MAX_PREDICTED_BYTES = 64 * 1024     # streams with mixed PNG predictors are decoded per byte
+_FALLBACK_SCAN_BYTES = 1024 * 1024   # head and tail scanned when the xref is unusable
+_MAX_PAGES_CANDIDATES = 64
+_MAX_DICT_SPAN = 8192            # bytes searched either side of a /Type /Pages for its dictionary
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF", re.S)
+_OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)[ \t]+(\d+)[ \t]*\r?\n")
+_PAGES_TYPE = re.compile(rb"/Type\s*/Pages\b")
+_COUNT = re.compile(rb"/Count\s+(\d+)")
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+_SLIDE_PART = re.compile(r"^ppt/slides/slide\d+\.xml$")
+
+
+def _result(verdict, file_type, size, estimated_ms, reason="", **details):
+    result = {
+        "verdict": verdict,
+        "file_type": file_type,
+        "size_bytes": size,
+        "estimated_ms": round(estimated_ms, 1),
+        "reason": reason,
+    }
+    result.update(details)
+    return result
+
+
+def _window(data, start, size=_OBJECT_WINDOW):
+    if start < 0 or start >= len(data):
+        return b""
+    return bytes(data[start:start + size])
+
+
+def _ref(text, key):
+    match = re.search(rb"/" + key + rb"\s+(\d+)\s+\d+\s+R", text)
+    return int(match[1]) if match else None
+
+
+def _int(text, key):
+    match = re.search(rb"/" + key + rb"\s+(\d+)\b(?!\s+\d+\s+R)", text)
+    return int(match[1]) if match else None
+
+
+def _ints(text, key):
+    match = re.search(rb"/" + key + rb"\s*\[([\d\s]*)\]", text)
+    return [int(value) for value in match[1].split()] if match else None
+
+
+def _png_unpredict(raw, columns):
+    """Undo the PNG row predictors (/Predictor >= 10) of an xref stream"""
+    rows = len(raw) // (columns + 1)
+    table = np.frombuffer(raw[:rows * (columns + 1)], dtype=np.uint8).reshape(rows, columns + 1)
+    kinds, values = table[:, 0], table[:, 1:]
+    if np.all(kinds == 2):  # "Up", what PDF writers use: a running column sum
+        return np.cumsum(values, axis=0, dtype=np.uint8).tobytes()
+    if np.all(kinds == 0):
+        return values.tobytes()
+    if len(raw) > _MAX_PREDICTED_BYTES:
+        raise ValueError("mixed PNG predictors in a large stream")
+    previous, decoded = bytes(columns), []
+    for kind, row in zip(kinds.tolist(), values.tolist()):
+        for i in range(columns):
+            left = row[i - 1] if i else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                corner = previous[i - 1] if i else 0
+                guess = left + up - corner
+                nearest = min((abs(guess - left), 0, left), (abs(guess - up), 1, up),
+                              (abs(guess - corner), 2, corner))
+                row[i] = (row[i] + nearest[2]) & 0xFF
+            elif kind != 0:
+                raise ValueError("unsupported PNG predictor")
+        decoded.append(bytes(row))
+        previous = row
+    return b"".join(decoded)
+
+
+class _PdfObjects:
+    """
+    Resolves objects through the cross-reference data, reading only the
+    sections and objects asked for: classic xref tables (entries are looked up
+    by arithmetic, not parsed), xref streams and object streams (PDF 1.5+),
+    following /Prev through incremental updates.
+    """
+
+    def __init__(self, data, startxref):
+        self.data = data
+        self.trailer = None
+        self.sections = []  # (kind, offset)
+        self._streams = {}
+        offset, seen = startxref, set()
+        while offset is not None and offset not in seen and len(seen) < _MAX_XREF_SECTIONS:
+            seen.add(offset)
+            head = _window(data, offset, 32)
+            if head.lstrip().startswith(b"xref"):
+                trailer = self._classic_trailer(offset)
+                self.sections.append(("table", offset))
+            elif _OBJ_HEADER.match(head):
+                trailer = _window(data, offset).split(b"stream", 1)[0]
+                self.sections.append(("stream", offset))
+            else:
+                raise ValueError("startxref does not point at cross-reference data")
+            if self.trailer is None:
+                self.trailer = trailer
+            offset = _int(trailer, b"Prev")
+
+    def _subsections(self, offset):
+        """Yield (first object, count, entries offset) of a classic xref table"""
+        pos = offset + _window(self.data, offset, 32).index(b"xref") + 4
+        while True:
+            match = _XREF_SUBSECTION.match(_window(self.data, pos, 64))
+            if not match:
+                return
+            first, count = int(match[1]), int(match[2])
+            yield first, count, pos + match.end()
+            pos += match.end() + count * 20
+
+    def _classic_trailer(self, offset):
+        end = offset
+        for _, count, entries in self._subsections(offset):
+            end = entries + count * 20
+        text = _window(self.data, end)
+        if b"trailer" not in text:
+            raise ValueError("xref table without trailer")
+        return text[text.index(b"trailer"):]
+
+    def _stream(self, offset):
+        """(dictionary, decoded stream data) of the stream object at ``offset``"""
+        if offset not in self._streams:
+            self._streams[offset] = self._decode_stream(offset)
+        return self._streams[offset]
+
+    def _decode_stream(self, offset):
+        text = _window(self.data, offset)
+        if b"stream" not in text:
+            raise ValueError("not a stream object")
+        head = text[:text.index(b"stream")]
+        start = offset + len(head) + len(b"stream")
+        start += 2 if _window(self.data, start, 2) == b"\r\n" else 1
+        length = _int(head, b"Length")
+        if length is None or length > _MAX_STREAM_BYTES:
+            raise ValueError("stream length missing or too large")
+        raw = _window(self.data, start, length)
+        if b"/Filter" in head:
+            if not re.search(rb"/Filter\s*\[?\s*/FlateDecode\s*\]?", head):
+                raise ValueError("unsupported stream filter")
+            inflater = zlib.decompressobj()
+            raw = inflater.decompress(raw, _MAX_STREAM_BYTES)
+            if inflater.unconsumed_tail:
+                raise ValueError("stream too large")
+        predictor = _int(head, b"Predictor") or 1
+        if predictor >= 10:
+            raw = _png_unpredict(raw, _int(head, b"Columns") or 1)
+        elif predictor != 1:
+            raise ValueError("unsupported predictor")
+        return head, raw
+
+    def _stream_entry(self, offset, number):
+        head, raw = self._stream(offset)
+        widths = _ints(head, b"W")
+        if not widths or len(widths) != 3:
+            raise ValueError("xref stream without /W")
+        index = _ints(head, b"Index") or [0, _int(head, b"Size") or 0]
+        row_size, row = sum(widths), 0
+        for first, count in zip(index[::2], index[1::2]):
+            if first <= number < first + count:
+                entry = raw[(row + number - first) * row_size:][:row_size]
+                fields, pos = [], 0
+                for width in widths:
+                    fields.append(int.from_bytes(entry[pos:pos + width], "big"))
+                    pos += width
+                kind = fields[0] if widths[0] else 1
+                if kind == 1:
+                    return "offset", fields[1]
+                if kind == 2:
+                    return "compressed", fields[1], fields[2]
+                return None
+            row += count
+        return False  # not in this section
+
+    def _entry(self, number):
+        for kind, offset in self.sections:
+            if kind == "table":
+                for first, count, entries in self._subsections(offset):
+                    if first <= number < first + count:
+                        fields = _window(self.data, entries + (number - first) * 20, 20).split()
+                        return ("offset", int(fields[0])) if fields[2:3] == [b"n"] else None
+            else:
+                entry = self._stream_entry(offset, number)
+                if entry is not False:
+                    return entry
+        return None
+
+    def get(self, number):
+        """Text of object ``number`` (at most _MAX_OBJECT_BYTES), or None"""
+        entry = self._entry(number)
+        if entry is None:
+            return None
+        if entry[0] == "offset":
+            text = _window(self.data, entry[1], _MAX_OBJECT_BYTES)
+            match = _OBJ_HEADER.match(text)
+            if not match or int(match[1]) != number:
+                return None
+            return text[match.end():].split(b"endobj", 1)[0]
+        _, stream_number, _ = entry
+        container = self._entry(stream_number)
+        if not container or container[0] != "offset":
+            return None
+        head, raw = self._stream(container[1])
+        first = _int(head, b"First")
+        pairs = [int(value) for value in raw[:first].split()]
+        offsets = dict(zip(pairs[::2], pairs[1::2]))
+        if number not in offsets:
+            return None
+        later = [offset for offset in offsets.values() if offset > offsets[number]]
+        end = first + min(later) if later else len(raw)
+        return raw[first + offsets[number]:end][:_MAX_OBJECT_BYTES]
+
+
+def _pdf_page_count_from_xref(data, startxref):
+    """/Count of the page tree root, found through trailer /Root → catalog /Pages"""
+    objects = _PdfObjects(data, startxref)
+    root = _ref(objects.trailer, b"Root")
+    catalog = objects.get(root) if root is not None else None
+    pages = _ref(catalog, b"Pages") if catalog else None
+    tree = objects.get(pages) if pages is not None else None
+    return _int(tree, b"Count") if tree else None
+
+
+def _pdf_page_count_by_scan(data):
+    """
+    Best-effort fallback for files whose xref is unusable: the largest /Count
+    of a /Pages dictionary in the first and last _FALLBACK_SCAN_BYTES, and a
+    /Type /Page count when that covers the whole file. Each candidate is
+    checked within its own dictionary only, so the scan stays linear.
+    """
+    if len(data) <= 2 * _FALLBACK_SCAN_BYTES:
+        windows = [bytes(data)]
+    else:
+        windows = [_window(data, 0, _FALLBACK_SCAN_BYTES),
+                   _window(data, len(data) - _FALLBACK_SCAN_BYTES, _FALLBACK_SCAN_BYTES)]
+    counts = []
+    for text in windows:
+        for match in itertools.islice(_PAGES_TYPE.finditer(text), _MAX_PAGES_CANDIDATES):
+            start = text.rfind(b"<<", max(0, match.start() - _MAX_DICT_SPAN), match.start())
+            end = text.find(b">>", match.end(), match.end() + _MAX_DICT_SPAN)
+            if start != -1 and end != -1:
+                count = _COUNT.search(text, start, end)
+                if count:
+                    counts.append(int(count[1]))
+    if counts:
+        return max(counts)
+    if len(windows) == 1:
+        return len(_PAGE_OBJECT.findall(windows[0])) or None
+    return None
+
+
+def _pdf_page_count(data, startxref):
+    """
+    Count pages from the page tree without parsing the document.
+
+    Follows the trailer's /Root to the catalog's /Pages object through the
+    cross-reference data, including compressed xref and object streams. Falls
+    back to a bounded scan when the xref is damaged. Returns None when the
+    count cannot be found either way.
+    """
+    try:
+        pages = _pdf_page_count_from_xref(data, startxref)
+    except (ValueError, IndexError, zlib.error):
+        pages = None
+    if pages is None:
+        pages = _pdf_page_count_by_scan(data)
+    return pages
+
+
+def _prescan_pdf(data):
+    size = len(data)
+    if not bytes(data[:1024]).lstrip().startswith(b"%PDF-"):
+        return _result(REJECT, "pdf", size, 0, "PDF 헤더가 없습니다.")
+    startxref = _STARTXREF.findall(bytes(data[-_PDF_TAIL_BYTES:]))
+    if not startxref:
+        return _result(REJECT, "pdf", size, 0, "PDF 트레일러(startxref)가 손상되었습니다.")
+
+    pages = _pdf_page_count(data, int(startxref[-1]))
+    if pages is None:
+        # Page count unknown: extraction stops at the truncation budget anyway
+        return _result(ACCEPT_WITH_TRUNCATION, "pdf", size,
+                       TRUNCATE_PDF_PAGES * PDF_MS_PER_PAGE,
+                       f"페이지 수를 확인할 수 없어 앞 {TRUNCATE_PDF_PAGES}페이지만 분석합니다.",
+                       pages=None)
+    if pages > MAX_PDF_PAGES:
+        return _result(REJECT, "pdf", size, pages * PDF_MS_PER_PAGE,
+                       f"페이지 수({pages})가 최대 허용치({MAX_PDF_PAGES})를 초과합니다.", pages=pages)
+    if pages > TRUNCATE_PDF_PAGES:
+        return _result(ACCEPT_WITH_TRUNCATION, "pdf", size, TRUNCATE_PDF_PAGES * PDF_MS_PER_PAGE,
+                       f"앞 {TRUNCATE_PDF_PAGES}페이지만 분석합니다.", pages=pages)
+    return _result(ACCEPT, "pdf", size, pages * PDF_MS_PER_PAGE, pages=pages)
+
+
+def _prescan_image(data):
+    size = len(data)
+    # Image.open only reads the header; pixel data is not decoded
+    with Image.open(io.BytesIO(data)) as img:
+        width, height = img.size
+    pixels = width * height
+    estimated_ms = pixels / 1_000_000 * OCR_MS_PER_MEGAPIXEL
+    if pixels > MAX_IMAGE_PIXELS:
+        return _result(REJECT, "image", size, estimated_ms,
+                       f"이미지 해상도({width}x{height})가 너무 큽니다.", width=width, height=height)
+    return _result(ACCEPT, "image", size, estimated_ms, width=width, height=height)
+
+
+def _prescan_pptx(data):
+    size = len(data)
+    # Reads only the zip central directory
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        infos = package.infolist()
+    slides = sum(1 for info in infos if _SLIDE_PART.match(info.filename))
+    xml_bytes = sum(info.file_size for info in infos
+                    if info.filename.startswith(("ppt/slides/", "ppt/notesSlides/")))
+    estimated_ms = slides * PPTX_MS_PER_SLIDE + xml_bytes / 1024 / 1024 * 20
+    if slides == 0:
+        return _result(REJECT, "pptx", size, 0, "슬라이드가 없습니다.", slides=0)
+    if slides > MAX_SLIDES or xml_bytes > MAX_PPTX_XML_BYTES:
+        return _result(REJECT, "pptx", size, estimated_ms,
+                       f"슬라이드 수({slides}) 또는 내용 크기가 최대 허용치를 초과합니다.", slides=slides)
+    return _result(ACCEPT, "pptx", size, estimated_ms, slides=slides)
+
+
+def prescan(data, file_type):
+    """
+    Estimate the cost of extracting an upload and decide whether to process it.
+
+    Only cheap metadata is read: the PDF header, trailer, cross-reference data
+    and page tree root, the image header, or the PPTX zip directory. No
+    document is parsed.
+
+    Args:
+        data (bytes | memoryview): Raw upload bytes
+        file_type (str): Internal file type ("pdf", "pptx", "image")
+
+    Returns:
+        dict: verdict (ACCEPT, ACCEPT_WITH_TRUNCATION or REJECT), file_type,
+        size_bytes, estimated_ms, reason, plus pages/slides/width/height
+    """
+    size = len(data)
+    if size > MAX_UPLOAD_BYTES:
+        return _result(REJECT, file_type, size, 0,
+                       f"파일 크기({size / 1024 / 1024:.1f}MB)가 최대 허용치"
+                       f"({MAX_UPLOAD_BYTES / 1024 / 1024:.0f}MB)를 초과합니다.")
+    try:
+        if file_type == "pdf":
+            return _prescan_pdf(data)
+        elif file_type == "image":
+            return _prescan_image(data)
+        elif file_type == "pptx":
+            return _prescan_pptx(data)
+    except Exception as e:
+        return _result(REJECT, file_type, size, 0, f"파일을 읽을 수 없습니다: {str(e)}")
+    return _result(REJECT, file_type, size, 0, "지원하지 않는 파일 형식입니다.")
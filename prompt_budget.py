@@ -0,0 +1,214 @@
+import os
+import re
+import math
+from functools import lru_cache
+
+from lexicons import get_lexicon, get_store
+
+try:
+    import tiktoken
+except ImportError:  # Optional: without it token counts are a conservative estimate
+    tiktoken = None
+
+# Input tokens (system + user message) an analysis prompt may use
+PROMPT_INPUT_BUDGET = int(os.environ.get("PROMPT_INPUT_BUDGET", 3000))
+# Resume text always keeps at least this many tokens, even with a long job posting
+MIN_RESUME_TOKENS = 300
+
+# Lines that are a page number by their form: "- 3 -", "3 / 5", "Page 3", "p. 3", "Page 3 of 5"
+_PAGE_MARKER = re.compile(
+    r"-\s*(?P<dashed>\d+)\s*-|(?P<number>\d+)\s*/\s*(?P<total>\d+)"
+    r"|(?:page|p\.)\s*(?P<page>\d+)(?:\s*(?:of|/)\s*(?P<of>\d+))?", re.I)
+# Page numbers and totals above this are years or scores ("2019 / 2020"), not pages
+# (prescan.MAX_PDF_PAGES)
+_MAX_PAGE_NUMBER = 500
+# A bare number line ("3") only counts as a page number as part of a 1, 2, 3, ...
+# (or 2, 3, ...) sequence with at least this many lines between its members
+_BARE_NUMBER = re.compile(r"\d{1,4}")
+_MIN_PAGE_LINES = 5
+# Shorter lines (bullets, dates, single skills) legitimately repeat and are never deduplicated
+_MIN_DEDUPE_LENGTH = 10
+# Decoration around section titles: "■ 학력사항", "[경력]", "1. 자격증:"
+_HEADER_DECORATION = " \t#*■□●○◆◇▶▷►•·-–—=_[](){}<>【】「」:：0123456789."
+_TRUNCATION_MARK = "(이하 생략)"
+
+
+@lru_cache(maxsize=8)
+def _encoding(model):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text, model="gpt-4o"):
+    """
+    텍스트의 토큰 수를 계산합니다. tiktoken이 없으면 ASCII 4자당 1토큰,
+    그 밖의 문자(한글 등)는 1자당 1토큰으로 넉넉하게 추정합니다.
+
+    Args:
+        text (str): 텍스트
+        model (str): 토크나이저를 고를 모델 이름
+
+    Returns:
+        int: 토큰 수
+    """
+    if tiktoken is not None:
+        return len(_encoding(model).encode(text, disallowed_special=()))
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + len(text) - ascii_chars
+
+
+def compaction_fingerprint():
+    """Identifies the compaction settings, for cache keys of compacted prompts"""
+    return f"{PROMPT_INPUT_BUDGET}-{get_store().fingerprint(['prompt_sections'])}"
+
+
+def _is_page_marker(line):
+    match = _PAGE_MARKER.fullmatch(line)
+    if match is None:
+        return False
+    number = int(match["dashed"] or match["number"] or match["page"])
+    total = int(match["total"] or match["of"] or number)
+    return 0 < number <= total <= _MAX_PAGE_NUMBER
+
+
+def _page_number_lines(lines):
+    """
+    Indexes of the lines that are page numbers.
+
+    Bare numbers ("850", "2015") are kept unless they continue a page
+    sequence, so scores and years on their own line survive.
+    """
+    noise = {index for index, line in enumerate(lines) if _is_page_marker(line)}
+    sequence = []
+    for index, line in enumerate(lines):
+        if not _BARE_NUMBER.fullmatch(line):
+            continue
+        value = int(line)
+        if (sequence and value == sequence[-1][1] + 1
+                and index - sequence[-1][0] > _MIN_PAGE_LINES):
+            sequence.append((index, value))
+        elif len(sequence) < 2 and value in (1, 2):
+            sequence = [(index, value)]
+    if len(sequence) >= 2:
+        noise.update(index for index, _ in sequence)
+    return noise
+
+
+def collapse_whitespace(text):
+    """Collapse runs of spaces and blank lines and drop page-number lines"""
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    noise = _page_number_lines(lines)
+    kept = []
+    for index, line in enumerate(lines):
+        if index in noise:
+            continue
+        if line or (kept and kept[-1]):
+            kept.append(line)
+    while kept and not kept[-1]:
+        kept.pop()
+    return "\n".join(kept)
+
+
+def dedupe_lines(text):
+    """Drop repeats of long lines (page headers/footers, pasted boilerplate)"""
+    seen = set()
+    lines = []
+    for line in text.split("\n"):
+        if len(line) >= _MIN_DEDUPE_LENGTH:
+            if line in seen:
+                continue
+            seen.add(line)
+        elif not line and lines and not lines[-1]:
+            continue  # the repeat between two blank lines is gone
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _section_title(line, titles):
+    title = line.strip(_HEADER_DECORATION).casefold()
+    return title if title in titles else None
+
+
+def _split_sections(text, titles):
+    """[(title or None, lines)] - a section runs from its title line to the next one"""
+    sections = [(None, [])]
+    for line in text.split("\n"):
+        title = _section_title(line, titles)
+        if title is not None:
+            sections.append((title, []))
+        sections[-1][1].append(line)
+    return sections
+
+
+def _join_sections(sections):
+    return "\n".join(line for _, lines in sections for line in lines).strip("\n")
+
+
+def _truncate(text, budget):
+    """Longest prefix of whole lines that fits the budget, with a truncation mark"""
+    lines = text.split("\n")
+    low, high = 0, len(lines)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens("\n".join(lines[:mid] + [_TRUNCATION_MARK])) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return "\n".join(lines[:low] + [_TRUNCATION_MARK])
+
+
+def compact_job_description(job_description):
+    """
+    직무 설명에서 공백 노이즈와 분석과 무관한 블록(복리후생 등)을 제거합니다.
+
+    Args:
+        job_description (str): 직무 설명
+
+    Returns:
+        str: 압축된 직무 설명
+    """
+    boilerplate = {title.casefold() for title in get_lexicon("prompt_sections")["job_boilerplate"]}
+    blocks = collapse_whitespace(job_description).split("\n\n")
+    kept = [block for block in blocks
+            if _section_title(block.split("\n", 1)[0], boilerplate) is None]
+    return "\n\n".join(kept)
+
+
+def fit_resume(resume_text, budget):
+    """
+    이력서 텍스트를 토큰 예산에 맞춥니다.
+
+    공백 정리와 반복 줄 제거는 항상 적용하고, 그래도 예산을 넘으면
+    저신호 섹션(취미, 병역, 자기소개 등)을 정해진 순서대로 제외한 뒤,
+    마지막 수단으로 줄 단위로 뒷부분을 잘라냅니다.
+
+    Args:
+        resume_text (str): 이력서 텍스트
+        budget (int): 이력서에 허용된 토큰 수
+
+    Returns:
+        tuple: (압축된 텍스트, {"dropped_sections": list, "truncated": bool})
+    """
+    text = dedupe_lines(collapse_whitespace(resume_text))
+    report = {"dropped_sections": [], "truncated": False}
+    if count_tokens(text) <= budget:
+        return text, report
+
+    lexicon = get_lexicon("prompt_sections")
+    titles = {title.casefold() for title in lexicon["headers"]}
+    sections = _split_sections(text, titles)
+    for name in lexicon["low_signal"]:
+        name = name.casefold()
+        remaining = [section for section in sections if section[0] != name]
+        if len(remaining) == len(sections):
+            continue
+        sections = remaining
+        report["dropped_sections"].append(name)
+        text = _join_sections(sections)
+        if count_tokens(text) <= budget:
+            return text, report
+
+    report["truncated"] = True
+    return _truncate(text, budget), report
@@ -0,0 +1,114 @@
+import re
+import unicodedata
+from functools import cached_property, lru_cache
+
+_WHITESPACE = re.compile(r"\s+")
+_HANGUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+# Latin/digit tokens; keeps "node.js", "c#", "c++" and "ph.d" in one piece
+_TOKEN = re.compile(r"[0-9a-z][0-9a-z#+]*(?:\.[0-9a-z#+]+)*")
+
+
+def normalize_text(text):
+    """NFKC-normalize (full-width digits/letters, compatibility jamo) and collapse whitespace"""
+    # str.split() splits on exactly the characters re's \s matches, and is much faster
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def text_views(text):
+    """
+    (normalized, folded, compact, token list) of a text.
+
+    Every view of a text joined from lines equals the same view of the lines
+    joined: normalized/folded with " " (skipping empty lines), compact with ""
+    and token lists by concatenation. NFKC never composes across a newline,
+    case folding is context-free and tokens never span a space.
+    """
+    normalized = normalize_text(text)
+    folded = normalized.casefold()
+    compact = folded.replace(" ", "")  # whitespace is already single spaces
+    return normalized, folded, compact, _TOKEN.findall(folded)
+
+
+def keyword_key(keyword):
+    """
+    The form in which ResumeIndex.contains() looks a keyword up.
+
+    Returns:
+        tuple: (field, key) - Hangul keywords are searched whitespace-free in
+        ``compact``; Latin/digit keywords as a space-delimited token sequence
+        (" node.js ") in ``token_text``; anything else as a plain substring of ``folded``
+    """
+    key = normalize_text(keyword).casefold()
+    if _HANGUL.search(key):
+        return "compact", _WHITESPACE.sub("", key)
+    key_tokens = _TOKEN.findall(key)
+    if key_tokens:
+        return "token_text", f" {' '.join(key_tokens)} "
+    return "folded", key
+
+
+class ResumeIndex:
+    """
+    Normalized views and lookup indexes of one resume, built once and shared by all scorers.
+
+    - ``normalized``: NFKC text with whitespace collapsed (for regex rules)
+    - ``folded``: case-folded ``normalized``
+    - ``compact``: ``folded`` without any whitespace, so "정보 처리 기사" == "정보처리기사"
+    - ``tokens``: set of Latin/digit tokens; ``token_text``: the tokens space-joined, padded with spaces
+    - ``bigrams``: set of character bigrams of ``compact``
+
+    Keyword lookups are O(1) set probes; only keywords whose tokens or bigrams
+    are all present are confirmed with a substring check.
+    """
+
+    def __init__(self, text):
+        self.raw = text
+        self.normalized, self.folded, self.compact, token_list = text_views(text)
+        self.tokens = frozenset(token_list)
+        self.token_text = " " + " ".join(token_list) + " "
+        self._hits = {}
+        self._searches = {}
+
+    @cached_property
+    def bigrams(self):
+        return frozenset(self.compact[i:i + 2] for i in range(len(self.compact) - 1))
+
+    def contains(self, keyword):
+        """
+        Whether the resume mentions ``keyword``.
+
+        Keywords with Hangul match anywhere in the whitespace-free text (Korean
+        attaches particles and spacing varies); other keywords must match whole
+        Latin/digit tokens, case-insensitively ("SQL" matches "sql," but not "MySQL").
+        """
+        hit = self._hits.get(keyword)
+        if hit is None:
+            hit = self._hits[keyword] = self._lookup(keyword)
+        return hit
+
+    def _lookup(self, keyword):
+        field, key = keyword_key(keyword)
+        if field == "compact":
+            for i in range(len(key) - 1):
+                if key[i:i + 2] not in self.bigrams:
+                    return False
+            return key in self.compact
+        if field == "token_text":
+            for token in key.split():
+                if token not in self.tokens:
+                    return False
+            return key in self.token_text
+        return bool(key) and key in self.folded
+
+    def search(self, pattern):
+        """re.search over the normalized text, memoized per pattern"""
+        key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        if key not in self._searches:
+            self._searches[key] = re.search(pattern, self.normalized)
+        return self._searches[key]
+
+
+@lru_cache(maxsize=64)
+def get_resume_index(text):
+    """Return the (cached) ResumeIndex for a resume text"""
+    return ResumeIndex(text)
@@ -0,0 +1,460 @@
+import re
+import operator
+import threading
+
+import numpy as np
+
+from lexicons import get_lexicon, get_store
+from resume_index import ResumeIndex, get_resume_index, keyword_key
+
+# Lexicons the rule table reads; their combined fingerprint versions compiled packs
+RULE_LEXICONS = ("scoring_rules", "universities", "majors", "certificates", "skills")
+DEFAULT_SECTION = "$default"
+FEEDBACK_SECTIONS = ("strengths", "improvement_areas", "recommendations")
+
+_COMPARISONS = {
+    ">=": operator.ge, ">": operator.gt, "<": operator.lt, "<=": operator.le, "==": operator.eq,
+}
+_VALUE_TYPES = {"int": int, "float": float, "str": str}
+
+
+def rule_table_fingerprint():
+    """Short hash of the rule table and every vocabulary it references, for cache keys"""
+    return get_store().fingerprint(RULE_LEXICONS)
+
+
+def _describe(template, fields):
+    return template.format(**fields) if template else template
+
+
+def _apply(score, description, action, fields, count=1):
+    """Apply a rule's score (set/add/per_match) and text (describe/append) action"""
+    if "set" in action:
+        score = action["set"]
+    score += action.get("add", 0) + action.get("per_match", 0) * count
+    if "describe" in action:
+        description = _describe(action["describe"], fields)
+    elif "append" in action:
+        description += _describe(action["append"], fields)
+    return score, description
+
+
+def _apply_batch(scores, fired, action, count=1):
+    """Vectorized _apply (score part only) for the candidates where ``fired`` is set"""
+    base = action["set"] if "set" in action else scores
+    return np.where(fired, base + action.get("add", 0) + action.get("per_match", 0) * count, scores)
+
+
+class RulePack:
+    """
+    The rule table compiled for one job title.
+
+    Every keyword the job's rules mention is resolved once to the form the
+    ResumeIndex stores it in, so scoring a resume is one set or substring probe
+    per keyword plus a search of the precompiled patterns a rule actually
+    reaches; the rules themselves then only look results up.
+    """
+
+    def __init__(self, table, job_title):
+        self.job_title = job_title
+        self.pass_score = table["pass_score"]
+        self.min_items = table["min_items"]
+        self.fillers = table["fillers"]
+        self.competencies = table["competencies"].get(
+            job_title, table["competencies"][DEFAULT_SECTION])
+        self.feedback = table["feedback"].get(job_title, table["feedback"][DEFAULT_SECTION])
+
+        self._keywords = {}  # keyword -> (index field, lookup key)
+        self.pattern_rules = []
+        self.qualifications = [
+            {**qualification, "rules": [self._compile_rule(rule) for rule in qualification["rules"]]}
+            for qualification in table["qualifications"]
+        ]
+        for spec in self.competencies.values():
+            if "requires" in spec:
+                self._add_keywords([spec["requires"]])
+        for items in self.feedback.values():
+            for item in items:
+                self._add_keywords(item.get("if_any", ()))
+                self._add_keywords(item.get("if_none", ()))
+        self.lookups = tuple((keyword, field, key) for keyword, (field, key) in self._keywords.items())
+        self.keywords = tuple(self._keywords)
+        self._columns = {keyword: col for col, keyword in enumerate(self.keywords)}
+
+    def _resolve_keywords(self, source):
+        """A keyword list given inline or as {"lexicon", "section"}"""
+        if isinstance(source, (list, tuple)):
+            return tuple(source)
+        lexicon = get_lexicon(source["lexicon"])
+        section = source.get("section")
+        if section is None:
+            return tuple(lexicon.entries)
+        return tuple(lexicon.get(self.job_title if section == "$job" else section))
+
+    def _add_keywords(self, keywords):
+        for keyword in keywords:
+            if keyword not in self._keywords:
+                field, key = keyword_key(keyword)
+                if field == "token_text" and key.count(" ") == 2:
+                    field, key = "token", key.strip()  # single token: set probe
+                self._keywords[keyword] = (field, key)
+
+    def _compile_rule(self, rule):
+        compiled = dict(rule)
+        for kind in ("first_of", "all_of"):
+            if kind in rule:
+                compiled["keywords"] = self._resolve_keywords(rule[kind])
+                self._add_keywords(compiled["keywords"])
+        if "patterns" in rule:
+            if rule.get("value", "str") not in _VALUE_TYPES:
+                raise ValueError(f"알 수 없는 값 형식입니다: {rule['value']}")
+            compiled["compiled_patterns"] = tuple(re.compile(pattern) for pattern in rule["patterns"])
+            compiled["slot"] = len(self.pattern_rules)
+            self.pattern_rules.append(compiled)
+        if not any(kind in rule for kind in ("first_of", "all_of", "patterns")):
+            raise ValueError(f"규칙에 조건이 없습니다: {rule}")
+        return compiled
+
+    def _scan(self, index):
+        """Set of the pack's keywords that occur in the resume"""
+        tokens, compact, token_text = index.tokens, index.compact, index.token_text
+        hits = set()
+        for keyword, field, key in self.lookups:
+            if field == "token":
+                hit = key in tokens
+            elif field == "compact":
+                hit = key in compact
+            elif field == "token_text":
+                hit = key in token_text
+            else:
+                hit = index.contains(keyword)
+            if hit:
+                hits.add(keyword)
+        return hits
+
+    @staticmethod
+    def first_value(patterns, text):
+        """Value of the first pattern (in rule order) that matches, as a 1-tuple"""
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                return (match.group(1) if pattern.groups else match.group(0),)
+        return None
+
+    def score_qualification(self, qualification, hits, value_of):
+        score, description = qualification["base"], qualification["description"]
+        for rule in qualification["rules"]:
+            if "when_below" in rule and score >= rule["when_below"]:
+                continue
+            if "first_of" in rule:
+                keyword = next((k for k in rule["keywords"] if k in hits), None)
+                if keyword is not None:
+                    score, description = _apply(score, description, rule, {"keyword": keyword})
+            elif "all_of" in rule:
+                found = [k for k in rule["keywords"] if k in hits]
+                if found:
+                    score, description = _apply(
+                        score, description, rule, {"keywords": ", ".join(found)}, len(found))
+            else:
+                matched = value_of(rule)
+                if matched is None:
+                    continue
+                try:
+                    value = _VALUE_TYPES[rule.get("value", "str")](matched[0])
+                except (TypeError, ValueError):
+                    continue
+                for band in rule["bands"]:
+                    if "min" not in band or value >= band["min"]:
+                        score, description = _apply(score, description, band, {"value": value})
+                        break
+        if "max" in qualification:
+            score = min(qualification["max"], score)
+        return score, description
+
+    def _competency_score(self, spec, scores, hits):
+        if "score" in spec:
+            return spec["score"]
+        if "requires" in spec and spec["requires"] not in hits:
+            return spec["otherwise"]
+        score = max(scores[name] for name in spec["from"]) + spec.get("offset", 0)
+        if "max" in spec:
+            score = min(spec["max"], score)
+        if "min" in spec:
+            score = max(spec["min"], score)
+        return score
+
+    def _holds(self, item, scores, hits):
+        if "if_score" in item:
+            name, comparison, threshold = item["if_score"]
+            if not _COMPARISONS[comparison](scores[name], threshold):
+                return False
+        if "if_any" in item and not any(k in hits for k in item["if_any"]):
+            return False
+        if "if_none" in item and any(k in hits for k in item["if_none"]):
+            return False
+        return True
+
+    def _pad(self, items, fillers):
+        while len(items) < self.min_items:
+            items.append(next((f for f in fillers if f not in items), fillers[-1]))
+        return items
+
+    def _assemble(self, hits, value_of):
+        """Build the analysis dict from keyword hits and a pattern value lookup"""
+        qualifications = {
+            qualification["name"]: self.score_qualification(qualification, hits, value_of)
+            for qualification in self.qualifications
+        }
+        return self.build_result(qualifications, hits)
+
+    def qualification_dependencies(self, qualification):
+        """(keywords, pattern rule slots) a qualification's score depends on"""
+        keywords = set()
+        slots = set()
+        for rule in qualification["rules"]:
+            keywords.update(rule.get("keywords", ()))
+            if "slot" in rule:
+                slots.add(rule["slot"])
+        return keywords, slots
+
+    def build_result(self, qualifications, hits):
+        """
+        Build the analysis dict from already scored qualifications.
+
+        Args:
+            qualifications (dict): qualification name -> (score, description)
+            hits (set): Keywords found in the resume
+
+        Returns:
+            dict: get_rule_based_analysis()와 같은 구조의 분석 결과
+        """
+        ratings = {}
+        scores = {}
+        descriptions = {}
+        for name, (score, description) in qualifications.items():
+            scores[name], descriptions[name] = score, description
+            ratings[name] = {
+                "score": score,
+                "description": description,
+                "meets_requirement": score >= self.pass_score,
+            }
+
+        result = {"success_rate": int(sum(scores.values()) / len(scores))}
+        for section in FEEDBACK_SECTIONS:
+            items = [item["text"] for item in self.feedback.get(section, ())
+                     if self._holds(item, scores, hits)]
+            result[section] = self._pad(items, self.fillers[section])
+        result["competency_ratings"] = {
+            name: {
+                "score": self._competency_score(spec, scores, hits),
+                "description": _describe(spec["description"], descriptions),
+            }
+            for name, spec in self.competencies.items()
+        }
+        result["qualification_ratings"] = ratings
+        return result
+
+    def evaluate(self, resume_text):
+        """
+        Score one resume.
+
+        Args:
+            resume_text (str): 이력서 텍스트
+
+        Returns:
+            dict: get_rule_based_analysis()와 같은 구조의 분석 결과
+        """
+        index = get_resume_index(resume_text)
+        return self._assemble(
+            self._scan(index),
+            lambda rule: self.first_value(rule["compiled_patterns"], index.normalized))
+
+    def _hit_columns(self, hits, keywords):
+        """(n,) bool: candidates that mention any of ``keywords``"""
+        columns = [self._columns[keyword] for keyword in keywords]
+        if not columns:
+            return np.zeros(hits.shape[0], dtype=bool)
+        return hits[:, columns].any(axis=1)
+
+    def evaluate_batch(self, texts):
+        """
+        Score many resumes at once.
+
+        Keyword hits and pattern values are collected per resume into a hit
+        matrix and value columns; every score, competency rating and feedback
+        condition is then computed with array operations over the whole batch.
+
+        Args:
+            texts (list): 이력서 텍스트 목록
+
+        Returns:
+            BatchScores: 열(column) 단위 점수 배열
+        """
+        count = len(texts)
+        hits = np.zeros((count, len(self.keywords)), dtype=bool)
+        raw_values = [[None] * count for _ in self.pattern_rules]
+        numeric = np.full((len(self.pattern_rules), count), np.nan)
+        for row, text in enumerate(texts):
+            # Built directly: a large batch would only churn the shared index cache
+            index = ResumeIndex(text)
+            hits[row, [self._columns[keyword] for keyword in self._scan(index)]] = True
+            for rule in self.pattern_rules:
+                matched = self.first_value(rule["compiled_patterns"], index.normalized)
+                if matched is None:
+                    continue
+                raw_values[rule["slot"]][row] = matched
+                try:
+                    numeric[rule["slot"], row] = _VALUE_TYPES[rule.get("value", "str")](matched[0])
+                except (TypeError, ValueError):
+                    pass
+
+        scores = {}
+        for qualification in self.qualifications:
+            score = np.full(count, qualification["base"])
+            for rule in qualification["rules"]:
+                eligible = score < rule["when_below"] if "when_below" in rule else np.ones(count, dtype=bool)
+                if "first_of" in rule:
+                    score = _apply_batch(score, eligible & self._hit_columns(hits, rule["keywords"]), rule)
+                elif "all_of" in rule:
+                    columns = [self._columns[keyword] for keyword in rule["keywords"]]
+                    found = hits[:, columns].sum(axis=1) if columns else np.zeros(count, dtype=int)
+                    score = _apply_batch(score, eligible & (found > 0), rule, found)
+                else:
+                    values = numeric[rule["slot"]]
+                    # index of the first band each value falls into, -1 for none
+                    band_of = np.full(count, -1)
+                    for band_num in reversed(range(len(rule["bands"]))):
+                        band = rule["bands"][band_num]
+                        inside = ~np.isnan(values)
+                        if "min" in band:
+                            inside &= values >= band["min"]
+                        band_of = np.where(inside, band_num, band_of)
+                    fired = eligible & (band_of >= 0)
+                    new_score = score
+                    for band_num, band in enumerate(rule["bands"]):
+                        new_score = _apply_batch(new_score, fired & (band_of == band_num), band)
+                    score = new_score
+            if "max" in qualification:
+                score = np.minimum(score, qualification["max"])
+            scores[qualification["name"]] = score
+
+        competencies = {}
+        for name, spec in self.competencies.items():
+            if "score" in spec:
+                competencies[name] = np.full(count, spec["score"])
+                continue
+            score = np.maximum.reduce([scores[source] for source in spec["from"]]) + spec.get("offset", 0)
+            if "max" in spec:
+                score = np.minimum(score, spec["max"])
+            if "min" in spec:
+                score = np.maximum(score, spec["min"])
+            if "requires" in spec:
+                score = np.where(self._hit_columns(hits, [spec["requires"]]), score, spec["otherwise"])
+            competencies[name] = score
+
+        feedback = {}
+        for section in FEEDBACK_SECTIONS:
+            conditions = []
+            for item in self.feedback.get(section, ()):
+                holds = np.ones(count, dtype=bool)
+                if "if_score" in item:
+                    name, comparison, threshold = item["if_score"]
+                    holds &= _COMPARISONS[comparison](scores[name], threshold)
+                if "if_any" in item:
+                    holds &= self._hit_columns(hits, item["if_any"])
+                if "if_none" in item:
+                    holds &= ~self._hit_columns(hits, item["if_none"])
+                conditions.append(holds)
+            feedback[section] = (np.column_stack(conditions) if conditions
+                                 else np.zeros((count, 0), dtype=bool))
+
+        success_rate = (sum(scores.values()) / len(scores)).astype(np.int64)
+        return BatchScores(self, hits, raw_values, scores, competencies, feedback, success_rate)
+
+
+class BatchScores:
+    """
+    Columnar rule-based scores for a batch of resumes (row i = texts[i]).
+
+    Attributes:
+        job_title (str): 평가 직무
+        keywords (tuple): Column labels of ``hits``
+        hits (np.ndarray): (n, keywords) bool keyword hit matrix
+        success_rate (np.ndarray): (n,) int
+        qualification_scores (dict): qualification -> (n,) scores
+        meets_requirement (dict): qualification -> (n,) bool
+        competency_scores (dict): competency -> (n,) scores
+        feedback (dict): section -> (n, items) bool; which of the job's
+            strength/improvement/recommendation rules apply, before padding
+
+    Descriptions and per-candidate dicts are only built by record()/records().
+    """
+
+    def __init__(self, pack, hits, raw_values, qualification_scores, competency_scores,
+                 feedback, success_rate):
+        self._pack = pack
+        self._raw_values = raw_values
+        self.job_title = pack.job_title
+        self.keywords = pack.keywords
+        self.hits = hits
+        self.success_rate = success_rate
+        self.qualification_scores = qualification_scores
+        self.meets_requirement = {name: score >= pack.pass_score
+                                  for name, score in qualification_scores.items()}
+        self.competency_scores = competency_scores
+        self.feedback = feedback
+
+    def __len__(self):
+        return len(self.success_rate)
+
+    def columns(self):
+        """Flat {column name: (n,) array} view, e.g. for pandas.DataFrame(batch.columns())"""
+        columns = {"success_rate": self.success_rate}
+        for name, score in self.qualification_scores.items():
+            columns[f"{name}_score"] = score
+            columns[f"{name}_meets_requirement"] = self.meets_requirement[name]
+        for name, score in self.competency_scores.items():
+            columns[f"competency_{name}"] = score
+        return columns
+
+    def record(self, row):
+        """Analysis dict for one candidate, identical to get_rule_based_analysis()"""
+        hits = {self.keywords[col] for col in np.flatnonzero(self.hits[row])}
+        return self._pack._assemble(hits, lambda rule: self._raw_values[rule["slot"]][row])
+
+    def records(self):
+        """Analysis dicts for every candidate, in input order"""
+        return [self.record(row) for row in range(len(self))]
+
+
+_packs = {}
+_packs_version = None
+_packs_lock = threading.Lock()
+
+
+def get_rule_pack(job_title):
+    """
+    Return the compiled RulePack for a job, rebuilding packs when the rule
+    table or a referenced lexicon has changed.
+    """
+    global _packs, _packs_version
+    version = rule_table_fingerprint()
+    pack = _packs.get(job_title) if version == _packs_version else None
+    if pack is None:
+        with _packs_lock:
+            if version != _packs_version:
+                _packs, _packs_version = {}, version
+            pack = _packs.get(job_title)
+            if pack is None:
+                pack = _packs[job_title] = RulePack(get_lexicon("scoring_rules").entries, job_title)
+    return pack
+
+
+def evaluate(resume_text, job_title):
+    """Score a resume with the compiled rule pack for ``job_title``"""
+    return get_rule_pack(job_title).evaluate(resume_text)
+
+
+def evaluate_batch(texts, job_title):
+    """Score many resumes with the compiled rule pack for ``job_title`` (see RulePack.evaluate_batch)"""
+    return get_rule_pack(job_title).evaluate_batch(texts)
@@ -0,0 +1,137 @@
+import json
+from bisect import bisect_right
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """
+    Incremental parser for one JSON object arriving in chunks.
+
+    feed() scans only the new text and returns the events it completed:
+
+    - ("item", key, value) for each element of a top-level array member, as
+      soon as the element is closed;
+    - ("value", key, value) for each top-level member once its value is
+      closed (arrays too, after their last item).
+
+    Nested values are only decoded once complete, so events never carry
+    partial data. Text before the opening brace (e.g. a code fence) is ignored.
+    Chunks are kept as received and only joined for the values being decoded
+    or when ``text`` is read.
+    """
+
+    def __init__(self):
+        self.done = False
+        self._chunks = []
+        self._offsets = []  # position of each chunk in the full text
+        self._pos = 0
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self._item_start = None
+
+    @property
+    def text(self):
+        """Full text received so far"""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+            self._offsets = [0]
+        return self._chunks[0] if self._chunks else ""
+
+    def _slice(self, start, end):
+        """text[start:end] without joining the chunks outside it"""
+        first = bisect_right(self._offsets, start) - 1
+        last = bisect_right(self._offsets, end - 1)
+        joined = "".join(self._chunks[first:last])
+        base = self._offsets[first]
+        return joined[start - base:end - base]
+
+    def _in_member_array(self):
+        return len(self._stack) == 2 and self._stack[1] == "["
+
+    def _close_item(self, end, events):
+        if self._item_start is not None:
+            events.append(("item", self._key, json.loads(self._slice(self._item_start, end))))
+            self._item_start = None
+
+    def _close_value(self, end, events):
+        if self._value_start is not None:
+            events.append(("value", self._key, json.loads(self._slice(self._value_start, end))))
+        self._key = None
+        self._value_start = None
+
+    def feed(self, chunk):
+        """
+        Args:
+            chunk (str): 다음 응답 텍스트 조각
+
+        Returns:
+            list: 이번 조각으로 완성된 이벤트 목록
+
+        Raises:
+            ValueError: 완성된 값이 올바른 JSON이 아닌 경우
+        """
+        if not chunk:
+            return []
+        self._offsets.append(self._pos)
+        self._chunks.append(chunk)
+        events = []
+        for i, char in enumerate(chunk, self._pos):
+            if self.done:
+                break
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(self._slice(self._key_start, i + 1))
+                        self._key_start = None
+                continue
+            if not self._stack:
+                if char == "{":
+                    self._stack.append(char)
+                continue
+            depth = len(self._stack)
+            if char in _WHITESPACE:
+                continue
+            if depth == 1:
+                if char == "}":
+                    self._close_value(i, events)
+                    self._stack.pop()
+                    self.done = True
+                    continue
+                if char == ",":
+                    self._close_value(i, events)
+                    continue
+                if self._key is None:
+                    if char == '"':
+                        self._in_string = True
+                        self._key_start = i
+                    continue
+                if char == ":" and self._value_start is None:
+                    continue
+                if self._value_start is None:
+                    self._value_start = i
+            elif self._in_member_array():
+                if char == ",":
+                    self._close_item(i, events)
+                    continue
+                if char == "]":
+                    self._close_item(i, events)
+                elif self._item_start is None:
+                    self._item_start = i
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._stack.append(char)
+            elif char in "}]":
+                self._stack.pop()
+        self._pos += len(chunk)
+        return events
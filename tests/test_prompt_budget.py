@@ -0,0 +1,23 @@
+from prompt_budget import collapse_whitespace
+
+PAGE = "\n".join(f"경력 사항 {line}" for line in range(8))
+
+
+def test_bare_numbers_are_kept():
+    text = "TOEIC\n850\n입학\n2015\n졸업\n2019"
+    assert collapse_whitespace(text) == text
+
+
+def test_year_ranges_are_kept():
+    text = "경력\n2019 / 2020\n테크스타트 인턴\n2018/2019\n- 2021 -\n2020 / 2021"
+    assert collapse_whitespace(text) == text
+
+
+def test_page_markers_are_dropped():
+    text = "\n".join([PAGE, "- 1 -", PAGE, "2 / 3", PAGE, "Page 3 of 3", PAGE, "p. 4"])
+    assert collapse_whitespace(text) == "\n".join([PAGE] * 4)
+
+
+def test_bare_page_sequence_is_dropped():
+    text = "\n".join([PAGE, "1", PAGE, "2", PAGE, "3", PAGE, "850"])
+    assert collapse_whitespace(text) == "\n".join([PAGE] * 4 + ["850"])
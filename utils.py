@@ -2,159 +2,276 @@ import streamlit as st
 import PyPDF2
 import io
 import os
+import re
+import time
 from PIL import Image
-import pytesseract
-from pptx import Presentation
+from keyword_matcher import KeywordMatcher
+import extract_backends
+import extract_worker
+import lexicons
+import ocr_engine
+import pdf_ocr
+import prescan
+import pptx_extract
+from extraction_cache import get_extraction_cache, make_cache_key
 
 def display_job_description(job_details):
     """Display job description and requirements in a structured format"""
     # This function is now handled in app.py with HTML/CSS formatting
     pass
 
+# MIME type → internal file type used by the extractors
+SUPPORTED_FILE_TYPES = {
+    "application/pdf": "pdf",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": "pptx",
+    "image/jpeg": "image",
+    "image/jpg": "image",
+    "image/png": "image",
+}
+
+def _as_stream(source):
+    """Return a seekable in-memory stream over an upload without writing it to disk"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    # Streamlit's UploadedFile is already a BytesIO; reuse its buffer instead of copying it
+    source.seek(0)
+    return source
+
+# Bump whenever extraction or translation output changes, to invalidate cached text
+EXTRACTOR_VERSION = "7"
+
+# Extraction budgets: stop reading a PDF once either limit is hit (None = unlimited)
+PDF_PAGE_BUDGET = prescan.TRUNCATE_PDF_PAGES
+PDF_CHAR_BUDGET = 200_000
+
+def _page_needs_ocr(reader, page_num, page_text):
+    """Whether a PDF page has no usable text layer (checked by character density)"""
+    box = reader.pages[page_num].mediabox
+    return pdf_ocr.needs_ocr(page_text, float(box.width), float(box.height))
+
+def _ocr_held(data, held, scanned, deadline):
+    """Texts of the held-back pages, with the scanned ones among them OCR'd"""
+    recognized = pdf_ocr.ocr_pages(data, scanned, deadline)
+    return [recognized.get(page_num, page_text) for page_num, page_text in held]
+
+def _iter_raw_pdf_pages(reader, max_pages, parallel, ocr, backend):
+    """Yield raw page texts from the selected backend, OCR'ing pages without a text layer"""
+    page_count = len(reader.pages)
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+
+    backend = extract_backends.select_backend(reader, backend)
+    page_texts = backend.iter_page_texts(reader, page_count, parallel)
+
+    if not ocr:
+        yield from page_texts
+        return
+
+    # Text-native pages stream straight through; from the first page without a
+    # usable text layer on, pages are held back until pdf_ocr.OCR_BATCH_PAGES
+    # scanned pages are collected, which are then OCR'd together. All batches
+    # share one OCR budget for the document.
+    deadline = time.monotonic() + ocr_engine.OCR_TIMEOUT
+    data = None
+    held, scanned = [], []
+    for page_num, page_text in enumerate(page_texts):
+        if _page_needs_ocr(reader, page_num, page_text):
+            scanned.append(page_num)
+            if data is None:
+                data = reader.stream.getvalue()
+        elif not held:
+            yield page_text
+            continue
+        held.append((page_num, page_text))
+        if len(scanned) >= pdf_ocr.OCR_BATCH_PAGES:
+            yield from _ocr_held(data, held, scanned, deadline)
+            held, scanned = [], []
+    if held:
+        yield from _ocr_held(data, held, scanned, deadline)
+
+def iter_pdf_page_texts(reader, max_pages=PDF_PAGE_BUDGET, max_chars=PDF_CHAR_BUDGET, parallel=True, ocr=True, backend=None):
+    """
+    Lazily yield the text of each PDF page, stopping early once a budget is reached.
+
+    Args:
+        reader (PyPDF2.PdfReader): Parsed PDF document
+        max_pages (int | None): Maximum number of pages to read
+        max_chars (int | None): Maximum number of characters to yield in total;
+            the page that crosses the limit is truncated
+        parallel (bool): Extract documents above PARALLEL_PAGE_THRESHOLD pages
+            on the process pool instead of serially
+        ocr (bool): Rasterize and OCR pages that have no usable text layer
+        backend (str): Extraction backend name, or "auto"; defaults to
+            extract_backends.PDF_BACKEND
+
+    Yields:
+        str: Text of the next page
+    """
+    remaining = max_chars
+    for page_text in _iter_raw_pdf_pages(reader, max_pages, parallel, ocr, backend):
+        if remaining is not None:
+            page_text = page_text[:remaining]
+            remaining -= len(page_text)
+        yield page_text
+        if remaining is not None and remaining <= 0:
+            return
+
+def open_document(source, file_type):
+    """Parse a file path or in-memory buffer once and return the document object"""
+    if file_type == "pdf":
+        reader = PyPDF2.PdfReader(source)
+        len(reader.pages)  # Force the page tree to load so broken files fail here
+        return reader
+    elif file_type == "pptx":
+        return pptx_extract.open_pptx(source)
+    elif file_type == "image":
+        return Image.open(source)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+
+def extract_text_from_document(document, file_type):
+    """Extract text content from an already parsed document"""
+    text = ""
+
+    if file_type == "pdf":
+        # Extract text from PDF page by page and join once
+        text = extract_backends.PAGE_SEPARATOR.join(iter_pdf_page_texts(document))
+
+    elif file_type == "pptx":
+        # Extract text from PowerPoint slide XML (groups, tables and notes included)
+        text = "".join(pptx_extract.iter_slide_texts(document))
+
+    elif file_type == "image":
+        # Extract text from image using the pooled OCR engine (Korean + English)
+        try:
+            text = ocr_engine.recognize(document)
+        except ocr_engine.OCRError:
+            # If tesseract is not available, fails or times out, provide a basic description
+            text = "이미지 기반 이력서. 내용 추출을 위해 고급 OCR 기능이 필요합니다."
+
+    # Translate university names from English to Korean for better matching
+    return translate_university_names(text)
+
 def validate_file(uploaded_file):
     """Validate if the uploaded file is a valid PDF, PPT, or image file"""
-    file_type = uploaded_file.type
+    file_type = SUPPORTED_FILE_TYPES.get(uploaded_file.type)
+    if file_type is None:
+        return False, None
+    scan = prescan.prescan(uploaded_file.getbuffer(), file_type)
+    if scan["verdict"] == prescan.REJECT:
+        st.error(f"파일을 처리할 수 없습니다: {scan['reason']}")
+        return False, None
     try:
-        if file_type == "application/pdf":
-            PyPDF2.PdfReader(io.BytesIO(uploaded_file.getvalue()))
-            return True, "pdf"
-        elif file_type == "application/vnd.openxmlformats-officedocument.presentationml.presentation":
-            Presentation(io.BytesIO(uploaded_file.getvalue()))
-            return True, "pptx"
-        elif file_type in ["image/jpeg", "image/jpg", "image/png"]:
-            Image.open(io.BytesIO(uploaded_file.getvalue()))
-            return True, "image"
-        else:
-            return False, None
+        open_document(_as_stream(uploaded_file), file_type)
+        return True, file_type
     except Exception as e:
         st.error(f"파일 검증 중 오류 발생: {str(e)}")
         return False, None
 
+def ingest_upload(uploaded_file):
+    """
+    Validate an uploaded resume and extract its text in a single pass.
+
+    The upload buffer is parsed exactly once, in memory: the document object
+    built for validation is the one the text is extracted from, and nothing
+    is written to disk. Parsing runs in a sandboxed worker process with a
+    timeout and memory cap unless extract_worker.ISOLATION_ENABLED is off. A metadata-only pre-scan rejects oversized uploads
+    first, and results are cached by content hash, so re-uploading the same
+    file skips parsing entirely.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile (or any object with ``type`` and a BytesIO interface)
+
+    Returns:
+        tuple: (file_type, text). file_type is None if the file is invalid,
+        text is None if the file is valid but extraction failed.
+    """
+    file_type = SUPPORTED_FILE_TYPES.get(uploaded_file.type)
+    if file_type is None:
+        return None, None
+
+    # Cheap metadata-only check before any hashing or parsing
+    data = uploaded_file.getbuffer()
+    scan = prescan.prescan(data, file_type)
+    if scan["verdict"] == prescan.REJECT:
+        st.error(f"파일을 처리할 수 없습니다: {scan['reason']}")
+        return None, None
+    if scan["verdict"] == prescan.ACCEPT_WITH_TRUNCATION:
+        st.warning(scan["reason"])
+
+    # Identical bytes were already validated and extracted: serve the cached text
+    cache = get_extraction_cache()
+    cache_key = make_cache_key(
+        data, file_type,
+        f"{EXTRACTOR_VERSION}/{extract_backends.config_fingerprint()}"
+        f"/{lexicons.get_store().fingerprint(TRANSLATION_LEXICONS)}")
+    cached_text = cache.get(cache_key)
+    if cached_text is not None:
+        return file_type, cached_text
+
+    if extract_worker.ISOLATION_ENABLED:
+        # Parse in a sandboxed worker so a pathological file cannot hang this session
+        result = extract_worker.extract_isolated(data, file_type)
+        if result["status"] == extract_worker.INVALID:
+            st.error(f"파일 검증 중 오류 발생: {result['message']}")
+            return None, None
+        if result["status"] != extract_worker.OK:
+            st.error(f"파일에서 텍스트 추출 중 오류 발생: {result['message']}")
+            return file_type, None
+        text = result["text"]
+    else:
+        try:
+            document = open_document(_as_stream(uploaded_file), file_type)
+        except Exception as e:
+            st.error(f"파일 검증 중 오류 발생: {str(e)}")
+            return None, None
+
+        try:
+            text = extract_text_from_document(document, file_type)
+        except Exception as e:
+            st.error(f"파일에서 텍스트 추출 중 오류 발생: {str(e)}")
+            return file_type, None
+
+    if text:
+        cache.put(cache_key, text)
+    return file_type, text
+
 def extract_text_from_file(file_path, file_type):
     """Extract text content from a file based on its type"""
     try:
-        text = ""
-        
-        if file_type == "pdf":
-            # Extract text from PDF
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text()
-        
-        elif file_type == "pptx":
-            # Extract text from PowerPoint
-            prs = Presentation(file_path)
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text += shape.text + "\n"
-        
-        elif file_type == "image":
-            # Extract text from image using OCR with Korean language support
-            try:
-                img = Image.open(file_path)
-                text = pytesseract.image_to_string(img, lang='kor+eng')
-            except:
-                # If pytesseract is not available or fails, provide a basic description
-                text = "이미지 기반 이력서. 내용 추출을 위해 고급 OCR 기능이 필요합니다."
-        
-        # Translate university names from English to Korean for better matching
-        text = translate_university_names(text)
-        
-        return text
+        document = open_document(file_path, file_type)
+        return extract_text_from_document(document, file_type)
     except Exception as e:
         st.error(f"파일에서 텍스트 추출 중 오류 발생: {str(e)}")
         return None
 
+# English -> Korean vocabularies used to annotate resumes (data/lexicons/*.json)
+TRANSLATION_LEXICONS = ("university_translations", "degree_translations", "skill_translations")
+_LATIN = re.compile(r"[A-Za-z]")
+_translator = (None, None)  # (lexicon fingerprint, matcher)
+
+def _get_translator():
+    """Return the translation matcher, rebuilding it only when a lexicon was reloaded"""
+    global _translator
+    store = lexicons.get_store()
+    fingerprint = store.fingerprint(TRANSLATION_LEXICONS)
+    if _translator[0] != fingerprint:
+        terms = {}
+        for name in TRANSLATION_LEXICONS:
+            terms.update(store.get(name).entries)
+        _translator = (fingerprint, KeywordMatcher(terms, word_boundary=True))
+    return _translator[1]
+
 def translate_university_names(text):
-    """Translate English university names to Korean for better matching in analysis"""
-    # University name translations (English to Korean)
-    university_translations = {
-        # Top tier universities
-        "Seoul National University": "서울대",
-        "Yonsei University": "연세대",
-        "Korea University": "고려대", 
-        "KAIST": "카이스트",
-        "Korea Advanced Institute of Science and Technology": "카이스트",
-        
-        # Good universities
-        "Sungkyunkwan University": "성균관대",
-        "Hanyang University": "한양대", 
-        "Ewha Womans University": "이화여대",
-        "Sogang University": "서강대",
-        "Chung-Ang University": "중앙대",
-        "Kyung Hee University": "경희대",
-        "Hankuk University of Foreign Studies": "한국외대",
-        
-        # Other notable universities
-        "POSTECH": "포항공대",
-        "Pohang University of Science and Technology": "포항공대",
-        "Inha University": "인하대",
-        "Korea University of Technology and Education": "한국기술교육대",
-        "Kookmin University": "국민대",
-        "Konkuk University": "건국대",
-        "Sejong University": "세종대",
-        "Dongguk University": "동국대",
-        "Hongik University": "홍익대"
-    }
-    
-    # Degree translations
-    degree_translations = {
-        "Bachelor": "학사",
-        "Bachelor's": "학사",
-        "Bachelor of Science": "이학사",
-        "Bachelor of Arts": "문학사",
-        "Bachelor of Engineering": "공학사",
-        "Master": "석사",
-        "Master's": "석사",
-        "Master of Science": "이학석사",
-        "Master of Arts": "문학석사",
-        "Master of Engineering": "공학석사",
-        "PhD": "박사",
-        "Ph.D.": "박사",
-        "Doctor of Philosophy": "박사",
-        "Doctorate": "박사"
-    }
-    
-    # Technical skill translations
-    skill_translations = {
-        "Machine Learning": "머신러닝",
-        "Deep Learning": "딥러닝",
-        "Natural Language Processing": "자연어처리",
-        "NLP": "자연어처리",
-        "Computer Vision": "컴퓨터 비전",
-        "Data Science": "데이터 사이언스",
-        "Data Analysis": "데이터 분석",
-        "Artificial Intelligence": "인공지능",
-        "AI": "인공지능",
-        "Software Development": "소프트웨어 개발",
-        "Web Development": "웹 개발",
-        "Mobile Development": "모바일 개발",
-        "Full Stack": "풀스택",
-        "Frontend": "프론트엔드",
-        "Backend": "백엔드",
-        "DevOps": "데브옵스",
-        "Cloud Computing": "클라우드 컴퓨팅",
-        "Database": "데이터베이스",
-        "UI/UX": "UI/UX 디자인",
-        "Project Management": "프로젝트 관리"
-    }
-    
-    # Translate university names
-    for eng_name, kor_name in university_translations.items():
-        text = text.replace(eng_name, f"{eng_name} {kor_name}")
-    
-    # Translate degree names
-    for eng_degree, kor_degree in degree_translations.items():
-        text = text.replace(eng_degree, f"{eng_degree} {kor_degree}")
-    
-    # Translate technical skills
-    for eng_skill, kor_skill in skill_translations.items():
-        text = text.replace(eng_skill, f"{eng_skill} {kor_skill}")
-    
-    return text
+    """
+    Translate English university, degree and skill names to Korean for better matching in analysis.
+
+    Each English term is followed by its Korean name ("KAIST" -> "KAIST 카이스트")
+    in a single leftmost-longest pass, so "Master of Science" is expanded once
+    rather than again for "Master". Text without Latin characters is returned as is.
+    """
+    if not _LATIN.search(text):
+        return text
+    return _get_translator().replace(text, lambda matched, korean: f"{matched} {korean}")
 
 def format_progress_bar(percentage):
     """Format a percentage into a progress bar for display"""